@@ -0,0 +1,77 @@
+"""
+A benchmark of the BDEW calendar: the flat MergedBdewCalendar (returned by
+create_bdew_calendar) versus the former HolidaySum of 17 calendars.
+
+It reports the time to populate a year (averaged over the given years) and the
+memory allocated by the populated calendar (measured with tracemalloc).
+
+    python benchmarks/benchmark_calendar.py
+    python benchmarks/benchmark_calendar.py --first-year 2000 --last-year 2099
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import date
+from typing import Callable, Optional
+
+from holidays import HolidayBase, HolidaySum
+from holidays.countries.germany import Germany
+
+from bdew_datetimes.calendar import (
+    BdewDefinedHolidays,
+    _relevant_subdivisions,
+    create_bdew_calendar,
+)
+
+
+def _create_holiday_sum() -> HolidaySum:
+    """
+    the former implementation of create_bdew_calendar
+    """
+    result: HolidaySum = BdewDefinedHolidays(  # type: ignore[assignment]
+        language="de"
+    )
+    for subdivision in _relevant_subdivisions:
+        result += Germany(  # type: ignore[assignment]
+            subdiv=subdivision, observed=False, language="de"
+        )
+    return result
+
+
+def _measure(
+    name: str, create: Callable[[], HolidayBase], years: range
+) -> None:
+    tracemalloc.start()
+    calendar = create()
+    started = time.perf_counter()
+    for year in years:
+        _ = date(year, 1, 1) in calendar
+    elapsed = time.perf_counter() - started
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<18} {elapsed / len(years) * 1000:7.2f} ms/year"
+        f" {allocated / 1024:9.0f} KiB ({len(calendar)} holidays)"
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Parses the command line and runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument("--first-year", type=int, default=1990)
+    parser.add_argument("--last-year", type=int, default=2100)
+    arguments = parser.parse_args(argv)
+    years = range(arguments.first_year, arguments.last_year + 1)
+    if not years:
+        parser.error("--first-year must not be after --last-year")
+    _measure("HolidaySum", _create_holiday_sum, years)
+    _measure("MergedBdewCalendar", create_bdew_calendar, years)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+A benchmark of the scalar working day engine (add_frist and
+is_bdew_working_day), compiled with mypyc versus pure Python.
+
+By default it compiles a copy of the package into a temporary directory and
+runs the measurements once against the pure Python sources and once against
+the compiled copy (in separate interpreters). It requires mypy (which ships
+mypyc) and a C compiler.
+
+    python benchmarks/benchmark_engine.py
+    python benchmarks/benchmark_engine.py --current
+    python benchmarks/benchmark_engine.py --compile-only build/compiled
+
+--compile-only only builds the compiled copy, e.g. to run the test suite
+against it (see the tests_compiled environment in tox.ini).
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Optional
+
+_SOURCES = Path(__file__).resolve().parent.parent / "src"
+_COMPILED_MODULES = ["bdew_datetimes/ordinals.py", "bdew_datetimes/periods.py"]
+
+
+def compile_engine(target: Path) -> None:
+    """
+    Copies the package to target and compiles the engine modules there.
+    """
+    shutil.copytree(_SOURCES / "bdew_datetimes", target / "bdew_datetimes")
+    subprocess.run(
+        [sys.executable, "-m", "mypyc", *_COMPILED_MODULES],
+        cwd=target,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    shutil.rmtree(target / "build")
+
+
+def _measure(number: int) -> None:
+    """
+    Prints the time per call of the scalar functions in this interpreter.
+    """
+    # imported here, so that the package is taken from PYTHONPATH of _run
+    # pylint:disable=import-outside-toplevel
+    from datetime import date, timedelta
+
+    from bdew_datetimes.models import Period
+    from bdew_datetimes.ordinals import is_compiled
+    from bdew_datetimes.periods import add_frist, is_bdew_working_day
+
+    days = [date(2024, 1, 1) + timedelta(days=i) for i in range(366)]
+    period = Period(10, "WT")
+    for day in days:  # builds the index before measuring
+        add_frist(day, period)
+    calls = {
+        "add_frist": lambda: [add_frist(day, period) for day in days],
+        "is_bdew_working_day": lambda: [
+            is_bdew_working_day(day) for day in days
+        ],
+    }
+    for name, call in calls.items():
+        per_call = (
+            min(timeit.repeat(call, number=number, repeat=5))
+            / (number * len(days))
+            * 1e6
+        )
+        print(
+            f"{'compiled' if is_compiled() else 'pure Python':<12}"
+            f" {name:<20} {per_call:.3f} µs/call"
+        )
+
+
+def _run(python_path: Path, number: int) -> None:
+    environment = dict(os.environ, PYTHONPATH=str(python_path))
+    subprocess.run(
+        [sys.executable, __file__, "--current", "--number", str(number)],
+        env=environment,
+        check=True,
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Parses the command line and runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument(
+        "--current",
+        action="store_true",
+        help="only measure the package that is importable in this interpreter",
+    )
+    parser.add_argument("--compile-only", type=Path, metavar="DIRECTORY")
+    parser.add_argument("--number", type=int, default=200)
+    arguments = parser.parse_args(argv)
+    if arguments.compile_only:
+        compile_engine(arguments.compile_only)
+    elif arguments.current:
+        _measure(arguments.number)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            compile_engine(Path(directory))
+            _run(_SOURCES, arguments.number)
+            _run(Path(directory), arguments.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+A local load test for the BDEW HTTP service (bdew_datetimes.server).
+
+It starts a server in-process (or targets a running one via --url), fires
+requests from several client threads and reports the throughput and the
+latency percentiles per request.
+
+    python benchmarks/load_test_server.py --requests 5000 --clients 8
+    python benchmarks/load_test_server.py --batch-size 500
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from datetime import date, timedelta
+from typing import Optional
+from urllib.request import Request, urlopen
+
+from bdew_datetimes.server import BdewHTTPServer
+
+
+def _payload(index: int) -> dict[str, object]:
+    start = date(2020, 1, 1) + timedelta(days=index % 3650)
+    return {"start": start.isoformat(), "number_of_days": index % 30}
+
+
+def _request(url: str, batch_size: int, offset: int) -> Request:
+    if batch_size > 1:
+        url = f"{url}/add_frist/batch"
+        body: object = [_payload(offset + i) for i in range(batch_size)]
+    else:
+        url = f"{url}/add_frist"
+        body = _payload(offset)
+    return Request(
+        url,
+        data=json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def _client(
+    url: str,
+    number_of_requests: int,
+    batch_size: int,
+    offset: int,
+    latencies: list[float],
+) -> None:
+    for i in range(number_of_requests):
+        request = _request(url, batch_size, offset + i * batch_size)
+        started = time.perf_counter()
+        with urlopen(request) as response:
+            response.read()
+        latencies.append(time.perf_counter() - started)
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    index = round(percent / 100 * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+def run(
+    url: str, number_of_requests: int, clients: int, batch_size: int
+) -> None:
+    """
+    Runs the load test against url and prints the results.
+    """
+    if number_of_requests < clients:
+        raise ValueError("There must be at least one request per client")
+    latencies: list[float] = []
+    threads = []
+    offset = 0
+    for i in range(clients):
+        # the first clients send one request more if the division has a remainder
+        client_requests = number_of_requests // clients + (
+            i < number_of_requests % clients
+        )
+        threads.append(
+            threading.Thread(
+                target=_client,
+                args=(url, client_requests, batch_size, offset, latencies),
+            )
+        )
+        offset += client_requests * batch_size
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    evaluations = len(latencies) * batch_size
+    print(f"requests:     {len(latencies)} ({clients} clients)")
+    print(f"evaluations:  {evaluations} (batch size {batch_size})")
+    print(f"throughput:   {len(latencies) / elapsed:.0f} requests/s")
+    print(f"              {evaluations / elapsed:.0f} evaluations/s")
+    print(f"mean latency: {statistics.mean(latencies) * 1000:.2f} ms")
+    for percent in (50, 90, 99):
+        value = _percentile(latencies, percent) * 1000
+        print(f"p{percent} latency:  {value:.2f} ms")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Parses the command line and runs the load test.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument("--url", help="target a running server instead")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=1)
+    arguments = parser.parse_args(argv)
+    if arguments.requests < arguments.clients:
+        parser.error("--requests must not be smaller than --clients")
+    if arguments.url:
+        run(
+            arguments.url,
+            arguments.requests,
+            arguments.clients,
+            arguments.batch_size,
+        )
+        return
+    with BdewHTTPServer(
+        ("127.0.0.1", 0), warm_up_years=range(2019, 2031), quiet=True
+    ) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        run(
+            f"http://127.0.0.1:{server.server_address[1]}",
+            arguments.requests,
+            arguments.clients,
+            arguments.batch_size,
+        )
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
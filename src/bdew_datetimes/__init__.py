@@ -1,18 +1,78 @@
 """
 bdew_datetimes is a package that models the BDEW holiday, which is relevant for German utilities
+
+The functions that depend on the holiday calendar (and thereby on the holidays
+package) are imported lazily on their first access, so that e.g. users of
+`german_strom_and_gas_tag` only import what they use.
 """
 
-from .calendar import BdewDefinedHolidays, create_bdew_calendar
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .german_time_zone import GERMAN_TIME_ZONE
 from .models import Period
-from .periods import (
-    add_frist,
-    get_next_working_day,
-    get_nth_working_day_of_month,
-    get_previous_working_day,
-    is_bdew_working_day,
-)
-from .utils import get_all_bdew_non_working_days, get_all_bdew_working_days
+
+if TYPE_CHECKING:
+    from .calendar import BdewDefinedHolidays, create_bdew_calendar
+    from .ordinals import get_calendar_version, register_bdew_special_day
+    from .periods import (
+        add_frist,
+        get_next_working_day,
+        get_nth_working_day_of_month,
+        get_previous_working_day,
+        is_bdew_working_day,
+        roll_to_working_day,
+        roll_to_working_days,
+        solve_frist_start,
+        solve_frist_starts,
+        working_day_deltas,
+        working_day_number_in_month,
+        working_day_numbers_in_month,
+    )
+    from .utils import (
+        get_all_bdew_non_working_days,
+        get_all_bdew_working_days,
+        iter_bdew_working_days,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "create_bdew_calendar": "calendar",
+    "BdewDefinedHolidays": "calendar",
+    "get_calendar_version": "ordinals",
+    "register_bdew_special_day": "ordinals",
+    "add_frist": "periods",
+    "get_next_working_day": "periods",
+    "get_nth_working_day_of_month": "periods",
+    "get_previous_working_day": "periods",
+    "is_bdew_working_day": "periods",
+    "roll_to_working_day": "periods",
+    "roll_to_working_days": "periods",
+    "solve_frist_start": "periods",
+    "solve_frist_starts": "periods",
+    "working_day_deltas": "periods",
+    "working_day_number_in_month": "periods",
+    "working_day_numbers_in_month": "periods",
+    "get_all_bdew_non_working_days": "utils",
+    "get_all_bdew_working_days": "utils",
+    "iter_bdew_working_days": "utils",
+}
+"""
+maps the lazily imported names to the submodule that defines them
+"""
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later accesses don't call __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "create_bdew_calendar",
@@ -23,7 +83,17 @@ __all__ = [
     "get_previous_working_day",
     "add_frist",
     "get_nth_working_day_of_month",
+    "roll_to_working_day",
+    "roll_to_working_days",
+    "solve_frist_start",
+    "solve_frist_starts",
+    "working_day_number_in_month",
+    "working_day_numbers_in_month",
+    "working_day_deltas",
     "get_all_bdew_working_days",
     "get_all_bdew_non_working_days",
+    "iter_bdew_working_days",
     "GERMAN_TIME_ZONE",
+    "get_calendar_version",
+    "register_bdew_special_day",
 ]
@@ -4,12 +4,22 @@ contains the business logic (namely the BDEW calendar information)
 """
 
 from datetime import date
-from typing import Any
+from hashlib import sha256
+from typing import Any, Iterable
 
-from holidays import HolidayBase, HolidaySum
+from holidays import HolidayBase
+from holidays import __version__ as holidays_version  # type: ignore[attr-defined]
 from holidays.constants import DEC, JUN  # type: ignore[attr-defined]
 from holidays.countries.germany import Germany
 
+_bdew_special_holidays: dict[date, str] = {
+    date(2025, JUN, 6): "Sonderfeiertag",
+    # Anlässlich der (verschobenen) Einführung des 24h Lieferantenwechsels
+}
+"""
+single days without Marktkommunikation that are defined by the BDEW
+"""
+
 
 class BdewDefinedHolidays(HolidayBase):
     """
@@ -28,11 +38,9 @@ class BdewDefinedHolidays(HolidayBase):
     def _populate(self, year: int) -> None:
         self[date(year, DEC, 24)] = "Heiligabend"
         self[date(year, DEC, 31)] = "Silvester"
-        if year == 2025:
-            self[date(2025, JUN, 6)] = (
-                "Sonderfeiertag"
-                # Anlässlich der (verschobenen) Einführung des 24h Lieferantenwechsels
-            )
+        for day, name in _bdew_special_holidays.items():
+            if day.year == year:
+                self[day] = name
 
 
 _relevant_subdivisions: list[str] = [
@@ -58,7 +66,85 @@ _relevant_subdivisions: list[str] = [
 ]
 
 
-def create_bdew_calendar() -> HolidaySum:
+class MergedBdewCalendar(HolidayBase):
+    """
+    All days considered by the BDEW in a single flat calendar: the union of
+    the `BdewDefinedHolidays` and the holidays of all German states.
+
+    In contrast to a `holidays.HolidaySum` of these 17 calendars, the sources
+    don't keep their own holidays: populating a year fills the sources for
+    this year only, merges them into this calendar and empties them again.
+    The names of holidays that fall on the same day are joined (as in a
+    HolidaySum) and `get_sources` tells from which sources a holiday stems.
+    """
+
+    country = "DE"
+
+    def __init__(self, language: str = "de", **kwargs: Any) -> None:
+        self._sources: dict[str, HolidayBase] = {
+            BDEW_SOURCE: BdewDefinedHolidays(language=language)
+        }
+        for subdivision in _relevant_subdivisions:
+            self._sources[subdivision] = Germany(
+                subdiv=subdivision, observed=False, language=language
+            )
+        self._provenance: dict[date, tuple[str, ...]] = {}
+        super().__init__(observed=False, language=language, **kwargs)
+
+    def _populate(self, year: int) -> None:
+        for source_name, source in self._sources.items():
+            source._populate(year)  # pylint:disable=protected-access
+            for day, name in source.items():
+                self[day] = name
+                self._provenance[day] = self._provenance.get(day, ()) + (
+                    source_name,
+                )
+            # the holidays of the source are not needed anymore
+            source.clear()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # the sources are created and populated again on demand; only the
+        # holidays that have been added directly (e.g. special days
+        # registered at runtime) are pickled
+        added_holidays = [
+            (day, name)
+            for day, name in self.items()
+            if day not in self._provenance
+        ]
+        return _restore_merged_calendar, (self.language, added_holidays)
+
+    def get_sources(self, day: date) -> tuple[str, ...]:
+        """
+        Returns the sources of the holiday on the given day: `BDEW_SOURCE`
+        for the BDEW specific holidays and the codes of the German states
+        (e.g. "BY") in which the day is a holiday. The tuple is empty for days
+        that aren't a holiday (or that have been added directly).
+        """
+        _ = day in self  # populates the year if necessary
+        return self._provenance.get(day, ())
+
+
+def _restore_merged_calendar(
+    language: str, added_holidays: list[tuple[date, str]]
+) -> MergedBdewCalendar:
+    """
+    Recreates a pickled `MergedBdewCalendar`.
+    """
+    calendar = MergedBdewCalendar(language=language)
+    for day, name in added_holidays:
+        # bypasses the population of the year (which merges the sources into
+        # the calendar on the first lookup)
+        dict.__setitem__(calendar, day, name)
+    return calendar
+
+
+BDEW_SOURCE = "BDEW"
+"""
+the source of the BDEW specific holidays, see `MergedBdewCalendar.get_sources`
+"""
+
+
+def create_bdew_calendar() -> MergedBdewCalendar:
     """Creates a calendar containing all days considered by the BDEW.
 
     Currently, in Germany there are no observed holidays e.g. a Holiday is
@@ -72,35 +158,59 @@ def create_bdew_calendar() -> HolidaySum:
 
     [Accessed 2022-11-02]``
 
+    If a day is holiday in any subdivision, the holiday is valid nationwide.
+    Therefore, the calendar contains the holidays of all subdivisions of
+    Germany. Currently, in Germany holidays are not observed.
+
     Returns
     -------
-    holidays.HolidaySum
-        dict-like holiday calendar, to check if a date/datetime is a holiday
+    MergedBdewCalendar
+        dict-like holiday calendar (a `holidays.HolidayBase`), to check if a
+        date/datetime is a holiday
+    """
+    return MergedBdewCalendar(language="de")
+
+
+def get_holiday_data_version(
+    extra_holidays: Iterable[tuple[date, str]] = (),
+) -> str:
     """
+    Returns a hash of all sources of the holiday data: the version of the
+    holidays package, the BDEW specific special days and the given extra
+    holidays (e.g. those registered at runtime).
+    It's cheap to compute and changes whenever one of the sources changes.
+    """
+    digest = sha256(f"holidays=={holidays_version}".encode())
+    for day, name in sorted(_bdew_special_holidays.items()):
+        digest.update(f"bdew:{day.isoformat()}={name}".encode())
+    for day, name in sorted(extra_holidays):
+        digest.update(f"extra:{day.isoformat()}={name}".encode())
+    return digest.hexdigest()
+
 
-    # First we need the BDEW specific holidays.
-    calendar = BdewDefinedHolidays(language="de")
-
-    # the type is wrong at assignment but correct after the first loop iteration
-    result: HolidaySum = calendar  # type: ignore[assignment]
-    original_language_before_adding_subdivisions = result.language
-    # If a day is holiday in any subdivision, the holiday is valid nationwide.
-    # Therefore, we add all subdivisions of Germany to the BDEW specific holidays.
-    # Currently, in Germany holidays are not observed.
-    for subdivision in _relevant_subdivisions:
-        # the method __add__ expects a Union[int, "HolidayBase", "HolidaySum"] as `other`
-        # here, we're dealing with a child instance of HolidayBase
-        result += Germany(
-            subdiv=subdivision, observed=False, language="de"
-        )  # type: ignore[assignment]
-    if result.language is None:
-        # This is a workaround to a problem in holidays 0.20-0.53 (at least):
-        # When adding the subdivisions, the language attribute is lost,
-        # although holiday base and subdivision share the same language.
-        # The problem happens here:
-        # https://github.com/vacanza/python-holidays/blob/v0.53/holidays/holiday_base.py#L1164
-        result.language = original_language_before_adding_subdivisions
-    return result
-
-
-__all__ = ["BdewDefinedHolidays", "create_bdew_calendar"]
+def calendar_fingerprint(calendar: HolidayBase, years: Iterable[int]) -> str:
+    """
+    Returns a hash of the version of the holidays package and all holidays
+    (dates and names) of the calendar in the given years.
+    In contrast to `get_holiday_data_version` this reflects the actual
+    content of the calendar but requires it to be populated for all years.
+    """
+    selected_years = set(years)
+    for year in selected_years:
+        # populates the year if the calendar isn't populated yet
+        _ = date(year, 1, 1) in calendar
+    digest = sha256(f"holidays=={holidays_version}".encode())
+    for day, name in sorted(calendar.items()):
+        if day.year in selected_years:
+            digest.update(f"{day.isoformat()}={name}".encode())
+    return digest.hexdigest()
+
+
+__all__ = [
+    "BDEW_SOURCE",
+    "BdewDefinedHolidays",
+    "MergedBdewCalendar",
+    "calendar_fingerprint",
+    "create_bdew_calendar",
+    "get_holiday_data_version",
+]
@@ -0,0 +1,181 @@
+"""
+Precomputed tables of regulatory key dates ("Fristen") per month.
+
+Market processes like GPKE, GeLi Gas or MaBiS define their key dates as the
+nth working day of the Liefermonat or Fristenmonat. A `DeadlineTable`
+materializes these dates for a range of years and a declarative list of
+`DeadlineRule`s in one pass over the working day index: it stores one column
+of ordinals per rule and answers lookups by month in O(1).
+Tables are cached by the version of the calendar (see `get_calendar_version`),
+so that they're rebuilt after special days have been registered.
+"""
+
+import re
+import threading
+from array import array
+from datetime import date
+from typing import Iterable, NamedTuple, Sequence
+
+from bdew_datetimes.enums import MonthType
+from bdew_datetimes.ordinals import get_calendar_version
+from bdew_datetimes.periods import _nth_working_day_of_month_ordinal
+
+
+class DeadlineRule(NamedTuple):
+    """
+    A key date defined as the nth working day of a month, see
+    `get_nth_working_day_of_month`.
+    """
+
+    number: int
+    """
+    the number of the working day in the month (e.g. 18 for the 18th WT)
+    """
+    month_type: MonthType = MonthType.LIEFERMONAT
+    """
+    whether the month is the Liefermonat or the Fristenmonat
+    """
+
+
+_RULE_EXPRESSION = re.compile(
+    r"\s*(?:(Liefermonat|Fristenmonat)\s*)?([+-]?[0-9]+)\s*\.\s*"
+    r"(?:WT|Werktag)\s*",
+    re.IGNORECASE,
+)
+"""
+e.g. "18. WT", "Liefermonat 18. WT" or "Fristenmonat 5. Werktag"
+"""
+
+
+def parse_deadline_rule(expression: str) -> DeadlineRule:
+    """
+    Parses a key date expression: an optional month type ("Liefermonat",
+    the default, or "Fristenmonat") and the number of the working day in the
+    month, e.g. "18. WT" or "Fristenmonat 5. WT".
+    Raises a ValueError for any other expression.
+    """
+    match = _RULE_EXPRESSION.fullmatch(expression)
+    if match is None:
+        raise ValueError(
+            f"Invalid key date expression {expression!r}; expected e.g."
+            " '18. WT' or 'Fristenmonat 5. WT'"
+        )
+    month_type, number = match.groups()
+    if month_type and month_type[0] in "Ff":
+        return DeadlineRule(int(number), MonthType.FRISTENMONAT)
+    return DeadlineRule(int(number), MonthType.LIEFERMONAT)
+
+
+def _nth_working_day_ordinals(
+    rule: DeadlineRule, first_year: int, last_year: int
+) -> Sequence[int]:
+    """
+    Returns the ordinals of the key date of the rule for all months from
+    January of first_year to December of last_year.
+    """
+    return array(
+        "i",
+        (
+            _nth_working_day_of_month_ordinal(
+                rule.number, rule.month_type, year, month
+            )
+            for year in range(first_year, last_year + 1)
+            for month in range(1, 13)
+        ),
+    )
+
+
+class DeadlineTable:
+    """
+    The key dates of a list of rules for every month of a range of years.
+    Use `get_deadline_table` to get a cached table.
+    """
+
+    def __init__(
+        self, rules: Iterable[DeadlineRule], first_year: int, last_year: int
+    ) -> None:
+        if first_year > last_year:
+            raise ValueError(
+                f"The first year {first_year} is after the last year"
+                f" {last_year}"
+            )
+        self.rules = tuple(rules)
+        """
+        the rules in the order of the columns
+        """
+        self.years = range(first_year, last_year + 1)
+        """
+        the years covered by the table
+        """
+        self.version = get_calendar_version()
+        """
+        the version of the calendar from which the table has been built
+        """
+        self._columns = {
+            rule: _nth_working_day_ordinals(rule, first_year, last_year)
+            for rule in self.rules
+        }
+
+    def _position(self, year: int, month: int) -> int:
+        if year not in self.years or not 1 <= month <= 12:
+            raise KeyError(f"The table doesn't cover {year}-{month:02d}")
+        return (year - self.years.start) * 12 + month - 1
+
+    def get(self, rule: DeadlineRule, year: int, month: int) -> date:
+        """
+        Returns the key date of the rule for the given (Liefer-/Fristen-)month.
+        Raises a KeyError if the rule or the month isn't part of the table.
+        """
+        return date.fromordinal(
+            self._columns[rule][self._position(year, month)]
+        )
+
+    def get_month(self, year: int, month: int) -> dict[DeadlineRule, date]:
+        """
+        Returns the key dates of all rules for the given month.
+        """
+        position = self._position(year, month)
+        return {
+            rule: date.fromordinal(column[position])
+            for rule, column in self._columns.items()
+        }
+
+    def column(self, rule: DeadlineRule) -> list[date]:
+        """
+        Returns the key dates of the rule for all months of the table in
+        chronological order.
+        """
+        return [date.fromordinal(ordinal) for ordinal in self._columns[rule]]
+
+
+_tables: dict[tuple[str, tuple[DeadlineRule, ...], range], DeadlineTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_deadline_table(
+    rules: Iterable[DeadlineRule], first_year: int, last_year: int
+) -> DeadlineTable:
+    """
+    Returns the (cached) deadline table of the rules for the years from
+    first_year to last_year (both inclusive). Tables of an outdated calendar
+    version are discarded.
+    """
+    rules = tuple(rules)
+    version = get_calendar_version()
+    key = (version, rules, range(first_year, last_year + 1))
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is None:
+            for stale_key in [k for k in _tables if k[0] != version]:
+                del _tables[stale_key]
+            table = DeadlineTable(rules, first_year, last_year)
+            _tables[key] = table
+    return table
+
+
+__all__ = [
+    "DeadlineRule",
+    "DeadlineTable",
+    "get_deadline_table",
+    "parse_deadline_rule",
+]
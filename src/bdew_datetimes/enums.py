@@ -1,6 +1,6 @@
 """enums used inside the package"""
 
-from enum import Enum
+from enum import Enum, IntFlag
 
 
 class Division(Enum):
@@ -66,4 +66,107 @@ class MonthType(Enum):
     # source: https://www.bundesnetzagentur.de/DE/Beschlusskammern/1_GZ/BK6-GZ/_bis_2010/2006/BK6-06-009/BK6-06-009_Beschluss_download.pdf?__blob=publicationFile&v=5
 
 
-__all__ = ["Division", "EndDateType", "MonthType", "DayType"]
+class TimestampCheck(IntFlag):
+    """
+    The checks of a (message) timestamp that are evaluated in bulk by
+    `bdew_datetimes.timestamps.check_timestamps`.
+    """
+
+    NO_UTC_OFFSET = 1
+    """
+    The timestamp is midnight in UTC and its offset is exactly "+00:00",
+    see `has_no_utc_offset`.
+    """
+    STROMTAG_LIMIT = 2
+    """
+    The timestamp is the start or end of a German "Stromtag",
+    see `is_stromtag_limit`.
+    """
+    GASTAG_LIMIT = 4
+    """
+    The timestamp is the start or end of a German "Gastag",
+    see `is_gastag_limit`.
+    """
+
+
+class IntervalViolation(IntFlag):
+    """
+    The violations of a sequence of (start, end) intervals that should be
+    consecutive and aligned to Stromtage/Gastage, see
+    `bdew_datetimes.timestamps.check_intervals`. 0 means valid.
+    """
+
+    START_NOT_ALIGNED = 1
+    """
+    The start isn't the start of a Stromtag/Gastag.
+    """
+    END_NOT_ALIGNED = 2
+    """
+    The end isn't the end of a Stromtag/Gastag.
+    """
+    GAP = 4
+    """
+    The interval starts after the end of the previous interval.
+    """
+    OVERLAP = 8
+    """
+    The interval starts before the end of the previous interval.
+    """
+    EMPTY = 16
+    """
+    The end isn't after the start.
+    """
+    WRONG_DAY_LENGTH = 32
+    """
+    The start is aligned and the interval lasts a whole number of 24 hours,
+    but the end isn't aligned: the interval ignores a switch of the daylight
+    saving time (a Stromtag/Gastag lasts 23 or 25 hours then).
+    """
+
+
+class AggregationPeriod(Enum):
+    """
+    The periods to which `bdew_datetimes.resampling.XtagResampler`
+    aggregates values. All of them start and end at the start of a
+    Stromtag/Gastag.
+    """
+
+    XTAG = 1  #: a single Stromtag or Gastag
+    MONTH = 2  #: all Xtage that start in a (local) calendar month
+    GASWIRTSCHAFTSJAHR = 3
+    """
+    all Xtage from October 1st to September 30th, German "Gaswirtschaftsjahr"
+    """
+
+
+class RollConvention(Enum):
+    """
+    The conventions by which `bdew_datetimes.periods.roll_to_working_day`
+    adjusts a date that is not a BDEW working day. Working days are never
+    moved.
+    """
+
+    FOLLOWING = 1  #: the next working day
+    PRECEDING = 2  #: the previous working day
+    MODIFIED_FOLLOWING = 3
+    """
+    the next working day, unless it is in the next month; then the previous
+    working day
+    """
+    MODIFIED_PRECEDING = 4
+    """
+    the previous working day, unless it is in the previous month; then the
+    next working day
+    """
+
+
+__all__ = [
+    "AggregationPeriod",
+    "Division",
+    "EndDateType",
+    "IntervalViolation",
+    "MonthType",
+    "DayType",
+    "RollConvention",
+    "TimestampCheck",
+]
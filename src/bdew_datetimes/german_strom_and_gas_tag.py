@@ -3,17 +3,10 @@ A module to evaluate datetimes and whether they are "on the edge"
 of a German "Stromtag" or "Gastag" respectively
 """
 
-from datetime import datetime, time
-from typing import Callable
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, Iterable, NamedTuple
 
-# The problem with the stdlib zoneinfo is, that the availability of timezones
-# via ZoneInfo(zone_key) depends on the OS and system on which you're running
-# it. In some cases "Europe/Berlin" might be available, but generally it's not,
-# and it's PITA to manually define timezones. So we're using pytz as a
-# datasource for timezone information.
-from pytz import utc
-
-from bdew_datetimes.enums import Division
+from bdew_datetimes.enums import Division, MonthType
 
 from .german_time_zone import GERMAN_TIME_ZONE
 
@@ -34,7 +27,7 @@ def has_no_utc_offset(date_time: datetime) -> bool:
     # the name of the function contains a negation because in German
     # market communication it often matters that the UTC offset is 0.
     original_time = date_time.time()
-    utc_time = date_time.astimezone(tz=utc).time()
+    utc_time = date_time.astimezone(tz=timezone.utc).time()
     return (
         utc_time == original_time
         and utc_time.hour == 0
@@ -96,4 +89,111 @@ def is_xtag_limit(date_time: datetime, division: Division) -> bool:
     return xtag_evaluator(date_time)
 
 
-__all__ = ["is_gastag_limit", "is_stromtag_limit"]
+_XTAG_START_HOUR: dict[Division, int] = {Division.STROM: 0, Division.GAS: 6}
+"""
+the German local hour at which a Stromtag/Gastag starts
+"""
+
+
+def get_xtag_limits(
+    date_time: datetime, division: Division
+) -> tuple[datetime, datetime]:
+    """
+    Returns the inclusive start and the exclusive end (both in UTC) of the
+    "Stromtag" or "Gastag" that contains the given (timezone aware) date_time.
+    Depending on the daylight saving time, the day is 23, 24 or 25 hours long.
+    """
+    if division not in _XTAG_START_HOUR:
+        raise NotImplementedError(
+            f"The division must either be 'Strom' or 'Gas': '{division}'"
+        )
+    start_hour = _XTAG_START_HOUR[division]
+    german_local_datetime = date_time.astimezone(GERMAN_TIME_ZONE)
+    xtag_date = german_local_datetime.date()
+    if german_local_datetime.hour < start_hour:
+        xtag_date -= timedelta(days=1)
+    limits = []
+    for day in (xtag_date, xtag_date + timedelta(days=1)):
+        # there is no DST switch at 00:00 or 06:00, so localize is unambiguous
+        local_limit = GERMAN_TIME_ZONE.localize(
+            datetime.combine(day, time(hour=start_hour))
+        )
+        limits.append(local_limit.astimezone(timezone.utc))
+    return limits[0], limits[1]
+
+
+class MonthLimits(NamedTuple):
+    """
+    The UTC limits of a sequence of (Liefer-)months, see `get_month_limits`.
+    """
+
+    starts: list[datetime]
+    """
+    the inclusive starts of the months in UTC
+    """
+    ends: list[datetime]
+    """
+    the exclusive ends of the months in UTC
+    """
+
+
+_month_starts: dict[tuple[int, int], datetime] = {}
+"""
+caches the UTC start of a month (year * 12 + month - 1) per Xtag start hour
+"""
+
+
+def _get_month_start(month_number: int, start_hour: int) -> datetime:
+    """
+    Returns the UTC start of the first Xtag of the month with the given
+    number (year * 12 + month - 1).
+    """
+    key = (month_number, start_hour)
+    month_start = _month_starts.get(key)
+    if month_start is None:
+        year, month = divmod(month_number, 12)
+        # there is no DST switch at 00:00 or 06:00, so localize is unambiguous
+        month_start = GERMAN_TIME_ZONE.localize(
+            datetime(year, month + 1, 1, start_hour)
+        ).astimezone(timezone.utc)
+        _month_starts[key] = month_start
+    return month_start
+
+
+def get_month_limits(
+    months: Iterable[date],
+    division: Division,
+    month_type: MonthType = MonthType.LIEFERMONAT,
+) -> MonthLimits:
+    """
+    Returns the UTC starts and ends of the Liefermonate of the given months,
+    i.e. of their first Stromtag/Gastag and the first one of the following
+    month. Only year and month of the dates are taken into account.
+    Like in `get_nth_working_day_of_month`, a Fristenmonat refers to the
+    Liefermonat after it.
+
+    The limits are cached per month, so that e.g. the months of millions of
+    contracts cost one dict lookup each.
+    """
+    if division not in _XTAG_START_HOUR:
+        raise NotImplementedError(
+            f"The division must either be 'Strom' or 'Gas': '{division}'"
+        )
+    start_hour = _XTAG_START_HOUR[division]
+    offset = 1 if month_type == MonthType.FRISTENMONAT else 0
+    starts = []
+    ends = []
+    for month in months:
+        month_number = month.year * 12 + month.month - 1 + offset
+        starts.append(_get_month_start(month_number, start_hour))
+        ends.append(_get_month_start(month_number + 1, start_hour))
+    return MonthLimits(starts, ends)
+
+
+__all__ = [
+    "MonthLimits",
+    "get_month_limits",
+    "get_xtag_limits",
+    "is_gastag_limit",
+    "is_stromtag_limit",
+]
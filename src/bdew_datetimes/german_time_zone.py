@@ -1,6 +1,330 @@
-"""static timezone object for Berlin/Germany"""
+"""static timezone object for Berlin/Germany
 
-from pytz import timezone
+The time zone is implemented in this module without any dependency: since
+1996 the daylight saving time starts on the last Sunday of March and ends on
+the last Sunday of October, both at 01:00 UTC (EU rules). The transitions
+before 1996 are frozen in a table (taken from the IANA time zone database).
+Neither the availability of "Europe/Berlin" on the OS (as for zoneinfo) nor
+pytz is required.
+"""
 
-GERMAN_TIME_ZONE = timezone("Europe/Berlin")
-__all__ = ["GERMAN_TIME_ZONE"]
+from bisect import bisect_right
+from datetime import datetime, timedelta, tzinfo
+from typing import NamedTuple, Optional
+
+_SECONDS_PER_DAY = 86400
+_STANDARD_OFFSET = 3600
+_SUMMER_OFFSET = 7200
+_FIRST_RULE_YEAR = 1996
+
+
+class _Transition(NamedTuple):
+    """
+    A change of the UTC offset of the German local time.
+    """
+
+    utc_seconds: int
+    """
+    the time of the transition in seconds since 0001-01-01 00:00 UTC
+    """
+    offset_before: int
+    offset_after: int
+    dst_after: int
+    name_after: str
+
+
+def _seconds(date_time: datetime) -> int:
+    """
+    Returns the (wall) time of date_time in whole seconds since 0001-01-01.
+    """
+    return (
+        date_time.toordinal() * _SECONDS_PER_DAY
+        + date_time.hour * 3600
+        + date_time.minute * 60
+        + date_time.second
+    )
+
+
+_LMT_OFFSET = 3208
+"""
+the local mean time of Berlin (+00:53:28), which was in use until 1893
+"""
+
+
+def _last_sunday(year: int, month: int) -> int:
+    """
+    Returns the day of the last Sunday of the given month (March, September
+    or October).
+    """
+    last_day = 31 if month in (3, 10) else 30
+    return last_day - (datetime(year, month, last_day).weekday() + 1) % 7
+
+
+def _historical_transitions() -> list[_Transition]:
+    # (UTC time of the transition, offset and DST in minutes, abbreviation)
+    table = [
+        ((1893, 3, 31, 23, 6, 32), 60, 0, "CET"),
+        ((1916, 4, 30, 22), 120, 60, "CEST"),
+        ((1916, 9, 30, 23), 60, 0, "CET"),
+        ((1917, 4, 16, 1), 120, 60, "CEST"),
+        ((1917, 9, 17, 1), 60, 0, "CET"),
+        ((1918, 4, 15, 1), 120, 60, "CEST"),
+        ((1918, 9, 16, 1), 60, 0, "CET"),
+        ((1940, 4, 1, 1), 120, 60, "CEST"),
+        ((1942, 11, 2, 1), 60, 0, "CET"),
+        ((1943, 3, 29, 1), 120, 60, "CEST"),
+        ((1943, 10, 4, 1), 60, 0, "CET"),
+        ((1944, 4, 3, 1), 120, 60, "CEST"),
+        ((1944, 10, 2, 1), 60, 0, "CET"),
+        ((1945, 4, 2, 1), 120, 60, "CEST"),
+        ((1945, 5, 24, 0), 180, 120, "CEMT"),
+        ((1945, 9, 24, 0), 120, 60, "CEST"),
+        ((1945, 11, 18, 1), 60, 0, "CET"),
+        ((1946, 4, 14, 1), 120, 60, "CEST"),
+        ((1946, 10, 7, 1), 60, 0, "CET"),
+        ((1947, 4, 6, 2), 120, 60, "CEST"),
+        ((1947, 5, 11, 1), 180, 120, "CEMT"),
+        ((1947, 6, 29, 0), 120, 60, "CEST"),
+        ((1947, 10, 5, 1), 60, 0, "CET"),
+        ((1948, 4, 18, 1), 120, 60, "CEST"),
+        ((1948, 10, 3, 1), 60, 0, "CET"),
+        ((1949, 4, 10, 1), 120, 60, "CEST"),
+        ((1949, 10, 2, 1), 60, 0, "CET"),
+        ((1980, 4, 6, 1), 120, 60, "CEST"),
+        ((1980, 9, 28, 1), 60, 0, "CET"),
+    ]
+    # from 1981 to 1995 the DST ended on the last Sunday of September
+    for year in range(1981, _FIRST_RULE_YEAR):
+        table.append(((year, 3, _last_sunday(year, 3), 1), 120, 60, "CEST"))
+        table.append(((year, 9, _last_sunday(year, 9), 1), 60, 0, "CET"))
+    transitions = []
+    offset_before = _LMT_OFFSET
+    for (year, month, day, *time), offset, dst, name in table:
+        transitions.append(
+            _Transition(
+                utc_seconds=datetime(year, month, day).toordinal()
+                * _SECONDS_PER_DAY
+                + sum(
+                    value * factor
+                    for value, factor in zip(time, (3600, 60, 1))
+                ),
+                offset_before=offset_before,
+                offset_after=offset * 60,
+                dst_after=dst * 60,
+                name_after=name,
+            )
+        )
+        offset_before = offset * 60
+    return transitions
+
+
+_TRANSITIONS = _historical_transitions()
+_TRANSITION_SECONDS = [transition.utc_seconds for transition in _TRANSITIONS]
+_LOCAL_TRANSITION_SECONDS = [
+    transition.utc_seconds
+    + min(transition.offset_before, transition.offset_after)
+    for transition in _TRANSITIONS
+]
+"""
+the local (wall) times at which the transitions start
+"""
+
+_rule_transitions: dict[int, tuple[int, int]] = {}
+"""
+caches the UTC seconds of the start and end of the DST per year (since 1996)
+"""
+
+
+def _dst_period(year: int) -> tuple[int, int]:
+    """
+    Returns the UTC seconds of the start and the end of the DST in the given
+    year according to the EU rules.
+    """
+    period = _rule_transitions.get(year)
+    if period is None:
+        start, end = (
+            datetime(year, month, _last_sunday(year, month)).toordinal()
+            * _SECONDS_PER_DAY
+            + 3600
+            for month in (3, 10)
+        )
+        period = (start, end)
+        _rule_transitions[year] = period
+    return period
+
+
+class _Period(NamedTuple):
+    offset: int
+    dst: int
+    name: str
+
+
+_CET = _Period(_STANDARD_OFFSET, 0, "CET")
+_CEST = _Period(_SUMMER_OFFSET, 3600, "CEST")
+_LMT = _Period(_LMT_OFFSET, 0, "LMT")
+
+
+def _period_of_transition(transition: _Transition) -> _Period:
+    return _Period(
+        transition.offset_after, transition.dst_after, transition.name_after
+    )
+
+
+def _rule_period_at_local(local: int, year: int, fold: int) -> _Period:
+    """
+    Returns the period of the wall time (in seconds since 0001-01-01) in a
+    year since 1996.
+    """
+    start, end = _dst_period(year)
+    if local < start + _STANDARD_OFFSET or local >= end + _SUMMER_OFFSET:
+        return _CET
+    if local < start + _SUMMER_OFFSET:
+        # non-existent: fold=0 uses the offset before the transition
+        return _CEST if fold else _CET
+    if local >= end + _STANDARD_OFFSET:
+        # ambiguous: fold=0 is the first (summer time) occurrence
+        return _CET if fold else _CEST
+    return _CEST
+
+
+def _period_at_local(date_time: datetime) -> _Period:
+    """
+    Returns the period of the (wall) time, see PEP 495 for the meaning of fold
+    in ambiguous or non-existent times.
+    """
+    local = _seconds(date_time)
+    if date_time.year >= _FIRST_RULE_YEAR:
+        return _rule_period_at_local(local, date_time.year, date_time.fold)
+    index = bisect_right(_LOCAL_TRANSITION_SECONDS, local) - 1
+    if index < 0:
+        return _LMT
+    transition = _TRANSITIONS[index]
+    if (
+        local
+        < transition.utc_seconds
+        + max(transition.offset_before, transition.offset_after)
+        and not date_time.fold
+    ):
+        # in the gap or overlap of the transition
+        return (
+            _period_of_transition(_TRANSITIONS[index - 1])
+            if index > 0
+            else _LMT
+        )
+    return _period_of_transition(transition)
+
+
+def _period_at_utc(utc_seconds: int, year: int) -> tuple[_Period, bool]:
+    """
+    Returns the period at the UTC time and whether the resulting local time is
+    the second occurrence of an ambiguous time (i.e. has fold=1).
+    """
+    if year >= _FIRST_RULE_YEAR:
+        start, end = _dst_period(year)
+        if start <= utc_seconds < end:
+            return _CEST, False
+        return _CET, end <= utc_seconds < end + 3600
+    index = bisect_right(_TRANSITION_SECONDS, utc_seconds) - 1
+    if index < 0:
+        return _LMT, False
+    transition = _TRANSITIONS[index]
+    fold = (
+        utc_seconds - transition.utc_seconds
+        < transition.offset_before - transition.offset_after
+    )
+    return _period_of_transition(transition), fold
+
+
+class NonExistentTimeError(ValueError):
+    """
+    Raised by `GermanTimeZone.localize` for a wall time in the gap of the
+    switch to daylight saving time (if is_dst is None).
+    """
+
+
+class AmbiguousTimeError(ValueError):
+    """
+    Raised by `GermanTimeZone.localize` for a wall time that occurs twice at
+    the end of daylight saving time (if is_dst is None).
+    """
+
+
+class GermanTimeZone(tzinfo):
+    """
+    The time zone "Europe/Berlin" as a `datetime.tzinfo` (PEP 495 compliant).
+    Looking up an offset takes constant time. For compatibility with the
+    former pytz based implementation, it provides `localize` and `normalize`.
+    """
+
+    zone = "Europe/Berlin"
+
+    def utcoffset(self, dt: Optional[datetime]) -> Optional[timedelta]:
+        if dt is None:
+            return None
+        return timedelta(seconds=_period_at_local(dt).offset)
+
+    def dst(self, dt: Optional[datetime]) -> Optional[timedelta]:
+        if dt is None:
+            return None
+        return timedelta(seconds=_period_at_local(dt).dst)
+
+    def tzname(self, dt: Optional[datetime]) -> Optional[str]:
+        if dt is None:
+            return None
+        return _period_at_local(dt).name
+
+    def fromutc(self, dt: datetime) -> datetime:
+        if dt.tzinfo is not self:
+            raise ValueError("fromutc: dt.tzinfo is not self")
+        period, fold = _period_at_utc(_seconds(dt), dt.year)
+        return (dt + timedelta(seconds=period.offset)).replace(fold=fold)
+
+    def localize(
+        self, dt: datetime, is_dst: Optional[bool] = False
+    ) -> datetime:
+        """
+        Attaches the time zone to the naive (wall time) datetime. is_dst
+        selects the offset of ambiguous and non-existent times; if it's None,
+        an `AmbiguousTimeError` or `NonExistentTimeError` is raised instead.
+        """
+        if dt.tzinfo is not None:
+            raise ValueError("Not naive datetime (tzinfo is already set)")
+        first = _period_at_local(dt.replace(fold=0))
+        second = _period_at_local(dt.replace(fold=1))
+        if first == second:
+            return dt.replace(tzinfo=self, fold=0)
+        if is_dst is None:
+            if first.offset > second.offset:
+                raise AmbiguousTimeError(str(dt))
+            raise NonExistentTimeError(str(dt))
+        use_second = (second.dst > first.dst) == is_dst
+        return dt.replace(tzinfo=self, fold=int(use_second))
+
+    def normalize(self, dt: datetime) -> datetime:
+        """
+        Returns the equivalent wall time of an aware datetime in this time
+        zone (e.g. after arithmetic that ended in a non-existent time).
+        """
+        utc_offset = dt.utcoffset()
+        if utc_offset is None:
+            raise ValueError("Naive time - no tzinfo set")
+        return self.fromutc((dt - utc_offset).replace(tzinfo=self))
+
+    def __repr__(self) -> str:
+        return f"<GermanTimeZone {self.zone!r}>"
+
+    def __str__(self) -> str:
+        return self.zone
+
+    def __reduce__(self) -> str:
+        # pickles (and copies) refer to the singleton
+        return "GERMAN_TIME_ZONE"
+
+
+GERMAN_TIME_ZONE = GermanTimeZone()
+__all__ = [
+    "AmbiguousTimeError",
+    "GERMAN_TIME_ZONE",
+    "GermanTimeZone",
+    "NonExistentTimeError",
+]
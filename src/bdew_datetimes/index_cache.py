@@ -0,0 +1,128 @@
+"""
+A persistent on-disk cache of the working day index, which is shared by all
+processes on a host (e.g. the workers of a gunicorn or celery pre-fork setup).
+
+The first process builds the index for the requested years and writes it
+atomically to the cache file; it holds an exclusive lock on a lock file next to
+the cache file meanwhile, so that processes starting at the same time wait for
+it instead of building the index as well. All processes then map the file
+read-only via
+mmap, so they share the same physical memory pages and neither populate the
+holiday calendar nor build the index themselves. The version of the holiday
+data is stored in the file header; a file that has been created from other
+holiday data (e.g. another version of the holidays package or other special
+days) is rebuilt automatically.
+"""
+
+import mmap
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from bdew_datetimes.ordinals import WorkingDayIndex, get_working_day_index
+
+if sys.platform == "win32":
+    import msvcrt  # pylint:disable=import-error
+else:
+    import fcntl
+
+
+def _map_into_index(path: Path, index: WorkingDayIndex, years: range) -> None:
+    """
+    Maps the file read-only and installs its blocks into the index.
+    Raises a ValueError if the file is invalid, stale or too small.
+    """
+    with open(path, "rb") as file:
+        # the mapping stays valid after the file has been closed
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        index.load_buffer(mapped, years=years)
+    except BaseException:
+        # a file that is still mapped can't be replaced on Windows
+        mapped.close()
+        raise
+
+
+@contextmanager
+def _exclusive_lock(path: Path) -> Iterator[None]:
+    """
+    Holds an exclusive lock on the file at path (which is created if
+    necessary) across processes. The lock is released by the operating system
+    if the process dies, so a stale lock file never blocks other processes.
+    """
+    with open(path, "a+b") as lock_file:
+        if sys.platform == "win32":
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if sys.platform == "win32":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    """
+    Writes the content to a temporary file next to path and renames it, so
+    that other processes either see the old file or the complete new file.
+    """
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def load_index_cache(
+    path: Union[str, os.PathLike[str]],
+    first_year: int,
+    last_year: int,
+    index: Optional[WorkingDayIndex] = None,
+) -> bool:
+    """
+    Loads the working day index for the years from first_year to last_year
+    (both inclusive) from the cache file at path. If the file doesn't exist,
+    is invalid, doesn't cover the years or has been created from other holiday
+    data, the index is built and the file is (re-)written first.
+    By default, the index shared by all functions of this package is used.
+
+    Returns true if and only if the cache file has been (re-)built by this
+    call.
+    """
+    if index is None:
+        index = get_working_day_index()
+    cache_path = Path(path)
+    years = range(first_year, last_year + 1)
+    try:
+        _map_into_index(cache_path, index, years)
+        return False
+    except (FileNotFoundError, ValueError):
+        # ValueError: mmap of an empty file or an invalid/stale content
+        pass
+    with _exclusive_lock(cache_path.with_name(f"{cache_path.name}.lock")):
+        # another process may have built the file while we were waiting
+        try:
+            _map_into_index(cache_path, index, years)
+            return False
+        except (FileNotFoundError, ValueError):
+            pass
+        _write_atomically(cache_path, index.to_bytes(first_year, last_year))
+        _map_into_index(cache_path, index, years)
+    return True
+
+
+__all__ = ["load_index_cache"]
@@ -1,7 +1,9 @@
 """model classes used in this package"""
 
+import re
 from dataclasses import dataclass
-from typing import Literal, Union
+from functools import lru_cache
+from typing import Iterable, Literal, Union
 
 from bdew_datetimes.enums import DayType, EndDateType
 
@@ -53,5 +55,79 @@ class Period:
             )
         self.day_type: DayType = day_type
 
+    @property
+    def key(self) -> tuple[int, DayType]:
+        """
+        A hashable canonical form of the period. Periods that yield the same
+        results (e.g. 3 inclusive and 2 exclusive working days) have equal keys.
+        """
+        return self.number_of_days, self.day_type
+
+
+_PERIOD_EXPRESSION = re.compile(
+    r"\s*([+-]?)\s*([0-9]+)\s*(WT|KT|Werktage?|Kalendertage?)"
+    r"\s*(inkl\.?|inklusive|exkl\.?|exklusive)?\s*",
+    re.IGNORECASE,
+)
+"""
+e.g. "10WT", "-3 KT", "1WT inkl." or "5 Werktage exklusive"
+"""
+
+_interned_periods: dict[tuple[int, DayType], Period] = {}
+"""
+the canonical period per key, see `Period.key`
+"""
+
+
+@lru_cache(maxsize=1024)
+def _parse_period(expression: str) -> Period:
+    match = _PERIOD_EXPRESSION.fullmatch(expression)
+    if match is None:
+        raise ValueError(
+            f"Invalid period expression {expression!r}; expected e.g."
+            " '10WT', '-3 KT' or '1WT inkl.'"
+        )
+    sign, digits, day_type, end_date_type = match.groups()
+    period = Period(
+        -int(digits) if sign == "-" else int(digits),
+        (DayType.WORKING_DAY if day_type[0] in "Ww" else DayType.CALENDAR_DAY),
+        (
+            EndDateType.INCLUSIVE
+            if end_date_type and end_date_type[0] in "Ii"
+            else EndDateType.EXCLUSIVE
+        ),
+    )
+    return _interned_periods.setdefault(period.key, period)
+
+
+def parse_period(expression: str) -> Period:
+    """
+    Parses a period expression as used in the AHB and in configurations:
+    a (signed) number of days, the day type ("WT"/"Werktag(e)" or
+    "KT"/"Kalendertag(e)", case-insensitive) and an optional "inkl." or
+    "exkl." (the default), e.g. "10WT", "-3 KT" or "1WT inkl.".
+    Raises a ValueError for any other expression.
+
+    The results are memoized by expression and interned by `Period.key`, so
+    that equivalent expressions (like "3WT inkl." and "2WT") return the same
+    object. Don't modify the returned periods.
+    """
+    return _parse_period(expression)
+
+
+def parse_periods(expressions: Iterable[str]) -> list[Period]:
+    """
+    Returns `parse_period` for each of the expressions (e.g. a column of a
+    table) in the same order. The ValueError of an invalid expression names
+    its position.
+    """
+    result = []
+    for position, expression in enumerate(expressions):
+        try:
+            result.append(_parse_period(expression))
+        except ValueError as error:
+            raise ValueError(f"Row {position}: {error}") from error
+    return result
+
 
-__all__ = ["Period"]
+__all__ = ["Period", "parse_period", "parse_periods"]
@@ -0,0 +1,665 @@
+"""
+Low-level working day arithmetic on proleptic Gregorian ordinals
+(the integers returned by `date.toordinal()`).
+
+The functions in this module don't create any date objects. They're backed by
+flat tables that store one flag per day and the cumulative number of working
+days ("ranks") per year. The table of a year is built on its first lookup.
+The date based functions in `periods` are thin wrappers around this module
+that convert at the edges only.
+"""
+
+import struct
+import threading
+import zlib
+from array import array
+from datetime import MAXYEAR, MINYEAR, date
+from hashlib import sha256
+from itertools import accumulate, compress, islice
+from typing import Any, Iterator, NamedTuple, Optional, Sequence
+
+from holidays import SAT, SUN, HolidayBase  # type: ignore[attr-defined]
+
+from bdew_datetimes.calendar import (
+    calendar_fingerprint,
+    create_bdew_calendar,
+    get_holiday_data_version,
+)
+
+
+class _YearBlock(NamedTuple):
+    """
+    The (immutable) lookup tables of a single year.
+    """
+
+    first_ordinal: int
+    """
+    the ordinal of January 1st
+    """
+    flags: Sequence[int]
+    """
+    flags[i] is 1 if and only if first_ordinal + i is a working day
+    """
+    ranks: Sequence[int]
+    """
+    ranks[i] is the number of working days in [first_ordinal, first_ordinal + i)
+    """
+    working: Sequence[int]
+    """
+    the ordinals of all working days of the year in ascending order
+    """
+
+
+_BUFFER_HEADER = struct.Struct("=8sIIii64s")
+"""
+magic, format version, byte order marker, first year, last year and version
+of the holiday data in native byte order; the size (88 bytes) keeps the
+following arrays aligned
+"""
+_BUFFER_MAGIC = b"BDEWWTIX"
+_BUFFER_FORMAT_VERSION = 1
+_BYTE_ORDER_MARKER = 0x01020304
+
+
+def _describe_calendar(calendar: HolidayBase) -> str:
+    """
+    Describes the kind of the calendar (its classes, subdivisions and
+    categories), so that indexes of different calendars get different
+    versions. The content of a calendar of a given kind is covered by
+    `get_holiday_data_version`.
+    """
+    parts = getattr(calendar, "holidays", [calendar])
+    return ";".join(
+        f"{type(part).__module__}.{type(part).__qualname__}"
+        f"(subdiv={part.subdiv}, observed={part.observed},"
+        f" categories={sorted(part.categories)})"
+        for part in parts
+    )
+
+
+def first_ordinal_of_year(year: int) -> int:
+    """
+    Returns the ordinal of January 1st of the given year.
+    """
+    previous_year = year - 1
+    return (
+        previous_year * 365
+        + previous_year // 4
+        - previous_year // 100
+        + previous_year // 400
+        + 1
+    )
+
+
+def year_of_ordinal(ordinal: int) -> int:
+    """
+    Returns the year of the given ordinal (without creating a date).
+    """
+    # 146097 days are 400 (gregorian) years; the estimate is off by at most one
+    year = (ordinal * 400) // 146097 + 1
+    if first_ordinal_of_year(year) > ordinal:
+        return year - 1
+    if first_ordinal_of_year(year + 1) <= ordinal:
+        return year + 1
+    return year
+
+
+class _BufferLayout(NamedTuple):
+    """
+    The validated header of a buffer created by `WorkingDayIndex.to_bytes`.
+    """
+
+    years: range
+    version: str
+    counts: tuple[int, ...]
+    """
+    the number of working days per year
+    """
+
+
+def _read_buffer_layout(buffer: Any) -> _BufferLayout:
+    """
+    Reads and validates the header of the buffer and checks that the buffer
+    has exactly the size implied by the header, so that slicing it afterwards
+    can't fail. Raises a ValueError otherwise.
+    """
+    with memoryview(buffer) as view:
+        size = view.nbytes
+    if size < _BUFFER_HEADER.size:
+        raise ValueError("The buffer is too short")
+    magic, format_version, marker, first_year, last_year, version = (
+        _BUFFER_HEADER.unpack_from(buffer)
+    )
+    if (magic, format_version) != (_BUFFER_MAGIC, _BUFFER_FORMAT_VERSION):
+        raise ValueError("The buffer has an unknown format")
+    if marker != _BYTE_ORDER_MARKER:
+        raise ValueError("The buffer has been created on another platform")
+    if not MINYEAR <= first_year <= last_year <= MAXYEAR:
+        raise ValueError("The buffer has an invalid range of years")
+    years = range(first_year, last_year + 1)
+    if size < _BUFFER_HEADER.size + 4 * len(years):
+        raise ValueError("The buffer is too short")
+    counts = struct.unpack_from(f"={len(years)}i", buffer, _BUFFER_HEADER.size)
+    number_of_days = first_ordinal_of_year(last_year + 1) - (
+        first_ordinal_of_year(first_year)
+    )
+    if any(not 0 <= count <= 366 for count in counts) or size != (
+        _BUFFER_HEADER.size
+        + 4 * len(years)
+        + number_of_days
+        + (-number_of_days % 4)
+        + 4 * (number_of_days + len(years))
+        + 4 * sum(counts)
+    ):
+        raise ValueError("The buffer has an unexpected size")
+    return _BufferLayout(
+        years=years, version=version.decode("ascii"), counts=counts
+    )
+
+
+def _slice_blocks(
+    view: memoryview, layout: _BufferLayout
+) -> dict[int, _YearBlock]:
+    """
+    Returns the blocks of all years of the (validated) layout as views on the
+    buffer.
+    """
+    first_ordinals = [first_ordinal_of_year(year) for year in layout.years]
+    first_ordinals.append(first_ordinal_of_year(layout.years.stop))
+    number_of_days = first_ordinals[-1] - first_ordinals[0]
+    flags_offset = _BUFFER_HEADER.size + 4 * len(layout.years)
+    ranks_offset = flags_offset + number_of_days + (-number_of_days % 4)
+    working_offset = ranks_offset + 4 * (number_of_days + len(layout.years))
+    blocks = {}
+    for i, year in enumerate(layout.years):
+        days = first_ordinals[i + 1] - first_ordinals[i]
+        count = layout.counts[i]
+        blocks[year] = _YearBlock(
+            first_ordinal=first_ordinals[i],
+            flags=view[flags_offset : flags_offset + days],
+            ranks=view[ranks_offset : ranks_offset + 4 * (days + 1)].cast("i"),
+            working=view[working_offset : working_offset + 4 * count].cast(
+                "i"
+            ),
+        )
+        flags_offset += days
+        ranks_offset += 4 * (days + 1)
+        working_offset += 4 * count
+    return blocks
+
+
+def _block_of_flags(first_ordinal: int, flags: bytes) -> _YearBlock:
+    """
+    Derives the ranks and working days of a year from its flags.
+    """
+    return _YearBlock(
+        first_ordinal=first_ordinal,
+        flags=flags,
+        ranks=array("i", accumulate(flags, initial=0)),
+        working=array(
+            "i",
+            compress(range(first_ordinal, first_ordinal + len(flags)), flags),
+        ),
+    )
+
+
+class WorkingDayIndex:
+    """
+    A lookup table of BDEW working days in proleptic Gregorian ordinals.
+
+    The table consists of one independent block per year, which is built
+    (thread safe) on the first lookup in that year. Lookups within a year
+    are O(1); adding n working days touches n / 250 year blocks at most.
+    """
+
+    def __init__(self, calendar: HolidayBase) -> None:
+        self.calendar = calendar
+        """
+        the holiday calendar from which the index is derived
+        """
+        self._lock = threading.RLock()
+        self._blocks: dict[int, _YearBlock] = {}
+        self._extra_holidays: dict[date, str] = {}
+        self._refreshed_years: dict[int, str] = {}
+        """
+        the fingerprints of the years that have been rebuilt by `refresh`
+        """
+        self._version = self._compute_version()
+
+    def _compute_version(self) -> str:
+        digest = sha256(
+            get_holiday_data_version(self._extra_holidays.items()).encode()
+        )
+        digest.update(_describe_calendar(self.calendar).encode())
+        for year, fingerprint in sorted(self._refreshed_years.items()):
+            digest.update(f"refreshed:{year}={fingerprint}".encode())
+        return digest.hexdigest()
+
+    @property
+    def version(self) -> str:
+        """
+        A hash of the holiday data from which the index is derived.
+        It changes whenever the holidays package, the BDEW special days, the
+        special days registered at runtime, the kind of calendar (see
+        `_describe_calendar`) or, after `refresh`, the content of the
+        refreshed years change. Anything that is derived
+        from the index (caches, tables, files) should be keyed on this version.
+        """
+        return self._version
+
+    def fingerprint(self, first_year: int, last_year: int) -> str:
+        """
+        Returns a hash of the merged holidays of the calendar from first_year to
+        last_year (both inclusive), see `calendar_fingerprint`.
+        """
+        return calendar_fingerprint(
+            self.calendar, range(first_year, last_year + 1)
+        )
+
+    def register_special_day(self, day: date, name: str) -> None:
+        """
+        Adds a special day (a non-working day) to the calendar and updates the
+        index incrementally, i.e. only the block of the respective year is
+        rebuilt. The version of the index changes.
+        """
+        with self._lock:
+            self.calendar[day] = name
+            self._extra_holidays[day] = name
+            if day.year in self._blocks:
+                self._blocks[day.year] = self._build_block(day.year)
+            self._version = self._compute_version()
+
+    def refresh(self) -> list[int]:
+        """
+        Compares all blocks with the calendar and rebuilds those that differ,
+        e.g. because the calendar has been modified directly. If any block has
+        been rebuilt, the version of the index changes.
+        Returns the rebuilt years.
+        """
+        with self._lock:
+            stale_years = []
+            for year, block in self._blocks.items():
+                rebuilt = self._build_block(year)
+                if rebuilt.flags != block.flags:
+                    self._blocks[year] = rebuilt
+                    stale_years.append(year)
+            if stale_years:
+                for year in stale_years:
+                    self._refreshed_years[year] = self.fingerprint(year, year)
+                self._version = self._compute_version()
+            return sorted(stale_years)
+
+    @property
+    def years(self) -> list[int]:
+        """
+        the (sorted) years for which the index has already been built
+        """
+        return sorted(self._blocks)
+
+    def _build_block(self, year: int) -> _YearBlock:
+        first_ordinal = first_ordinal_of_year(year)
+        end_ordinal = first_ordinal_of_year(year + 1)
+        # Any: compiled (mypyc) code would check a dict subclass with the
+        # dict fast path, which bypasses the lazy population of the calendar
+        calendar: Any = self.calendar
+        flags = bytearray(end_ordinal - first_ordinal)
+        for offset, ordinal in enumerate(range(first_ordinal, end_ordinal)):
+            # ordinal 1 (0001-01-01) is a monday (weekday 0)
+            if (ordinal - 1) % 7 in (SAT, SUN):
+                continue
+            flags[offset] = date.fromordinal(ordinal) not in calendar
+        return _block_of_flags(first_ordinal, bytes(flags))
+
+    def _block(self, year: int) -> _YearBlock:
+        """
+        Returns the block of the given year and builds it if necessary.
+        """
+        block = self._blocks.get(year)
+        if block is not None:
+            return block
+        if not MINYEAR <= year <= MAXYEAR:
+            raise OverflowError("date value out of range")
+        with self._lock:
+            block = self._blocks.get(year)
+            if block is None:
+                block = self._build_block(year)
+                self._blocks[year] = block
+        return block
+
+    def to_bytes(self, first_year: int, last_year: int) -> bytes:
+        """
+        Serializes the index for the years from first_year to last_year (both
+        inclusive) into a fixed layout: a header (including the version), the
+        number of working days per year, one flag byte per day and, per year,
+        the ranks (prefix sums) and the working day ordinals as int32 arrays.
+        """
+        self.ensure_years(first_year, last_year)
+        blocks = [
+            self._block(year) for year in range(first_year, last_year + 1)
+        ]
+        flags = b"".join(bytes(block.flags) for block in blocks)
+        parts = [
+            _BUFFER_HEADER.pack(
+                _BUFFER_MAGIC,
+                _BUFFER_FORMAT_VERSION,
+                _BYTE_ORDER_MARKER,
+                first_year,
+                last_year,
+                self.version.encode("ascii"),
+            ),
+            array("i", [len(block.working) for block in blocks]).tobytes(),
+            flags,
+            bytes(-len(flags) % 4),  # aligns the int32 arrays
+        ]
+        parts.extend(array("i", block.ranks).tobytes() for block in blocks)
+        parts.extend(array("i", block.working).tobytes() for block in blocks)
+        return b"".join(parts)
+
+    def load_buffer(self, buffer: Any, years: Optional[range] = None) -> range:
+        """
+        Installs the blocks serialized by `to_bytes` without copying them, i.e.
+        the blocks are views on the buffer (which may be a read-only mmap).
+        Raises a ValueError if the buffer is invalid, if it has been created
+        from other holiday data (see `version`) or if it doesn't cover all of
+        the given years. Returns the years loaded from the buffer.
+        """
+        layout = _read_buffer_layout(buffer)
+        if years is not None and not (
+            layout.years.start <= years.start
+            and years.stop <= layout.years.stop
+        ):
+            raise ValueError(f"The buffer doesn't cover the years {years}")
+        with self._lock:
+            if layout.version != self.version:
+                raise ValueError(
+                    "The buffer has been created from other holiday data"
+                )
+            # no view on the buffer exists before all checks have passed
+            self._blocks.update(_slice_blocks(memoryview(buffer), layout))
+        return layout.years
+
+    @classmethod
+    def from_bytes(
+        cls, buffer: Any, calendar: Optional[HolidayBase] = None
+    ) -> "WorkingDayIndex":
+        """
+        Creates an index from a buffer created by `to_bytes` (see
+        `load_buffer`). The calendar defaults to a new BDEW calendar, so
+        the buffer must not contain special days registered at runtime.
+        """
+        index = cls(create_bdew_calendar() if calendar is None else calendar)
+        index.load_buffer(buffer)
+        return index
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # only the flags of the built years are pickled (compressed); the
+        # ranks and working days are derived from them again
+        with self._lock:
+            years = self.years
+            flags = b"".join(bytes(self._blocks[year].flags) for year in years)
+            state = (
+                self.calendar,
+                dict(self._extra_holidays),
+                dict(self._refreshed_years),
+                self.version,
+                years,
+                zlib.compress(flags),
+            )
+        return _restore_working_day_index, state
+
+    def _restore(
+        self,
+        extra_holidays: dict[date, str],
+        refreshed_years: dict[int, str],
+        version: str,
+        years: list[int],
+        compressed_flags: bytes,
+    ) -> None:
+        """
+        Installs the state of a pickled index (see `__reduce__`).
+        """
+        self._extra_holidays.update(extra_holidays)
+        self._refreshed_years.update(refreshed_years)
+        self._version = self._compute_version()
+        if self._version != version:
+            raise ValueError(
+                "The pickled index has been created from other holiday data"
+            )
+        flags = zlib.decompress(compressed_flags)
+        offset = 0
+        for year in years:
+            first_ordinal = first_ordinal_of_year(year)
+            days = first_ordinal_of_year(year + 1) - first_ordinal
+            self._blocks[year] = _block_of_flags(
+                first_ordinal, flags[offset : offset + days]
+            )
+            offset += days
+
+    def update(self, other: "WorkingDayIndex") -> list[int]:
+        """
+        Installs all blocks of the other index (e.g. an index that has been
+        unpickled in a worker process) into this index. Raises a ValueError
+        if the other index has been created from other holiday data (see
+        `version`). Returns the installed years.
+        """
+        with self._lock:
+            if other.version != self.version:
+                raise ValueError(
+                    "The index has been created from other holiday data"
+                )
+            years = other.years
+            for year in years:
+                # pylint:disable-next=protected-access
+                self._blocks[year] = other._block(year)
+        return years
+
+    def ensure_years(self, first_year: int, last_year: int) -> None:
+        """
+        Builds the blocks of all years from first_year to last_year (both inclusive).
+        """
+        for year in range(
+            max(first_year, MINYEAR), min(last_year, MAXYEAR) + 1
+        ):
+            self._block(year)
+
+    def is_working(self, ordinal: int) -> bool:
+        """
+        Returns true if and only if the ordinal is a BDEW working day.
+        """
+        block = self._block(year_of_ordinal(ordinal))
+        return block.flags[ordinal - block.first_ordinal] == 1
+
+    def add_working_days(self, ordinal: int, number_of_days: int) -> int:
+        """
+        Returns the ordinal that is number_of_days working days after (or, if
+        number_of_days is negative, before) the given ordinal. The ordinal
+        itself is never counted, regardless of whether it's a working day.
+        If number_of_days is 0, the ordinal is returned unchanged.
+        """
+        if number_of_days == 0:
+            return ordinal
+        year = year_of_ordinal(ordinal)
+        block = self._block(year)
+        offset = ordinal - block.first_ordinal
+        if number_of_days > 0:
+            position = block.ranks[offset + 1] + number_of_days - 1
+            while position >= len(block.working):
+                position -= len(block.working)
+                year += 1
+                block = self._block(year)
+        else:
+            position = block.ranks[offset] + number_of_days
+            while position < 0:
+                year -= 1
+                block = self._block(year)
+                position += len(block.working)
+        result: int = block.working[position]
+        return result
+
+    def count_working_days(self, start: int, end: int) -> int:
+        """
+        Returns the number of working days from start (inclusive) to end
+        (exclusive), or its negation if end is before start. The count is
+        taken from the ranks, i.e. it costs O(1) per year between start and
+        end.
+        """
+        if end < start:
+            return -self.count_working_days(start=end, end=start)
+        start_year = year_of_ordinal(start)
+        end_year = year_of_ordinal(end)
+        start_block = self._block(start_year)
+        end_block = self._block(end_year)
+        count: int = (
+            end_block.ranks[end - end_block.first_ordinal]
+            - start_block.ranks[start - start_block.first_ordinal]
+        )
+        for year in range(start_year, end_year):
+            count += len(self._block(year).working)
+        return count
+
+    def iter_working_days(
+        self, ordinal: int, reverse: bool = False
+    ) -> Iterator[int]:
+        """
+        Lazily yields the ordinals of all working days from ordinal (inclusive)
+        onwards, or backwards if reverse is true. The iteration jumps through
+        the per year tables, so non-working days are never visited; it stops
+        at the end (or start) of the supported date range.
+        """
+        year = year_of_ordinal(ordinal)
+        block = self._block(year)
+        offset = ordinal - block.first_ordinal
+        if not reverse:
+            yield from islice(block.working, block.ranks[offset], None)
+            while year < MAXYEAR:
+                year += 1
+                yield from self._block(year).working
+        else:
+            skipped = len(block.working) - block.ranks[offset + 1]
+            yield from islice(reversed(block.working), skipped, None)
+            while year > MINYEAR:
+                year -= 1
+                yield from reversed(self._block(year).working)
+
+
+def _restore_working_day_index(
+    calendar: HolidayBase, *state: Any
+) -> WorkingDayIndex:
+    """
+    Recreates a pickled `WorkingDayIndex`.
+    """
+    index = WorkingDayIndex(calendar)
+    # pylint:disable-next=protected-access
+    index._restore(*state)
+    return index
+
+
+def create_working_day_index() -> WorkingDayIndex:
+    """
+    Creates an (initially empty) index based on a new BDEW calendar.
+    """
+    return WorkingDayIndex(create_bdew_calendar())
+
+
+_working_day_index = create_working_day_index()
+"""
+the index that is shared by all functions of this package
+"""
+
+
+def get_working_day_index() -> WorkingDayIndex:
+    """
+    Returns the working day index that is shared by all functions of this package.
+    """
+    return _working_day_index
+
+
+def register_bdew_special_day(day: date, name: str = "Sonderfeiertag") -> None:
+    """
+    Registers an additional BDEW special day (a day without Marktkommunikation)
+    at runtime. It's added to the calendar and the index that are shared by all
+    functions of this package; calendars created by `create_bdew_calendar`
+    afterwards don't contain it.
+    """
+    _working_day_index.register_special_day(day, name)
+
+
+def update_working_day_index(index: WorkingDayIndex) -> list[int]:
+    """
+    Installs the blocks of the given index (e.g. a warmed up index that has
+    been pickled to a worker process) into the shared index, see
+    `WorkingDayIndex.update`. Returns the installed years.
+    """
+    return _working_day_index.update(index)
+
+
+def get_calendar_version() -> str:
+    """
+    Returns the version of the holiday data used by all functions of this package.
+    """
+    return _working_day_index.version
+
+
+def is_compiled() -> bool:
+    """
+    Returns true if the working day engine (this module and `periods`) runs
+    as a compiled extension module (see the mypyc build hook in
+    pyproject.toml) and false if it runs as pure Python (the fallback).
+    """
+    return not __file__.endswith(".py")
+
+
+def is_working_ordinal(ordinal: int) -> bool:
+    """
+    Returns true if and only if the given ordinal is a BDEW working day.
+    """
+    return _working_day_index.is_working(ordinal)
+
+
+def next_working_ordinal(ordinal: int) -> int:
+    """
+    Returns the ordinal of the first BDEW working day after the given ordinal.
+    """
+    return _working_day_index.add_working_days(ordinal, 1)
+
+
+def previous_working_ordinal(ordinal: int) -> int:
+    """
+    Returns the ordinal of the last BDEW working day before the given ordinal.
+    """
+    return _working_day_index.add_working_days(ordinal, -1)
+
+
+def count_working_days_ordinal(start: int, end: int) -> int:
+    """
+    Returns the number of BDEW working days from start (inclusive) to end
+    (exclusive); it's negative if end is before start.
+    """
+    return _working_day_index.count_working_days(start, end)
+
+
+def add_working_days_ordinal(ordinal: int, number_of_days: int) -> int:
+    """
+    Returns the ordinal that is number_of_days BDEW working days after
+    (or before, if number_of_days is negative) the given ordinal.
+    The given ordinal itself is never counted.
+    """
+    return _working_day_index.add_working_days(ordinal, number_of_days)
+
+
+__all__ = [
+    "WorkingDayIndex",
+    "add_working_days_ordinal",
+    "count_working_days_ordinal",
+    "create_working_day_index",
+    "first_ordinal_of_year",
+    "get_calendar_version",
+    "get_working_day_index",
+    "is_compiled",
+    "is_working_ordinal",
+    "next_working_ordinal",
+    "previous_working_ordinal",
+    "register_bdew_special_day",
+    "update_working_day_index",
+    "year_of_ordinal",
+]
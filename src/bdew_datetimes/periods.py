@@ -5,24 +5,58 @@ It is based on the chapter "Fristenberechnung" in the GPKE.
 """
 
 import datetime
+from bisect import bisect_right
 from datetime import date
-from typing import Optional
+from functools import lru_cache
+from itertools import pairwise, takewhile
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Sequence,
+    cast,
+    overload,
+)
 
-from dateutil.relativedelta import relativedelta
-from holidays import SAT, SUN  # type: ignore[attr-defined]
-
-from bdew_datetimes.calendar import create_bdew_calendar
-from bdew_datetimes.enums import DayType, EndDateType, MonthType
+from bdew_datetimes.enums import (
+    DayType,
+    EndDateType,
+    MonthType,
+    RollConvention,
+)
 from bdew_datetimes.german_time_zone import GERMAN_TIME_ZONE
 from bdew_datetimes.models import Period
+from bdew_datetimes.ordinals import (
+    add_working_days_ordinal,
+    count_working_days_ordinal,
+    get_calendar_version,
+    get_working_day_index,
+    is_working_ordinal,
+    next_working_ordinal,
+    previous_working_ordinal,
+)
+
+if TYPE_CHECKING:
+    import numpy
+    from numpy.typing import NDArray
 
 # https://www.bundesnetzagentur.de/DE/Beschlusskammern/1_GZ/BK6-GZ/2020/BK6-20-160/Mitteilung_Nr_2/Leseversion_GPKE.pdf
 # pages 15 onwards
 
-_bdew_calendar = create_bdew_calendar()
-"""
-a static calendar object that is used (module) internally
-"""
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _from_ordinal(template: date, ordinal: int) -> date:
+    """
+    Converts the ordinal back to a date of the same type as template
+    (datetimes keep their time and tzinfo).
+    """
+    if isinstance(template, datetime.datetime):
+        return template + datetime.timedelta(
+            days=ordinal - template.toordinal()
+        )
+    return date.fromordinal(ordinal)
 
 
 def is_bdew_working_day(candidate: date) -> bool:
@@ -30,9 +64,7 @@ def is_bdew_working_day(candidate: date) -> bool:
     Returns true if and only if the given candidate is a day relevant for the period calculation.
     Returns false if the given candidate is either a BDEW holiday, a saturday or sunday.
     """
-    if candidate in _bdew_calendar:
-        return False
-    return candidate.weekday() not in (SAT, SUN)
+    return is_working_ordinal(candidate.toordinal())
 
 
 def get_next_working_day(start_date: date) -> date:
@@ -41,13 +73,9 @@ def get_next_working_day(start_date: date) -> date:
     If this day is a BDEW holiday or falls on a weekend, the next working day
     is returned.
     """
-    result = start_date + datetime.timedelta(
-        days=1
-    )  # in any case the calculation starts at least at the next day
-    while not is_bdew_working_day(result):
-        # if the next day is a holiday, then we add days until we find a working day
-        result += datetime.timedelta(days=1)
-    return result
+    return _from_ordinal(
+        start_date, next_working_ordinal(start_date.toordinal())
+    )
 
 
 def get_previous_working_day(start_date: date) -> date:
@@ -56,45 +84,307 @@ def get_previous_working_day(start_date: date) -> date:
     If this day is a BDEW holiday or falls on a weekend, the previous working day
     is returned.
     """
-    result = start_date - datetime.timedelta(
-        days=1
-    )  # in any case the calculation starts at least at the next day
-    while not is_bdew_working_day(result):
-        # if the previous day is a holiday, then we subtract days until we find a working day
-        result -= datetime.timedelta(days=1)
+    return _from_ordinal(
+        start_date, previous_working_ordinal(start_date.toordinal())
+    )
+
+
+_ROLL_FORWARD = {
+    RollConvention.FOLLOWING: True,
+    RollConvention.PRECEDING: False,
+    RollConvention.MODIFIED_FOLLOWING: True,
+    RollConvention.MODIFIED_PRECEDING: False,
+}
+"""
+whether a convention rolls to the next (or else to the previous) working day
+"""
+
+
+def _roll_ordinal(ordinal: int, convention: RollConvention) -> int:
+    """
+    Returns the ordinal if it's a working day, else the working day that
+    the convention selects.
+    """
+    if is_working_ordinal(ordinal):
+        return ordinal
+    if convention not in _ROLL_FORWARD:
+        raise ValueError(f"Unhandled convention {convention}")
+    forward = _ROLL_FORWARD[convention]
+    result = add_working_days_ordinal(ordinal, 1 if forward else -1)
+    modified = convention in (
+        RollConvention.MODIFIED_FOLLOWING,
+        RollConvention.MODIFIED_PRECEDING,
+    )
+    if (
+        modified
+        and date.fromordinal(result).month != date.fromordinal(ordinal).month
+    ):
+        # the modified conventions stay within the month of the given date
+        result = add_working_days_ordinal(ordinal, -1 if forward else 1)
     return result
 
 
-def add_frist(start: date, period: Period) -> date:
+def roll_to_working_day(
+    day: date, convention: RollConvention = RollConvention.FOLLOWING
+) -> date:
     """
-    Returns the date that is period after start.
+    Returns day if it's a BDEW working day. Otherwise, the working day that
+    the convention selects is returned, e.g. the next working day for
+    `RollConvention.FOLLOWING`. Unlike `get_next_working_day`, a working day
+    is never moved.
+    """
+    return _from_ordinal(day, _roll_ordinal(day.toordinal(), convention))
+
+
+def roll_to_working_days(
+    days: Iterable[date],
+    convention: RollConvention = RollConvention.FOLLOWING,
+) -> list[date]:
+    """
+    Returns `roll_to_working_day` for each of the days (in the same order).
+    """
+    return [
+        _from_ordinal(day, _roll_ordinal(day.toordinal(), convention))
+        for day in days
+    ]
+
+
+def _add_frist_ordinal(
+    start_ordinal: int, number_of_days: int, day_type: DayType
+) -> int:
+    """
+    Returns the ordinal that is the period (number_of_days, day_type) after start_ordinal.
     """
-    result: date = start
-    if period.number_of_days >= 0:
-        # the period calculation starts at the next working day, even if the number_of_days == 0
-        result = get_next_working_day(result)
-    # result is now the "Beginndatum" of the Fristenberechnung
-    if period.day_type == DayType.CALENDAR_DAY:
-        return result + datetime.timedelta(days=period.number_of_days)
+    if day_type == DayType.CALENDAR_DAY:
+        if number_of_days >= 0:
+            # the period calculation starts at the next working day, even if the number_of_days == 0
+            return next_working_ordinal(start_ordinal) + number_of_days
+        return start_ordinal + number_of_days
     # day_type is working day
-    if period.number_of_days == 0:
-        return result
-    if period.number_of_days > 0:
-        days_added = 0
-        while days_added < period.number_of_days:
-            result += datetime.timedelta(days=1)
-            if is_bdew_working_day(result):
-                # it's a usual working day; those are considered for the period calculation
-                days_added += 1
-    else:  # implicitly: elif period.number_of_days < 0:
-        days_subtracted = 0
-        while days_subtracted <= abs(period.number_of_days):
-            result -= datetime.timedelta(days=1)
-            if is_bdew_working_day(result):
-                days_subtracted += 1
+    if number_of_days >= 0:
+        # the "Beginndatum" is the next working day; from there we add number_of_days working days
+        return add_working_days_ordinal(start_ordinal, number_of_days + 1)
+    # a negative period subtracts abs(number_of_days) + 1 working days
+    return add_working_days_ordinal(start_ordinal, number_of_days - 1)
+
+
+def _add_frist_ordinal_of_version(
+    _version: str, start_ordinal: int, number_of_days: int, day_type: DayType
+) -> int:
+    # the calendar version is part of the cache key only
+    return _add_frist_ordinal(start_ordinal, number_of_days, day_type)
+
+
+def _first_ordinal_of_liefermonat(
+    month_type: MonthType, year: int, month: int
+) -> int:
+    """
+    Returns the ordinal of the first day of the Liefermonat that the given
+    Liefermonat or Fristenmonat year-month refers to.
+    """
+    if month_type == MonthType.FRISTENMONAT:
+        # the Fristenmonat is the month before the Liefermonat
+        year, month = divmod(year * 12 + month, 12)
+        month += 1
+    elif month_type != MonthType.LIEFERMONAT:
+        raise ValueError(f"Unhandled month_type {month_type}")
+    return date(year, month, 1).toordinal()
+
+
+def _nth_working_day_of_month_ordinal(
+    number_of_working_day_in_month: int,
+    month_type: MonthType,
+    year: int,
+    month: int,
+) -> int:
+    """
+    Returns the ordinal of the nth working day of the Liefermonat or
+    Fristenmonat year-month.
+    """
+    # returns the "nter Werktag des Liefermonats"
+    start_ordinal = previous_working_ordinal(
+        _first_ordinal_of_liefermonat(month_type, year, month)
+    )
+    period = Period(
+        number_of_days=number_of_working_day_in_month,
+        day_type=DayType.WORKING_DAY,
+        end_date_type=EndDateType.INCLUSIVE,
+    )
+    return _add_frist_ordinal(
+        start_ordinal, period.number_of_days, period.day_type
+    )
+
+
+def _nth_working_day_of_month_ordinal_of_version(
+    _version: str,
+    number_of_working_day_in_month: int,
+    month_type: MonthType,
+    year: int,
+    month: int,
+) -> int:
+    # the calendar version is part of the cache key only
+    return _nth_working_day_of_month_ordinal(
+        number_of_working_day_in_month, month_type, year, month
+    )
+
+
+DEFAULT_CACHE_SIZE = 4096
+"""
+the default maximum number of results of each cached function
+"""
+
+_cached_add_frist_ordinal = lru_cache(maxsize=DEFAULT_CACHE_SIZE)(
+    _add_frist_ordinal_of_version
+)
+_cached_nth_working_day_of_month_ordinal = lru_cache(
+    maxsize=DEFAULT_CACHE_SIZE
+)(_nth_working_day_of_month_ordinal_of_version)
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a result cache, see `get_cache_info`.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    """
+    the maximum number of cached results (0 if the cache is disabled)
+    """
+    currsize: int
+    """
+    the current number of cached results
+    """
+
+
+def set_cache_size(maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+    """
+    Sets the maximum number of results that `add_frist` and
+    `get_nth_working_day_of_month` cache each (least recently used results
+    are evicted first); 0 disables the caches. The caches are cleared.
+    """
+    # pylint:disable=global-statement
+    global _cached_add_frist_ordinal, _cached_nth_working_day_of_month_ordinal
+    if maxsize < 0:
+        raise ValueError(f"The cache size must not be negative: {maxsize}")
+    _cached_add_frist_ordinal = lru_cache(maxsize=maxsize)(
+        _add_frist_ordinal_of_version
+    )
+    _cached_nth_working_day_of_month_ordinal = lru_cache(maxsize=maxsize)(
+        _nth_working_day_of_month_ordinal_of_version
+    )
+
+
+def get_cache_info() -> dict[str, CacheInfo]:
+    """
+    Returns the statistics of the result caches of `add_frist` and
+    `get_nth_working_day_of_month` (keyed by the function name).
+    """
+    caches = {
+        "add_frist": _cached_add_frist_ordinal,
+        "get_nth_working_day_of_month": (
+            _cached_nth_working_day_of_month_ordinal
+        ),
+    }
+    result = {}
+    for name, cache in caches.items():
+        info = cache.cache_info()
+        result[name] = CacheInfo(
+            hits=info.hits,
+            misses=info.misses,
+            maxsize=info.maxsize or 0,
+            currsize=info.currsize,
+        )
     return result
 
 
+def clear_caches() -> None:
+    """
+    Clears the result caches of `add_frist` and
+    `get_nth_working_day_of_month` (and their statistics).
+    """
+    _cached_add_frist_ordinal.cache_clear()
+    _cached_nth_working_day_of_month_ordinal.cache_clear()
+
+
+def add_frist(start: date, period: Period) -> date:
+    """
+    Returns the date that is period after start.
+    The results are cached by the start day, the canonical form of the period
+    (see `Period.key`) and the calendar version, see `set_cache_size`.
+    """
+    result = _cached_add_frist_ordinal(
+        get_calendar_version(),
+        start.toordinal(),
+        period.number_of_days,
+        period.day_type,
+    )
+    return _from_ordinal(start, result)
+
+
+def _solve_frist_start_ordinal(
+    deadline_ordinal: int, number_of_days: int, day_type: DayType
+) -> int:
+    """
+    Returns the largest start ordinal s for which
+    _add_frist_ordinal(s, number_of_days, day_type) <= deadline_ordinal.
+    """
+    if day_type == DayType.CALENDAR_DAY:
+        if number_of_days >= 0:
+            # the next working day after s must not be after deadline - n
+            return (
+                add_working_days_ordinal(
+                    deadline_ordinal - number_of_days + 1, -1
+                )
+                - 1
+            )
+        return deadline_ordinal - number_of_days
+    if number_of_days >= 0:
+        # there have to be n + 1 working days in (s, deadline]
+        return (
+            add_working_days_ordinal(
+                deadline_ordinal + 1, -(number_of_days + 1)
+            )
+            - 1
+        )
+    # there have to be less than abs(n) + 1 working days in (deadline, s)
+    return add_working_days_ordinal(deadline_ordinal, 1 - number_of_days)
+
+
+def solve_frist_start(deadline: date, period: Period) -> date:
+    """
+    Returns the latest start for which the period still ends at or before
+    the deadline, i.e. the inverse of `add_frist`: for the result s,
+    add_frist(s, period) <= deadline < add_frist(s + 1 day, period).
+    An inclusive end date type is already taken into account by the period.
+    """
+    result = _solve_frist_start_ordinal(
+        deadline.toordinal(), period.number_of_days, period.day_type
+    )
+    return _from_ordinal(deadline, result)
+
+
+def solve_frist_starts(
+    deadlines: Iterable[date], period: Period
+) -> list[date]:
+    """
+    Returns `solve_frist_start` for each of the deadlines (in the same
+    order), evaluated in a single pass over the working day index.
+    """
+    number_of_days = period.number_of_days
+    day_type = period.day_type
+    return [
+        _from_ordinal(
+            deadline,
+            _solve_frist_start_ordinal(
+                deadline.toordinal(), number_of_days, day_type
+            ),
+        )
+        for deadline in deadlines
+    ]
+
+
 def get_nth_working_day_of_month(
     number_of_working_day_in_month: int,
     month_type: MonthType = MonthType.LIEFERMONAT,
@@ -108,31 +398,276 @@ def get_nth_working_day_of_month(
 
     This function is useful if you're dealing with statutory periods from the
     GPKE/MaBiS that are defined as "working days since start of month".
+    The results are cached by month, see `set_cache_size`.
     """
     if start is None:
         start = GERMAN_TIME_ZONE.localize(datetime.datetime.utcnow()).date()
-    if month_type == MonthType.LIEFERMONAT:
-        # returns the "nter Werktag des Liefermonats"
-        start = get_previous_working_day(start.replace(day=1))
-        period = Period(
-            number_of_days=number_of_working_day_in_month,
-            day_type=DayType.WORKING_DAY,
-            end_date_type=EndDateType.INCLUSIVE,
-        )
-        result = add_frist(start, period)
-    elif month_type == MonthType.FRISTENMONAT:
-        # returns the "nter Werktag des Fristenmonats"
-        start_of_next_month = start.replace(day=1) + relativedelta(months=1)
-        result = get_nth_working_day_of_month(
-            number_of_working_day_in_month,
-            month_type=MonthType.LIEFERMONAT,
-            start=start_of_next_month,
+    result = _cached_nth_working_day_of_month_ordinal(
+        get_calendar_version(),
+        number_of_working_day_in_month,
+        month_type,
+        start.year,
+        start.month,
+    )
+    return _from_ordinal(start, result)
+
+
+def _working_day_number_in_month_ordinal(
+    ordinal: int, month_type: MonthType
+) -> int:
+    day = date.fromordinal(ordinal)
+    first_ordinal = _first_ordinal_of_liefermonat(
+        month_type, day.year, day.month
+    )
+    return count_working_days_ordinal(first_ordinal, ordinal + 1)
+
+
+def working_day_number_in_month(
+    day: date, month_type: MonthType = MonthType.LIEFERMONAT
+) -> int:
+    """
+    Returns the number n of the working day day in the month, i.e. the
+    inverse of `get_nth_working_day_of_month` for the same start:
+    get_nth_working_day_of_month(n, month_type, day) == day.
+    Like there, the working days are counted in the Liefermonat that the
+    month of day refers to (as a Liefermonat or Fristenmonat). Non-working
+    days get the number of the last working day before them. Days before the
+    first working day of the Liefermonat (e.g. all days of a Fristenmonat)
+    get 0 or -k, if k more working days follow before the Liefermonat.
+    """
+    return _working_day_number_in_month_ordinal(day.toordinal(), month_type)
+
+
+def _working_day_ranks(lowest: int, highest: int) -> "NDArray[numpy.int64]":
+    """
+    Returns the prefix sums of the working days from lowest to highest:
+    ranks[i] is the number of working days in [lowest, lowest + i).
+    """
+    # pylint:disable-next=import-outside-toplevel
+    import numpy as np
+
+    working = np.fromiter(
+        takewhile(
+            lambda ordinal: ordinal < highest,
+            get_working_day_index().iter_working_days(lowest),
+        ),
+        dtype=np.int64,
+    )
+    is_working = np.zeros(highest - lowest, dtype=np.int64)
+    is_working[working - lowest] = 1
+    ranks: "NDArray[numpy.int64]" = np.concatenate(
+        ([0], np.cumsum(is_working))
+    )
+    return ranks
+
+
+def _working_day_number_array(
+    days: "NDArray[numpy.datetime64]", month_type: MonthType
+) -> "NDArray[numpy.int64]":
+    # pylint:disable-next=import-outside-toplevel
+    import numpy as np
+
+    ordinals = days.astype("datetime64[D]").astype(np.int64) + (
+        _UNIX_EPOCH_ORDINAL
+    )
+    if ordinals.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    months, inverse = np.unique(
+        days.astype("datetime64[M]").astype(np.int64), return_inverse=True
+    )
+    first_ordinals = np.array(
+        [
+            _first_ordinal_of_liefermonat(
+                month_type, 1970 + month // 12, month % 12 + 1
+            )
+            for month in months.tolist()
+        ],
+        dtype=np.int64,
+    )[inverse]
+    lowest = int(min(first_ordinals.min(), ordinals.min()))
+    highest = int(max(first_ordinals.max(), ordinals.max() + 1))
+    ranks = _working_day_ranks(lowest, highest)
+    result: "NDArray[numpy.int64]" = (
+        ranks[ordinals + 1 - lowest] - ranks[first_ordinals - lowest]
+    )
+    return result
+
+
+@overload
+def working_day_numbers_in_month(
+    days: "NDArray[numpy.datetime64]",
+    month_type: MonthType = MonthType.LIEFERMONAT,
+) -> "NDArray[numpy.int64]": ...
+
+
+@overload
+def working_day_numbers_in_month(
+    days: Iterable[date], month_type: MonthType = MonthType.LIEFERMONAT
+) -> list[int]: ...
+
+
+def working_day_numbers_in_month(
+    days: "Iterable[date] | NDArray[numpy.datetime64]",
+    month_type: MonthType = MonthType.LIEFERMONAT,
+) -> "list[int] | NDArray[numpy.int64]":
+    """
+    Returns `working_day_number_in_month` for each of the days (in the same
+    order). A numpy array of datetime64 values is evaluated vectorized (from
+    a table of the working days in its range) and returns a numpy array.
+    """
+    if hasattr(days, "dtype"):
+        # a numpy array; numpy is only imported if it's used
+        return _working_day_number_array(
+            cast("NDArray[numpy.datetime64]", days), month_type
         )
-    else:
-        raise ValueError(f"Unhandled month_type {month_type}")
+    return [
+        _working_day_number_in_month_ordinal(day.toordinal(), month_type)
+        for day in days
+    ]
+
+
+def _working_day_delta_ordinal(start: int, end: int) -> int:
+    """
+    Returns the signed number of working days from start to end in the
+    counting of `add_frist`, i.e. n for end == add_frist(start, n WT).
+    """
+    if end > start:
+        return count_working_days_ordinal(start + 1, end)
+    if end < start:
+        return -count_working_days_ordinal(end + 1, start)
+    return 0
+
+
+def _working_day_delta_array(
+    starts: "NDArray[numpy.datetime64]", ends: "NDArray[numpy.datetime64]"
+) -> "NDArray[numpy.int64]":
+    # pylint:disable-next=import-outside-toplevel
+    import numpy as np
+
+    start_ordinals = starts.astype("datetime64[D]").astype(np.int64) + (
+        _UNIX_EPOCH_ORDINAL
+    )
+    end_ordinals = ends.astype("datetime64[D]").astype(np.int64) + (
+        _UNIX_EPOCH_ORDINAL
+    )
+    if start_ordinals.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    lowest = int(min(start_ordinals.min(), end_ordinals.min()))
+    highest = int(max(start_ordinals.max(), end_ordinals.max()) + 1)
+    ranks = _working_day_ranks(lowest, highest)
+    start_positions = start_ordinals - lowest
+    end_positions = end_ordinals - lowest
+    result: "NDArray[numpy.int64]" = np.where(
+        end_positions > start_positions,
+        ranks[end_positions] - ranks[start_positions + 1],
+        np.where(
+            end_positions < start_positions,
+            ranks[end_positions + 1] - ranks[start_positions],
+            0,
+        ),
+    )
     return result
 
 
+@overload
+def working_day_deltas(
+    starts: "NDArray[numpy.datetime64]", ends: "NDArray[numpy.datetime64]"
+) -> "NDArray[numpy.int64]": ...
+
+
+@overload
+def working_day_deltas(
+    starts: Sequence[date], ends: Sequence[date]
+) -> list[int]: ...
+
+
+def working_day_deltas(
+    starts: "Sequence[date] | NDArray[numpy.datetime64]",
+    ends: "Sequence[date] | NDArray[numpy.datetime64]",
+) -> "list[int] | NDArray[numpy.int64]":
+    """
+    Returns the signed number of BDEW working days from each start to the
+    end at the same position, counted like `add_frist`: for a period of n
+    working days, the delta from start to add_frist(start, period) is n.
+    It's the number of working days after start up to (excluding) end, or
+    its negation if end is before start (and 0 for equal days).
+    Numpy arrays of datetime64 values are evaluated vectorized (from the
+    prefix sums of the working days in their range) and return a numpy
+    array.
+    """
+    if len(starts) != len(ends):
+        raise ValueError("The starts and the ends must have the same length")
+    if hasattr(starts, "dtype"):
+        # numpy arrays; numpy is only imported if it's used
+        return _working_day_delta_array(
+            cast("NDArray[numpy.datetime64]", starts),
+            cast("NDArray[numpy.datetime64]", ends),
+        )
+    return [
+        _working_day_delta_ordinal(start.toordinal(), end.toordinal())
+        for start, end in zip(starts, ends)
+    ]
+
+
+class WorkingDayDeltaHistogram:
+    """
+    Counts the working day deltas (see `working_day_deltas`) of a stream of
+    (start, end) pairs per bucket, e.g. the response times of messages for
+    a report. The pairs are fed chunk by chunk; only the counts are kept, so
+    the memory is constant regardless of the length of the stream.
+    """
+
+    def __init__(self, edges: Sequence[int]) -> None:
+        """
+        The strictly ascending edges limit the buckets: bucket i counts the
+        deltas d with edges[i - 1] <= d < edges[i], the first bucket all
+        d < edges[0] and the last bucket all d >= edges[-1].
+        """
+        if not edges or any(
+            lower >= upper for lower, upper in pairwise(edges)
+        ):
+            raise ValueError(
+                f"The edges must be strictly ascending and not empty: {edges}"
+            )
+        self.edges = tuple(edges)
+        self.counts = [0] * (len(self.edges) + 1)
+
+    @property
+    def total(self) -> int:
+        """
+        the number of pairs that have been fed
+        """
+        return sum(self.counts)
+
+    def feed(
+        self,
+        starts: "Sequence[date] | NDArray[numpy.datetime64]",
+        ends: "Sequence[date] | NDArray[numpy.datetime64]",
+    ) -> None:
+        """
+        Adds the deltas of a chunk of pairs (e.g. two lists of dates or two
+        numpy arrays of datetime64 values) to the counts.
+        """
+        if hasattr(starts, "dtype"):
+            # pylint:disable-next=import-outside-toplevel
+            import numpy as np
+
+            deltas = _working_day_delta_array(
+                cast("NDArray[numpy.datetime64]", starts),
+                cast("NDArray[numpy.datetime64]", ends),
+            )
+            chunk_counts = np.bincount(
+                np.searchsorted(self.edges, deltas, side="right"),
+                minlength=len(self.counts),
+            )
+            for bucket, count in enumerate(chunk_counts.tolist()):
+                self.counts[bucket] += count
+            return
+        # starts has been narrowed to a sequence by the hasattr check above
+        for delta in working_day_deltas(starts, cast(Sequence[date], ends)):
+            self.counts[bisect_right(self.edges, delta)] += 1
+
+
 # pylint:disable=duplicate-code
 __all__ = [
     "is_bdew_working_day",
@@ -140,4 +675,17 @@ __all__ = [
     "get_previous_working_day",
     "add_frist",
     "get_nth_working_day_of_month",
+    "roll_to_working_day",
+    "roll_to_working_days",
+    "solve_frist_start",
+    "solve_frist_starts",
+    "working_day_number_in_month",
+    "working_day_numbers_in_month",
+    "working_day_deltas",
+    "WorkingDayDeltaHistogram",
+    "CacheInfo",
+    "DEFAULT_CACHE_SIZE",
+    "clear_caches",
+    "get_cache_info",
+    "set_cache_size",
 ]
@@ -0,0 +1,203 @@
+"""
+The effective day of receipt of (market communication) messages.
+
+A message that is received at or after a business cut-off time (German local
+time) or on a day that isn't a BDEW working day counts as received on the
+next working day. This effective day of receipt is the start of the periods
+that the message triggers (see `add_frist`).
+
+The local day of a UTC epoch is its UTC day or the day after it (the German
+UTC offset is positive and less than a day). So a timestamp is compared to
+(at most) the two cut-offs of these local days, whose UTC epochs are cached
+per day. Bulk timestamps are evaluated in one pass: with numpy, only the
+distinct days are looked up in Python.
+"""
+
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, cast, overload
+
+from bdew_datetimes.german_time_zone import GERMAN_TIME_ZONE
+from bdew_datetimes.models import Period
+from bdew_datetimes.ordinals import get_calendar_version, next_working_ordinal
+from bdew_datetimes.periods import (
+    DEFAULT_CACHE_SIZE,
+    _cached_add_frist_ordinal,
+)
+from bdew_datetimes.timestamps import (
+    _SECONDS_PER_DAY,
+    _UNIX_EPOCH_ORDINAL,
+    _epoch_array,
+    _epoch_of_datetime,
+    _epochs,
+    _Timestamps,
+)
+
+if TYPE_CHECKING:
+    import numpy
+    from numpy.typing import NDArray
+
+
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def _cut_off_epoch(ordinal: int, cut_off: Optional[time]) -> int:
+    """
+    Returns the UTC epoch of the cut-off on the German local day with the
+    given ordinal; no cut-off is the end of the day.
+    """
+    if cut_off is None:
+        ordinal += 1
+        cut_off = time()
+    # a cut-off in the gap or the fold of a DST switch uses the standard time
+    local_cut_off = GERMAN_TIME_ZONE.localize(
+        datetime.combine(date.fromordinal(ordinal), cut_off)
+    )
+    epoch, _ = _epoch_of_datetime(local_cut_off)
+    return epoch
+
+
+def _first_ordinal_after_cut_off(epoch: int, cut_off: Optional[time]) -> int:
+    """
+    Returns the ordinal of the first local day whose cut-off is after the
+    epoch.
+    """
+    ordinal = epoch // _SECONDS_PER_DAY + _UNIX_EPOCH_ORDINAL
+    # the cut-off of the previous day is before the UTC day starts and the
+    # one of the day after next is after it ends
+    return (
+        ordinal
+        + (epoch >= _cut_off_epoch(ordinal, cut_off))
+        + (epoch >= _cut_off_epoch(ordinal + 1, cut_off))
+    )
+
+
+def _receipt_ordinal(epoch: int, cut_off: Optional[time]) -> int:
+    return next_working_ordinal(
+        _first_ordinal_after_cut_off(epoch, cut_off) - 1
+    )
+
+
+def get_effective_receipt_day(
+    received: datetime, cut_off: Optional[time] = None
+) -> date:
+    """
+    Returns the day on which a message that has been received at the given
+    (timezone aware) datetime counts as received: its German local day, if
+    that's a BDEW working day and the message has been received before the
+    (naive, German local) cut_off time, else the next BDEW working day.
+    Without a cut_off, only the day of receipt has to be a working day.
+    """
+    epoch, _ = _epoch_of_datetime(received)
+    return date.fromordinal(_receipt_ordinal(epoch, cut_off))
+
+
+def _first_ordinal_after_cut_off_array(
+    epochs: "NDArray[numpy.int64]", cut_off: Optional[time]
+) -> "NDArray[numpy.int64]":
+    # pylint:disable-next=import-outside-toplevel
+    import numpy as np
+
+    ordinals = epochs // _SECONDS_PER_DAY + _UNIX_EPOCH_ORDINAL
+    days, inverse = np.unique(ordinals, return_inverse=True)
+    cut_offs = np.array(
+        [
+            (_cut_off_epoch(day, cut_off), _cut_off_epoch(day + 1, cut_off))
+            for day in days.tolist()
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 2)[inverse]
+    result: "NDArray[numpy.int64]" = (
+        ordinals + (epochs >= cut_offs[:, 0]) + (epochs >= cut_offs[:, 1])
+    )
+    return result
+
+
+def _receipt_deadline_arrays(
+    received: "NDArray[numpy.generic]",
+    period: Period,
+    cut_off: Optional[time],
+) -> tuple["NDArray[numpy.datetime64]", "NDArray[numpy.datetime64]"]:
+    # pylint:disable-next=import-outside-toplevel
+    import numpy as np
+
+    firsts = _first_ordinal_after_cut_off_array(
+        _epoch_array(received), cut_off
+    )
+    # the receipt days and deadlines are looked up once per distinct day
+    first_ordinals, inverse = np.unique(firsts, return_inverse=True)
+    receipt_ordinals = [
+        next_working_ordinal(first_ordinal - 1)
+        for first_ordinal in first_ordinals.tolist()
+    ]
+    version = get_calendar_version()
+    deadline_ordinals = [
+        _cached_add_frist_ordinal(
+            version, receipt_ordinal, period.number_of_days, period.day_type
+        )
+        for receipt_ordinal in receipt_ordinals
+    ]
+    receipt_days = (
+        np.array(receipt_ordinals, dtype=np.int64)[inverse]
+        - _UNIX_EPOCH_ORDINAL
+    ).astype("datetime64[D]")
+    deadlines = (
+        np.array(deadline_ordinals, dtype=np.int64)[inverse]
+        - _UNIX_EPOCH_ORDINAL
+    ).astype("datetime64[D]")
+    return receipt_days, deadlines
+
+
+@overload
+def get_receipt_deadlines(
+    received: "NDArray[numpy.generic]",
+    period: Period,
+    cut_off: Optional[time] = None,
+) -> tuple["NDArray[numpy.datetime64]", "NDArray[numpy.datetime64]"]: ...
+
+
+@overload
+def get_receipt_deadlines(
+    received: _Timestamps, period: Period, cut_off: Optional[time] = None
+) -> tuple[list[date], list[date]]: ...
+
+
+def get_receipt_deadlines(
+    received: "_Timestamps | NDArray[numpy.generic]",
+    period: Period,
+    cut_off: Optional[time] = None,
+) -> (
+    "tuple[list[date], list[date]]"
+    " | tuple[NDArray[numpy.datetime64], NDArray[numpy.datetime64]]"
+):
+    """
+    Returns the effective days of receipt (see `get_effective_receipt_day`)
+    of the messages received at the given times and the deadlines that
+    follow from them, i.e. `add_frist(receipt_day, period)`, in one pass.
+    The times are aware datetimes or UTC epochs in seconds; a numpy array of
+    epochs or (UTC) datetime64 values is evaluated vectorized and yields two
+    datetime64[D] arrays.
+    """
+    if hasattr(received, "dtype"):
+        # a numpy array; numpy is only imported if it's used
+        return _receipt_deadline_arrays(
+            cast("NDArray[numpy.generic]", received), period, cut_off
+        )
+    version = get_calendar_version()
+    receipt_days = []
+    deadlines = []
+    for epoch in _epochs(received):
+        receipt_ordinal = _receipt_ordinal(epoch, cut_off)
+        receipt_days.append(date.fromordinal(receipt_ordinal))
+        deadlines.append(
+            date.fromordinal(
+                _cached_add_frist_ordinal(
+                    version,
+                    receipt_ordinal,
+                    period.number_of_days,
+                    period.day_type,
+                )
+            )
+        )
+    return receipt_days, deadlines
+
+
+__all__ = ["get_effective_receipt_day", "get_receipt_deadlines"]
@@ -0,0 +1,219 @@
+"""
+Streaming aggregation of time series (e.g. quarter-hourly values) to German
+"Stromtage" or "Gastage" (see `german_strom_and_gas_tag`), months or
+"Gaswirtschaftsjahre".
+
+A `XtagResampler` consumes chunks of UTC timestamps and values and emits the
+aggregate of each period as soon as a timestamp after its end arrives. It only
+keeps the running aggregate of the current period, so the memory is constant
+regardless of the length of the series. Because of the daylight saving time,
+a Stromtag/Gastag has 23, 24 or 25 hours (e.g. 92, 96 or 100 quarter hours);
+every aggregate carries the actual and the expected number of slots.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import NamedTuple, Optional, Sequence
+
+from bdew_datetimes.enums import AggregationPeriod, Division
+from bdew_datetimes.german_strom_and_gas_tag import _XTAG_START_HOUR
+from bdew_datetimes.german_time_zone import GERMAN_TIME_ZONE
+
+
+class XtagAggregate(NamedTuple):
+    """
+    The aggregated values of one period.
+    """
+
+    first_xtag: date
+    """
+    the (German local) date on which the first Xtag of the period starts
+    """
+    start: datetime
+    """
+    the inclusive start of the period in UTC
+    """
+    end: datetime
+    """
+    the exclusive end of the period in UTC
+    """
+    total: float
+    """
+    the sum of the values in the period
+    """
+    slots: int
+    """
+    the number of values in the period
+    """
+    expected_slots: int
+    """
+    the number of slots of the resolution between start and end, e.g. 92, 96
+    or 100 quarter hours for a single Xtag
+    """
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        true if and only if the period has exactly the expected number of
+        slots
+        """
+        return self.slots == self.expected_slots
+
+
+def _first_xtag_of_period(xtag: date, period: AggregationPeriod) -> date:
+    if period == AggregationPeriod.MONTH:
+        return xtag.replace(day=1)
+    if period == AggregationPeriod.GASWIRTSCHAFTSJAHR:
+        # the Gaswirtschaftsjahr starts on October 1st
+        return date(xtag.year if xtag.month >= 10 else xtag.year - 1, 10, 1)
+    return xtag
+
+
+def _first_xtag_of_next_period(first: date, period: AggregationPeriod) -> date:
+    if period == AggregationPeriod.MONTH:
+        return (first.replace(day=28) + timedelta(days=4)).replace(day=1)
+    if period == AggregationPeriod.GASWIRTSCHAFTSJAHR:
+        return first.replace(year=first.year + 1)
+    return first + timedelta(days=1)
+
+
+@dataclass
+class _OpenPeriod:
+    """
+    The running aggregate of the current period (start and end in UTC
+    seconds since the epoch).
+    """
+
+    first_xtag: date
+    start: int
+    end: int
+    total: float = 0.0
+    slots: int = 0
+
+
+class XtagResampler:
+    """
+    Aggregates a stream of (UTC timestamp, value) pairs per Stromtag or
+    Gastag (or per month or Gaswirtschaftsjahr of Xtage).
+
+    The timestamps are the starts of the slots in seconds since the UNIX
+    epoch (UTC) and must be strictly ascending across all chunks. Periods
+    without any value are skipped.
+    """
+
+    def __init__(
+        self,
+        division: Division,
+        period: AggregationPeriod = AggregationPeriod.XTAG,
+        resolution: timedelta = timedelta(minutes=15),
+        strict: bool = False,
+    ) -> None:
+        """
+        resolution is the length of a slot; it has to divide an hour.
+        If strict is true, a ValueError is raised for every period whose
+        number of slots differs from the expected one.
+        """
+        if division not in _XTAG_START_HOUR:
+            raise NotImplementedError(
+                f"The division must either be 'Strom' or 'Gas': '{division}'"
+            )
+        if resolution <= timedelta(0) or timedelta(hours=1) % resolution:
+            raise ValueError(
+                f"The resolution has to divide an hour: '{resolution}'"
+            )
+        self.division = division
+        self.period = period
+        self.resolution = resolution
+        self.strict = strict
+        self._start_hour = _XTAG_START_HOUR[division]
+        self._current: Optional[_OpenPeriod] = None
+        self._last_timestamp: Optional[float] = None
+
+    def _xtag_start(self, day: date) -> int:
+        # there is no DST switch at 00:00 or 06:00, so localize is unambiguous
+        local_start = GERMAN_TIME_ZONE.localize(
+            datetime.combine(day, time(hour=self._start_hour))
+        )
+        return int(local_start.timestamp())
+
+    def _open(self, timestamp: float) -> _OpenPeriod:
+        local = datetime.fromtimestamp(timestamp, GERMAN_TIME_ZONE)
+        xtag = local.date()
+        if local.hour < self._start_hour:
+            xtag -= timedelta(days=1)
+        first_xtag = _first_xtag_of_period(xtag, self.period)
+        next_first_xtag = _first_xtag_of_next_period(first_xtag, self.period)
+        return _OpenPeriod(
+            first_xtag,
+            self._xtag_start(first_xtag),
+            self._xtag_start(next_first_xtag),
+        )
+
+    def _close(self, current: _OpenPeriod) -> XtagAggregate:
+        aggregate = XtagAggregate(
+            first_xtag=current.first_xtag,
+            start=datetime.fromtimestamp(current.start, timezone.utc),
+            end=datetime.fromtimestamp(current.end, timezone.utc),
+            total=current.total,
+            slots=current.slots,
+            expected_slots=(current.end - current.start)
+            // int(self.resolution.total_seconds()),
+        )
+        if self.strict and not aggregate.is_complete:
+            raise ValueError(
+                f"The period starting at {aggregate.start.isoformat()} has"
+                f" {aggregate.slots} instead of {aggregate.expected_slots}"
+                " slots"
+            )
+        return aggregate
+
+    def feed(
+        self, timestamps: Sequence[float], values: Sequence[float]
+    ) -> list[XtagAggregate]:
+        """
+        Adds a chunk of values (e.g. two numpy arrays or lists of equal
+        length) and returns the aggregates of the periods that have been
+        completed by this chunk, i.e. that end at or before its last
+        timestamp.
+        """
+        if len(timestamps) != len(values):
+            raise ValueError(
+                "The timestamps and the values must have the same length"
+            )
+        completed = []
+        position = 0
+        while position < len(timestamps):
+            timestamp = timestamps[position]
+            if (
+                self._last_timestamp is not None
+                and timestamp <= self._last_timestamp
+            ):
+                raise ValueError(
+                    f"The timestamps must be strictly ascending: {timestamp}"
+                )
+            current = self._current
+            if current is None or timestamp >= current.end:
+                if current is not None:
+                    completed.append(self._close(current))
+                current = self._current = self._open(timestamp)
+            # all values before the end of the period are added at once
+            end_position = bisect_left(timestamps, current.end, lo=position)
+            current.total += float(sum(values[position:end_position]))
+            current.slots += end_position - position
+            self._last_timestamp = timestamps[end_position - 1]
+            position = end_position
+        return completed
+
+    def flush(self) -> list[XtagAggregate]:
+        """
+        Returns the aggregate of the current (possibly incomplete) period at
+        the end of the stream, if any.
+        """
+        current, self._current = self._current, None
+        if current is None:
+            return []
+        return [self._close(current)]
+
+
+__all__ = ["XtagAggregate", "XtagResampler"]
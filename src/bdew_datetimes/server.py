@@ -0,0 +1,336 @@
+"""
+A lightweight HTTP/JSON service that exposes the BDEW calendar to non-Python
+systems. It is based on the standard library only and keeps one warmed
+calendar in memory for all requests.
+
+Start it with ``python -m bdew_datetimes.server --port 8080``.
+
+Every operation is available as a single request (``POST /<operation>`` with a
+JSON object) and as a batch request (``POST /<operation>/batch`` with a JSON
+array of objects). Dates are ISO 8601 strings ("2023-01-02"), datetimes are
+ISO 8601 strings with an explicit UTC offset ("2023-01-01T23:00:00+00:00").
+
+The working day operations are evaluated on the ordinal based working day
+index (see `bdew_datetimes.ordinals`), which is built for the warm-up years
+(see `bdew_datetimes.warm_up`) before the server accepts requests. A batch is
+evaluated item by item in a single loop over that index; there is no array
+based vectorization.
+"""
+
+import argparse
+import json
+import sys
+from datetime import date, datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional, Sequence
+
+from bdew_datetimes.enums import DayType, Division, EndDateType, MonthType
+from bdew_datetimes.german_strom_and_gas_tag import (
+    get_xtag_limits,
+    is_xtag_limit,
+)
+from bdew_datetimes.models import Period
+from bdew_datetimes.periods import (
+    add_frist,
+    get_nth_working_day_of_month,
+    is_bdew_working_day,
+)
+from bdew_datetimes.warm_up import warm_up, warm_up_in_background
+
+_Operation = Callable[[dict[str, Any]], Any]
+
+MAX_CONTENT_LENGTH = 4 * 1024 * 1024
+"""
+the maximum size of a request body in bytes
+"""
+MAX_BATCH_SIZE = 10_000
+"""
+the maximum number of items of a batch request
+"""
+MAX_NUMBER_OF_DAYS = 10_000
+"""
+the maximum absolute value of "number_of_days" and "number"
+"""
+
+_REQUEST_ERRORS = (
+    ArithmeticError,
+    KeyError,
+    RecursionError,
+    TypeError,
+    ValueError,
+)
+"""
+errors that are caused by invalid requests (e.g. dates out of range or deeply
+nested JSON)
+"""
+
+
+def _parse_date(value: Any) -> date:
+    if not isinstance(value, str):
+        raise ValueError(f"Expected an ISO 8601 date string: '{value}'")
+    return date.fromisoformat(value)
+
+
+def _parse_aware_datetime(value: Any) -> datetime:
+    if not isinstance(value, str):
+        raise ValueError(f"Expected an ISO 8601 datetime string: '{value}'")
+    result = datetime.fromisoformat(value)
+    if result.utcoffset() is None:
+        raise ValueError(f"The datetime has no UTC offset: '{value}'")
+    return result
+
+
+def _parse_number(value: Any) -> int:
+    # bool is a subclass of int but true isn't a number of days
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"Expected an integer: '{value}'")
+    if abs(value) > MAX_NUMBER_OF_DAYS:
+        raise ValueError(
+            f"The number must not exceed {MAX_NUMBER_OF_DAYS}: '{value}'"
+        )
+    return value
+
+
+def _parse_period(payload: dict[str, Any]) -> Period:
+    return Period(
+        _parse_number(payload["number_of_days"]),
+        DayType(payload.get("day_type", DayType.WORKING_DAY.value)),
+        end_date_type=EndDateType[
+            payload.get("end_date_type", EndDateType.EXCLUSIVE.name)
+        ],
+    )
+
+
+def _add_frist(payload: dict[str, Any]) -> str:
+    start = _parse_date(payload["start"])
+    return add_frist(start, _parse_period(payload)).isoformat()
+
+
+def _is_bdew_working_day(payload: dict[str, Any]) -> bool:
+    return is_bdew_working_day(_parse_date(payload["date"]))
+
+
+def _get_nth_working_day_of_month(payload: dict[str, Any]) -> str:
+    start = _parse_date(payload["start"])
+    month_type = MonthType[payload.get("month_type", "LIEFERMONAT")]
+    result = get_nth_working_day_of_month(
+        _parse_number(payload["number"]), month_type=month_type, start=start
+    )
+    return result.isoformat()
+
+
+def _is_xtag_limit(payload: dict[str, Any]) -> bool:
+    date_time = _parse_aware_datetime(payload["date_time"])
+    return is_xtag_limit(date_time, Division[payload["division"]])
+
+
+def _get_xtag_limits(payload: dict[str, Any]) -> dict[str, str]:
+    date_time = _parse_aware_datetime(payload["date_time"])
+    start, end = get_xtag_limits(date_time, Division[payload["division"]])
+    return {"start": start.isoformat(), "end": end.isoformat()}
+
+
+_OPERATIONS: dict[str, _Operation] = {
+    "add_frist": _add_frist,
+    "is_bdew_working_day": _is_bdew_working_day,
+    "get_nth_working_day_of_month": _get_nth_working_day_of_month,
+    "is_xtag_limit": _is_xtag_limit,
+    "get_xtag_limits": _get_xtag_limits,
+}
+"""
+maps the request path to the function that evaluates a single JSON payload
+"""
+
+
+def handle_single(operation: str, payload: Any) -> dict[str, Any]:
+    """
+    Evaluates a single JSON payload and returns the JSON response body.
+    Raises a KeyError for unknown operations and a ValueError (or
+    OverflowError) for invalid payloads.
+    """
+    evaluator = _OPERATIONS[operation]
+    if not isinstance(payload, dict):
+        raise ValueError("The request body has to be a JSON object")
+    return {"result": evaluator(payload)}
+
+
+def handle_batch(operation: str, payloads: Any) -> dict[str, Any]:
+    """
+    Evaluates all payloads of a batch request in one pass and returns the
+    JSON response body. Invalid items don't fail the whole batch; instead the
+    respective entry of "results" is null and "errors" contains the message.
+    """
+    evaluator = _OPERATIONS[operation]
+    if not isinstance(payloads, list):
+        raise ValueError("The request body has to be a JSON array")
+    if len(payloads) > MAX_BATCH_SIZE:
+        raise ValueError(
+            f"A batch must not contain more than {MAX_BATCH_SIZE} items"
+        )
+    results: list[Any] = []
+    errors: list[Optional[str]] = []
+    for payload in payloads:
+        try:
+            if not isinstance(payload, dict):
+                raise ValueError("Each batch item has to be a JSON object")
+            results.append(evaluator(payload))
+            errors.append(None)
+        except _REQUEST_ERRORS as error:
+            results.append(None)
+            errors.append(f"{type(error).__name__}: {error}")
+    return {"results": results, "errors": errors}
+
+
+class BdewRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the JSON requests; see the module docstring for the routes.
+    """
+
+    server_version = "bdew_datetimes"
+
+    def _send_json(self, status: HTTPStatus, body: Any) -> None:
+        encoded = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def do_GET(self) -> None:  # pylint:disable=invalid-name
+        """
+        Answers the health check.
+        """
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+    def do_POST(self) -> None:  # pylint:disable=invalid-name
+        """
+        Answers the single and batch requests.
+        """
+        operation, _, suffix = self.path.strip("/").partition("/")
+        if operation not in _OPERATIONS or suffix not in ("", "batch"):
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(
+                HTTPStatus.BAD_REQUEST,
+                {"error": "A valid Content-Length header is required"},
+            )
+            return
+        if length > MAX_CONTENT_LENGTH:
+            self._send_json(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                {"error": f"The body exceeds {MAX_CONTENT_LENGTH} bytes"},
+            )
+            return
+        try:
+            payload = json.loads(self.rfile.read(length))
+            if suffix == "batch":
+                body = handle_batch(operation, payload)
+            else:
+                body = handle_single(operation, payload)
+        except _REQUEST_ERRORS as error:
+            self._send_json(
+                HTTPStatus.BAD_REQUEST,
+                {"error": f"{type(error).__name__}: {error}"},
+            )
+            return
+        self._send_json(HTTPStatus.OK, body)
+
+    def log_message(  # pylint:disable=arguments-differ
+        self, format: str, *args: Any  # pylint:disable=redefined-builtin
+    ) -> None:
+        if not self.server.quiet:  # type: ignore[attr-defined]
+            super().log_message(format, *args)
+
+
+class BdewHTTPServer(ThreadingHTTPServer):
+    """
+    A threading HTTP server that answers BDEW calendar requests.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        warm_up_years: range = range(0),
+        quiet: bool = False,
+        warm_up_in_background_thread: bool = False,
+    ) -> None:
+        """
+        The calendar and the working day index are warmed up for the
+        warm_up_years (see `warm_up`) before the server binds the address or,
+        if warm_up_in_background_thread is true, in a background thread.
+        """
+        self.quiet = quiet
+        if warm_up_in_background_thread:
+            warm_up_in_background(warm_up_years)
+        else:
+            report = warm_up(warm_up_years)
+            if not quiet and warm_up_years:
+                print(
+                    f"Warmed up the years {warm_up_years.start}-"
+                    f"{warm_up_years.stop - 1} in"
+                    f" {report.total_seconds:.2f} s",
+                    file=sys.stderr,
+                )
+        super().__init__(server_address, BdewRequestHandler)
+
+
+def _parse_year_range(value: str) -> range:
+    first, _, last = value.partition("-")
+    years = range(int(first), int(last or first) + 1)
+    if not years:
+        raise argparse.ArgumentTypeError(
+            f"The first year must not be after the last year: '{value}'"
+        )
+    return years
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Runs the server until it's interrupted.
+    """
+    this_year = date.today().year
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--warm-up-years",
+        type=_parse_year_range,
+        default=range(this_year - 2, this_year + 6),
+        help="years to index before serving, e.g. '2020-2030'",
+    )
+    parser.add_argument(
+        "--warm-up-in-background",
+        action="store_true",
+        help="accept requests while the warm-up years are being indexed",
+    )
+    parser.add_argument("--quiet", action="store_true")
+    arguments = parser.parse_args(argv)
+    with BdewHTTPServer(
+        (arguments.host, arguments.port),
+        warm_up_years=arguments.warm_up_years,
+        quiet=arguments.quiet,
+        warm_up_in_background_thread=arguments.warm_up_in_background,
+    ) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+__all__ = ["BdewHTTPServer", "handle_batch", "handle_single", "main"]
+
+if __name__ == "__main__":
+    main()
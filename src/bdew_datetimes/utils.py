@@ -2,26 +2,52 @@
 helper functions
 """
 
-from datetime import date, timedelta
+from datetime import date
+from itertools import takewhile
+from typing import Iterator, Optional
 
-from bdew_datetimes.calendar import create_bdew_calendar
-
-_bdew_calendar = create_bdew_calendar()
+from bdew_datetimes.ordinals import (
+    first_ordinal_of_year,
+    get_working_day_index,
+    is_working_ordinal,
+)
 
 
 def _get_all(is_working_day: bool, year: int) -> list[date]:
     """
     Returns a list of all BDEW working days or non-working days in the given year.
     """
-    days = []
-    current_date = date(year, 1, 1)
-    end_date = date(year, 12, 31)
-    while current_date <= end_date:
-        if _bdew_calendar.is_working_day(current_date) == is_working_day:
-            days.append(current_date)
-        current_date += timedelta(days=1)
+    return [
+        date.fromordinal(ordinal)
+        for ordinal in range(
+            first_ordinal_of_year(year), first_ordinal_of_year(year + 1)
+        )
+        if is_working_ordinal(ordinal) == is_working_day
+    ]
+
 
-    return days
+def iter_bdew_working_days(
+    start: date, end: Optional[date] = None, reverse: bool = False
+) -> Iterator[date]:
+    """
+    Lazily yields all BDEW working days from start (inclusive) to end (exclusive).
+    If reverse is true, the days are yielded backwards in time, i.e. end has
+    to be before start. Without an end, the iteration only stops at the limits
+    of the date range, so the caller decides how many days to consume.
+    Weekends and holidays are skipped without being visited, so the cost is
+    proportional to the number of days consumed.
+    """
+    ordinals = get_working_day_index().iter_working_days(
+        start.toordinal(), reverse=reverse
+    )
+    if end is not None:
+        end_ordinal = end.toordinal()
+        if reverse:
+            ordinals = takewhile(lambda o: o > end_ordinal, ordinals)
+        else:
+            ordinals = takewhile(lambda o: o < end_ordinal, ordinals)
+    for ordinal in ordinals:
+        yield date.fromordinal(ordinal)
 
 
 def get_all_bdew_working_days(year: int) -> list[date]:
@@ -44,4 +70,8 @@ def get_all_bdew_non_working_days(
     return [d for d in non_working_days if d.weekday() not in (5, 6)]
 
 
-__all__ = ["get_all_bdew_working_days", "get_all_bdew_non_working_days"]
+__all__ = [
+    "get_all_bdew_working_days",
+    "get_all_bdew_non_working_days",
+    "iter_bdew_working_days",
+]
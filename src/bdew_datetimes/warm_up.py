@@ -0,0 +1,100 @@
+"""
+Eager population of the shared calendar and the tables derived from it.
+
+The holiday calendar, the working day index and the table of Strom-/Gastag
+limits are populated lazily per year, so the first lookup in a year pays for
+populating the calendar (the BDEW holidays plus the holidays of all 16
+German states) and building the tables. `warm_up` does this upfront, e.g. at
+the startup of a service, so that the lookups on the request path never
+trigger a population for the warmed up years.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from datetime import date
+from typing import Callable, NamedTuple
+
+from bdew_datetimes.ordinals import get_working_day_index
+from bdew_datetimes.timestamps import _warm_up_limit_table
+
+
+class WarmUpReport(NamedTuple):
+    """
+    The result of `warm_up`.
+    """
+
+    years: range
+    """
+    the years that have been warmed up
+    """
+    seconds: dict[str, float]
+    """
+    the time spent per stage ("calendar", "working_day_index" and
+    "xtag_limits") in seconds
+    """
+
+    @property
+    def total_seconds(self) -> float:
+        """
+        the time spent in all stages
+        """
+        return sum(self.seconds.values())
+
+
+def _populate_calendar(years: range) -> None:
+    calendar = get_working_day_index().calendar
+    for year in years:
+        # the lookup populates all holidays of the (summed) calendar
+        _ = date(year, 1, 1) in calendar
+
+
+def _build_working_day_index(years: range) -> None:
+    get_working_day_index().ensure_years(years.start, years.stop - 1)
+
+
+_STAGES: dict[str, Callable[[range], None]] = {
+    "calendar": _populate_calendar,
+    "working_day_index": _build_working_day_index,
+    "xtag_limits": _warm_up_limit_table,
+}
+"""
+the stages of the warm-up in the order of execution
+"""
+
+
+def warm_up(years: range) -> WarmUpReport:
+    """
+    Populates the shared calendar and builds the working day index and the
+    table of Strom-/Gastag limits for the given years. Returns the time
+    spent per stage. Years that are already warm cost (almost) nothing.
+    """
+    seconds = {}
+    for stage, run in _STAGES.items():
+        started = time.perf_counter()
+        if years:
+            run(years)
+        seconds[stage] = time.perf_counter() - started
+    return WarmUpReport(years=years, seconds=seconds)
+
+
+def warm_up_in_background(years: range) -> "Future[WarmUpReport]":
+    """
+    Runs `warm_up` in a (daemon) background thread and returns a future of
+    its report. Lookups meanwhile are correct but may still pay for the
+    population of the calendar.
+    """
+    future: "Future[WarmUpReport]" = Future()
+    future.set_running_or_notify_cancel()
+
+    def run() -> None:
+        try:
+            future.set_result(warm_up(years))
+        except BaseException as error:  # pylint:disable=broad-exception-caught
+            future.set_exception(error)
+
+    threading.Thread(target=run, name="bdew-warm-up", daemon=True).start()
+    return future
+
+
+__all__ = ["WarmUpReport", "warm_up", "warm_up_in_background"]
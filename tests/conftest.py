@@ -0,0 +1,6 @@
+from hypothesis import settings
+
+# building the working day index of a year on its first lookup takes longer
+# than the default deadline of hypothesis
+settings.register_profile("bdew_datetimes", deadline=None)
+settings.load_profile("bdew_datetimes")
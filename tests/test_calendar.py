@@ -1,9 +1,19 @@
+import pickle
 from datetime import date, datetime
 
 import pytest
-from holidays import DateLike
+from holidays import DateLike, HolidaySum
+from holidays.countries.germany import Germany
 
-from bdew_datetimes.calendar import BdewDefinedHolidays, create_bdew_calendar
+from bdew_datetimes.calendar import (
+    BDEW_SOURCE,
+    BdewDefinedHolidays,
+    MergedBdewCalendar,
+    _relevant_subdivisions,
+    calendar_fingerprint,
+    create_bdew_calendar,
+    get_holiday_data_version,
+)
 
 
 @pytest.mark.parametrize(
@@ -72,3 +82,76 @@ def test_holiday_calendar_obj() -> None:
 def test_holiday_in_calendar(candidate: DateLike) -> None:
     calendar = create_bdew_calendar()
     assert candidate in calendar
+
+
+def test_calendar_fingerprint() -> None:
+    fingerprint = calendar_fingerprint(create_bdew_calendar(), [2024, 2025])
+    assert fingerprint == calendar_fingerprint(
+        create_bdew_calendar(), range(2024, 2026)
+    )
+    assert fingerprint != calendar_fingerprint(create_bdew_calendar(), [2024])
+    modified_calendar = create_bdew_calendar()
+    modified_calendar[date(2025, 3, 3)] = "Sonderfeiertag"
+    assert fingerprint != calendar_fingerprint(modified_calendar, [2024, 2025])
+
+
+def test_holiday_data_version() -> None:
+    version = get_holiday_data_version()
+    assert version == get_holiday_data_version([])
+    assert version != get_holiday_data_version([(date(2025, 3, 3), "Foo")])
+
+
+def _create_holiday_sum() -> HolidaySum:
+    """
+    the former implementation of create_bdew_calendar
+    """
+    result: HolidaySum = BdewDefinedHolidays(language="de")  # type: ignore[assignment]
+    for subdivision in _relevant_subdivisions:
+        result += Germany(  # type: ignore[assignment]
+            subdiv=subdivision, observed=False, language="de"
+        )
+    return result
+
+
+def test_merged_calendar_equals_the_holiday_sum() -> None:
+    calendar = create_bdew_calendar()
+    assert isinstance(calendar, MergedBdewCalendar)
+    holiday_sum = _create_holiday_sum()
+    for year in range(1990, 2101, 3):
+        assert (date(year, 1, 1) in calendar) == (
+            date(year, 1, 1) in holiday_sum
+        )
+    assert dict(calendar.items()) == dict(holiday_sum.items())
+
+
+@pytest.mark.parametrize(
+    "day, expected_sources",
+    [
+        pytest.param(date(2024, 12, 24), (BDEW_SOURCE,), id="Heiligabend"),
+        pytest.param(date(2024, 11, 20), ("SN",), id="Buß- und Bettag"),
+        pytest.param(
+            date(2024, 10, 31),
+            ("BB", "HB", "HH", "MV", "NI", "SH", "SN", "ST", "TH"),
+            id="Reformationstag",
+        ),
+        pytest.param(date(2024, 11, 21), (), id="no holiday"),
+    ],
+)
+def test_sources_of_holidays(
+    day: date, expected_sources: tuple[str, ...]
+) -> None:
+    assert create_bdew_calendar().get_sources(day) == expected_sources
+
+
+def test_pickle_of_the_merged_calendar() -> None:
+    calendar = create_bdew_calendar()
+    calendar[date(2030, 6, 3)] = "Sonderfeiertag"
+    calendar.get_sources(date(2030, 1, 1))  # populates 2030
+    pickled = pickle.dumps(calendar)
+    # neither the sources nor the populated holidays are pickled
+    assert len(pickled) < 512
+    unpickled = pickle.loads(pickled)
+    assert isinstance(unpickled, MergedBdewCalendar)
+    assert unpickled.get(date(2030, 6, 3)) == "Sonderfeiertag"
+    assert unpickled.get_sources(date(2030, 12, 24)) == (BDEW_SOURCE,)
+    assert dict(unpickled) == dict(calendar)
@@ -0,0 +1,110 @@
+from datetime import date
+
+import pytest
+
+from bdew_datetimes import deadlines
+from bdew_datetimes.deadlines import (
+    DeadlineRule,
+    DeadlineTable,
+    get_deadline_table,
+    parse_deadline_rule,
+)
+from bdew_datetimes.enums import MonthType
+from bdew_datetimes.periods import get_nth_working_day_of_month
+
+_RULES = [
+    DeadlineRule(0),
+    DeadlineRule(1),
+    DeadlineRule(18),
+    DeadlineRule(42, MonthType.FRISTENMONAT),
+    DeadlineRule(-3, MonthType.FRISTENMONAT),
+]
+
+
+def test_table_matches_get_nth_working_day_of_month() -> None:
+    table = DeadlineTable(_RULES, 2022, 2026)
+    for year in table.years:
+        for month in range(1, 13):
+            start = date(year, month, 1)
+            expected = {
+                rule: get_nth_working_day_of_month(
+                    rule.number, month_type=rule.month_type, start=start
+                )
+                for rule in _RULES
+            }
+            assert table.get_month(year, month) == expected
+            for rule in _RULES:
+                assert table.get(rule, year, month) == expected[rule]
+
+
+def test_column() -> None:
+    rule = DeadlineRule(18)
+    table = DeadlineTable([rule], 2023, 2023)
+    column = table.column(rule)
+    assert len(column) == 12
+    assert column[10] == date(2023, 11, 28)
+
+
+@pytest.mark.parametrize(
+    "rule, year, month",
+    [
+        pytest.param(DeadlineRule(18), 2021, 12, id="year before"),
+        pytest.param(DeadlineRule(18), 2023, 13, id="invalid month"),
+        pytest.param(DeadlineRule(17), 2022, 1, id="unknown rule"),
+    ],
+)
+def test_lookup_outside_of_the_table(
+    rule: DeadlineRule, year: int, month: int
+) -> None:
+    table = DeadlineTable([DeadlineRule(18)], 2022, 2023)
+    with pytest.raises(KeyError):
+        table.get(rule, year, month)
+
+
+def test_invalid_year_range() -> None:
+    with pytest.raises(ValueError):
+        DeadlineTable(_RULES, 2023, 2022)
+
+
+def test_tables_are_cached_by_calendar_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    table = get_deadline_table(_RULES, 2030, 2031)
+    assert get_deadline_table(iter(_RULES), 2030, 2031) is table
+    # e.g. after a special day has been registered
+    monkeypatch.setattr(deadlines, "get_calendar_version", lambda: "other")
+    rebuilt = get_deadline_table(_RULES, 2030, 2031)
+    assert rebuilt is not table
+    assert rebuilt.version == "other"
+    assert get_deadline_table(_RULES, 2030, 2031) is rebuilt
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        pytest.param("18. WT", DeadlineRule(18), id="Liefermonat by default"),
+        pytest.param(
+            "Liefermonat 18.WT", DeadlineRule(18), id="explicit Liefermonat"
+        ),
+        pytest.param(
+            "Fristenmonat 5. WT",
+            DeadlineRule(5, MonthType.FRISTENMONAT),
+            id="Fristenmonat",
+        ),
+        pytest.param(
+            " fristenmonat -3. Werktag ",
+            DeadlineRule(-3, MonthType.FRISTENMONAT),
+            id="negative, lower case and whitespace",
+        ),
+    ],
+)
+def test_parse_deadline_rule(expression: str, expected: DeadlineRule) -> None:
+    assert parse_deadline_rule(expression) == expected
+
+
+@pytest.mark.parametrize(
+    "expression", ["18 WT", "Fristenmonat 5. KT", "Vormonat 5. WT", ""]
+)
+def test_parse_invalid_deadline_rule(expression: str) -> None:
+    with pytest.raises(ValueError, match="Invalid key date expression"):
+        parse_deadline_rule(expression)
@@ -0,0 +1,254 @@
+"""
+Differential tests of the optimized engines and APIs against a day by day
+reference implementation that checks every single day in the holiday
+calendar (the original semantics of `periods`).
+
+The backends are the shared index (compiled, if the tests run in the
+tests_compiled tox environment), an index loaded from a buffer, the result
+caches and the batch/table APIs. Hypothesis reports the (shrunk) first input
+for which a backend diverges.
+The number of examples per test is bounded by BDEW_DIFFERENTIAL_EXAMPLES
+(default 100), so that the harness runs locally in bounded time.
+"""
+
+import os
+from datetime import date, timedelta
+from typing import Callable
+
+import pytest
+from holidays import SAT, SUN  # type: ignore[attr-defined]
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from bdew_datetimes.calendar import create_bdew_calendar
+from bdew_datetimes.deadlines import DeadlineRule, DeadlineTable
+from bdew_datetimes.enums import DayType, EndDateType, MonthType
+from bdew_datetimes.models import Period
+from bdew_datetimes.ordinals import WorkingDayIndex, get_working_day_index
+from bdew_datetimes.periods import (
+    add_frist,
+    get_nth_working_day_of_month,
+    is_bdew_working_day,
+    set_cache_size,
+    solve_frist_start,
+    solve_frist_starts,
+)
+from bdew_datetimes.server import handle_batch
+
+_MAX_EXAMPLES = int(os.environ.get("BDEW_DIFFERENTIAL_EXAMPLES", "100"))
+
+_ONE_DAY = timedelta(days=1)
+
+_reference_calendar = create_bdew_calendar()
+
+
+def _is_working_day(candidate: date) -> bool:
+    return (
+        candidate.weekday() not in (SAT, SUN)
+        and candidate not in _reference_calendar
+    )
+
+
+def _step_to_working_day(candidate: date, step: timedelta) -> date:
+    candidate += step
+    while not _is_working_day(candidate):
+        candidate += step
+    return candidate
+
+
+def _reference_add_frist(start: date, period: Period) -> date:
+    result = start
+    if period.number_of_days >= 0:
+        result = _step_to_working_day(result, _ONE_DAY)
+    if period.day_type == DayType.CALENDAR_DAY:
+        return result + timedelta(days=period.number_of_days)
+    if period.number_of_days > 0:
+        for _ in range(period.number_of_days):
+            result = _step_to_working_day(result, _ONE_DAY)
+    elif period.number_of_days < 0:
+        for _ in range(abs(period.number_of_days) + 1):
+            result = _step_to_working_day(result, -_ONE_DAY)
+    return result
+
+
+def _reference_solve_frist_start(deadline: date, period: Period) -> date:
+    # add_frist is monotonic in the start: bisect the last start that meets
+    # the deadline
+    margin = timedelta(days=2 * abs(period.number_of_days) + 40)
+    low, high = deadline - margin, deadline + margin
+    assert _reference_add_frist(low, period) <= deadline
+    assert _reference_add_frist(high, period) > deadline
+    while (high - low).days > 1:
+        middle = low + (high - low) // 2
+        if _reference_add_frist(middle, period) <= deadline:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def _reference_nth_working_day_of_month(
+    number: int, month_type: MonthType, start: date
+) -> date:
+    first_of_month = start.replace(day=1)
+    if month_type == MonthType.FRISTENMONAT:
+        first_of_month = (first_of_month + timedelta(days=31)).replace(day=1)
+    period = Period(number, DayType.WORKING_DAY, EndDateType.INCLUSIVE)
+    return _reference_add_frist(
+        _step_to_working_day(first_of_month, -_ONE_DAY), period
+    )
+
+
+def _assert_agrees(
+    backend: str, actual: object, expected: object, arguments: object
+) -> None:
+    assert (
+        actual == expected
+    ), f"{backend} diverges for {arguments}: {actual} != {expected}"
+
+
+@pytest.fixture(scope="module")
+def buffer_index() -> WorkingDayIndex:
+    """
+    an index that has been loaded from the serialized shared index
+    """
+    index = WorkingDayIndex(create_bdew_calendar())
+    index.load_buffer(get_working_day_index().to_bytes(1985, 2110))
+    return index
+
+
+_dates = st.dates(min_value=date(1990, 1, 1), max_value=date(2100, 12, 31))
+_periods = st.builds(
+    Period,
+    st.integers(min_value=-400, max_value=400),
+    st.sampled_from(DayType),
+    st.sampled_from(EndDateType),
+)
+_differential = settings(max_examples=_MAX_EXAMPLES)
+
+
+def _with_and_without_cache(call: Callable[[], date]) -> dict[str, date]:
+    """
+    Returns the results of call with the default result cache and without
+    any cache.
+    """
+    results = {"cached": call()}
+    set_cache_size(0)
+    try:
+        results["uncached"] = call()
+    finally:
+        set_cache_size()
+    return results
+
+
+@_differential
+@given(start=_dates, period=_periods)
+def test_add_frist(start: date, period: Period) -> None:
+    expected = _reference_add_frist(start, period)
+    results = _with_and_without_cache(lambda: add_frist(start, period))
+    for variant, result in results.items():
+        _assert_agrees(
+            f"add_frist ({variant})", result, expected, (start, period)
+        )
+    batch = handle_batch(
+        "add_frist",
+        [
+            {
+                "start": start.isoformat(),
+                "number_of_days": period.number_of_days,
+                "day_type": period.day_type.value,
+            }
+        ],
+    )
+    _assert_agrees(
+        "server batch", batch["results"], [expected.isoformat()], period
+    )
+
+
+@_differential
+@given(deadline=_dates, period=_periods)
+def test_solve_frist_start(deadline: date, period: Period) -> None:
+    expected = _reference_solve_frist_start(deadline, period)
+    _assert_agrees(
+        "solve_frist_start",
+        solve_frist_start(deadline, period),
+        expected,
+        (deadline, period),
+    )
+
+
+@_differential
+@given(deadlines=st.lists(_dates, max_size=20), period=_periods)
+def test_solve_frist_starts(deadlines: list[date], period: Period) -> None:
+    _assert_agrees(
+        "solve_frist_starts",
+        solve_frist_starts(deadlines, period),
+        [_reference_solve_frist_start(day, period) for day in deadlines],
+        (deadlines, period),
+    )
+
+
+@_differential
+@given(
+    start=_dates,
+    number=st.integers(min_value=-30, max_value=60),
+    month_type=st.sampled_from(MonthType),
+)
+def test_nth_working_day_of_month(
+    start: date, number: int, month_type: MonthType
+) -> None:
+    expected = _reference_nth_working_day_of_month(number, month_type, start)
+    results = _with_and_without_cache(
+        lambda: get_nth_working_day_of_month(number, month_type, start)
+    )
+    for variant, result in results.items():
+        _assert_agrees(
+            f"get_nth_working_day_of_month ({variant})",
+            result,
+            expected,
+            (number, month_type, start),
+        )
+    rule = DeadlineRule(number, month_type)
+    table = DeadlineTable([rule], start.year, start.year)
+    _assert_agrees(
+        "DeadlineTable",
+        table.get(rule, start.year, start.month),
+        expected,
+        (rule, start),
+    )
+
+
+@_differential
+@given(start=_dates, number_of_days=st.integers(-400, 400))
+def test_working_day_index(
+    buffer_index: WorkingDayIndex, start: date, number_of_days: int
+) -> None:
+    expected = start
+    step = _ONE_DAY if number_of_days > 0 else -_ONE_DAY
+    for _ in range(abs(number_of_days)):
+        expected = _step_to_working_day(expected, step)
+    backends: dict[str, Callable[[int, int], int]] = {
+        "shared index": get_working_day_index().add_working_days,
+        "index loaded from a buffer": buffer_index.add_working_days,
+    }
+    for backend, add_working_days in backends.items():
+        _assert_agrees(
+            backend,
+            date.fromordinal(
+                add_working_days(start.toordinal(), number_of_days)
+            ),
+            expected,
+            (start, number_of_days),
+        )
+    _assert_agrees(
+        "is_bdew_working_day",
+        is_bdew_working_day(start),
+        _is_working_day(start),
+        start,
+    )
+    _assert_agrees(
+        "index loaded from a buffer",
+        buffer_index.is_working(start.toordinal()),
+        _is_working_day(start),
+        start,
+    )
@@ -1,9 +1,11 @@
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 
-from bdew_datetimes.enums import Division
+from bdew_datetimes.enums import Division, MonthType
 from bdew_datetimes.german_strom_and_gas_tag import (
+    get_month_limits,
+    get_xtag_limits,
     has_no_utc_offset,
     is_gastag_limit,
     is_stromtag_limit,
@@ -240,3 +242,124 @@ def test_is_xtag_limit(
 ) -> None:
     actual = is_xtag_limit(dt, division)
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "dt, division, expected_start, expected_end",
+    [
+        pytest.param(
+            datetime(2022, 3, 27, 12, 0, tzinfo=timezone.utc),
+            Division.STROM,
+            datetime(2022, 3, 26, 23, 0, tzinfo=timezone.utc),
+            datetime(2022, 3, 27, 22, 0, tzinfo=timezone.utc),
+            id="Stromtag with 23 hours",
+        ),
+        pytest.param(
+            datetime(2022, 10, 29, 22, 0, tzinfo=timezone.utc),
+            Division.STROM,
+            datetime(2022, 10, 29, 22, 0, tzinfo=timezone.utc),
+            datetime(2022, 10, 30, 23, 0, tzinfo=timezone.utc),
+            id="Stromtag with 25 hours, starting at the limit",
+        ),
+        pytest.param(
+            datetime(2022, 3, 27, 3, 59, tzinfo=timezone.utc),
+            Division.GAS,
+            datetime(2022, 3, 26, 5, 0, tzinfo=timezone.utc),
+            datetime(2022, 3, 27, 4, 0, tzinfo=timezone.utc),
+            id="Gastag with 23 hours, before 06:00 local time",
+        ),
+        pytest.param(
+            datetime(2022, 7, 1, 4, 0, tzinfo=timezone.utc),
+            Division.GAS,
+            datetime(2022, 7, 1, 4, 0, tzinfo=timezone.utc),
+            datetime(2022, 7, 2, 4, 0, tzinfo=timezone.utc),
+            id="Gastag in summer",
+        ),
+    ],
+)
+def test_get_xtag_limits(
+    dt: datetime,
+    division: Division,
+    expected_start: datetime,
+    expected_end: datetime,
+) -> None:
+    start, end = get_xtag_limits(dt, division)
+    assert (start, end) == (expected_start, expected_end)
+    assert is_xtag_limit(start, division) and is_xtag_limit(end, division)
+
+
+@pytest.mark.parametrize(
+    "month, division, month_type, expected_start, expected_end",
+    [
+        pytest.param(
+            date(2024, 3, 17),
+            Division.STROM,
+            MonthType.LIEFERMONAT,
+            datetime(2024, 2, 29, 23, 0, tzinfo=timezone.utc),
+            datetime(2024, 3, 31, 22, 0, tzinfo=timezone.utc),
+            id="Strom, month with the switch to DST",
+        ),
+        pytest.param(
+            date(2024, 10, 1),
+            Division.GAS,
+            MonthType.LIEFERMONAT,
+            datetime(2024, 10, 1, 4, 0, tzinfo=timezone.utc),
+            datetime(2024, 11, 1, 5, 0, tzinfo=timezone.utc),
+            id="Gas, month with the switch to standard time",
+        ),
+        pytest.param(
+            date(2023, 12, 1),
+            Division.GAS,
+            MonthType.FRISTENMONAT,
+            datetime(2024, 1, 1, 5, 0, tzinfo=timezone.utc),
+            datetime(2024, 2, 1, 5, 0, tzinfo=timezone.utc),
+            id="Fristenmonat December refers to the Liefermonat January",
+        ),
+    ],
+)
+def test_get_month_limits(
+    month: date,
+    division: Division,
+    month_type: MonthType,
+    expected_start: datetime,
+    expected_end: datetime,
+) -> None:
+    limits = get_month_limits([month], division, month_type)
+    assert limits.starts == [expected_start]
+    assert limits.ends == [expected_end]
+
+
+@pytest.mark.parametrize("division", [Division.STROM, Division.GAS])
+def test_get_month_limits_equals_xtag_limits(division: Division) -> None:
+    months = [
+        date(year, month, 1)
+        for year in range(1990, 2031)
+        for month in range(1, 13)
+    ]
+    limits = get_month_limits(months, division)
+    for month, start, end in zip(months, limits.starts, limits.ends):
+        assert (
+            start
+            == get_xtag_limits(
+                GERMAN_TIME_ZONE.localize(
+                    datetime(month.year, month.month, 1, 12)
+                ),
+                division,
+            )[0]
+        )
+        assert is_xtag_limit(end, division)
+        assert get_xtag_limits(end - timedelta(seconds=1), division)[1] == end
+        assert start.tzinfo is timezone.utc
+    assert limits.ends[:-1] == limits.starts[1:]
+
+
+def test_get_month_limits_is_cached() -> None:
+    first = get_month_limits([date(2025, 5, 1)], Division.STROM)
+    second = get_month_limits([date(2025, 5, 31)], Division.STROM)
+    assert first.starts[0] is second.starts[0]
+    assert first.ends[0] is second.ends[0]
+
+
+def test_get_month_limits_of_an_unknown_division() -> None:
+    with pytest.raises(NotImplementedError):
+        get_month_limits([date(2025, 5, 1)], "Wasser")  # type: ignore[arg-type]
@@ -0,0 +1,137 @@
+import copy
+import pickle
+from datetime import datetime, timedelta, timezone, tzinfo
+
+import pytest
+
+from bdew_datetimes.german_time_zone import (
+    GERMAN_TIME_ZONE,
+    AmbiguousTimeError,
+    NonExistentTimeError,
+)
+
+
+@pytest.mark.parametrize(
+    "local_time, fold, expected_offset, expected_name",
+    [
+        pytest.param(datetime(2024, 1, 15, 12), 0, 1, "CET"),
+        pytest.param(datetime(2024, 7, 15, 12), 0, 2, "CEST"),
+        pytest.param(datetime(2024, 3, 31, 1, 59), 0, 1, "CET"),
+        pytest.param(datetime(2024, 3, 31, 3), 0, 2, "CEST"),
+        pytest.param(
+            datetime(2024, 3, 31, 2, 30), 0, 1, "CET", id="gap, fold=0"
+        ),
+        pytest.param(
+            datetime(2024, 3, 31, 2, 30), 1, 2, "CEST", id="gap, fold=1"
+        ),
+        pytest.param(
+            datetime(2024, 10, 27, 2, 30), 0, 2, "CEST", id="overlap, fold=0"
+        ),
+        pytest.param(
+            datetime(2024, 10, 27, 2, 30), 1, 1, "CET", id="overlap, fold=1"
+        ),
+        pytest.param(datetime(1990, 9, 30, 12), 0, 1, "CET", id="1981-1995"),
+        pytest.param(datetime(1945, 6, 1, 12), 0, 3, "CEMT"),
+        pytest.param(datetime(1970, 7, 1, 12), 0, 1, "CET", id="no DST"),
+    ],
+)
+def test_utcoffset(
+    local_time: datetime, fold: int, expected_offset: int, expected_name: str
+) -> None:
+    aware = local_time.replace(tzinfo=GERMAN_TIME_ZONE, fold=fold)
+    assert aware.utcoffset() == timedelta(hours=expected_offset)
+    assert aware.tzname() == expected_name
+
+
+def test_local_mean_time() -> None:
+    aware = datetime(1890, 1, 1, tzinfo=GERMAN_TIME_ZONE)
+    assert aware.utcoffset() == timedelta(minutes=53, seconds=28)
+
+
+def test_fromutc_sets_fold_in_the_overlap() -> None:
+    first = datetime(2024, 10, 27, 0, 30, tzinfo=timezone.utc)
+    second = first + timedelta(hours=1)
+    assert first.astimezone(GERMAN_TIME_ZONE).fold == 0
+    assert second.astimezone(GERMAN_TIME_ZONE).fold == 1
+    assert (
+        first.astimezone(GERMAN_TIME_ZONE).replace(tzinfo=None)
+        == second.astimezone(GERMAN_TIME_ZONE).replace(tzinfo=None)
+        == datetime(2024, 10, 27, 2, 30)
+    )
+
+
+@pytest.mark.parametrize(
+    "local_time, is_dst, expected_offset",
+    [
+        pytest.param(datetime(2024, 10, 27, 2, 30), True, 2),
+        pytest.param(datetime(2024, 10, 27, 2, 30), False, 1),
+        pytest.param(datetime(2024, 3, 31, 2, 30), True, 2),
+        pytest.param(datetime(2024, 3, 31, 2, 30), False, 1),
+        pytest.param(datetime(2024, 3, 31, 12), None, 2),
+    ],
+)
+def test_localize(
+    local_time: datetime, is_dst: bool, expected_offset: int
+) -> None:
+    localized = GERMAN_TIME_ZONE.localize(local_time, is_dst=is_dst)
+    assert localized.replace(tzinfo=None) == local_time
+    assert localized.utcoffset() == timedelta(hours=expected_offset)
+
+
+def test_localize_raises_for_ambiguous_and_non_existent_times() -> None:
+    with pytest.raises(AmbiguousTimeError):
+        GERMAN_TIME_ZONE.localize(datetime(2024, 10, 27, 2, 30), is_dst=None)
+    with pytest.raises(NonExistentTimeError):
+        GERMAN_TIME_ZONE.localize(datetime(2024, 3, 31, 2, 30), is_dst=None)
+
+
+def test_normalize() -> None:
+    in_gap = GERMAN_TIME_ZONE.localize(datetime(2024, 3, 31, 2, 30))
+    normalized = GERMAN_TIME_ZONE.normalize(in_gap)
+    assert normalized.timestamp() == in_gap.timestamp()
+    assert normalized.replace(tzinfo=None) == datetime(2024, 3, 31, 3, 30)
+    assert normalized.utcoffset() == timedelta(hours=2)
+
+
+def test_pickle_and_copy_keep_the_singleton() -> None:
+    assert pickle.loads(pickle.dumps(GERMAN_TIME_ZONE)) is GERMAN_TIME_ZONE
+    assert copy.deepcopy(GERMAN_TIME_ZONE) is GERMAN_TIME_ZONE
+    aware = datetime(2024, 7, 1, tzinfo=GERMAN_TIME_ZONE)
+    assert pickle.loads(pickle.dumps(aware)).tzinfo is GERMAN_TIME_ZONE
+
+
+def _assert_same_local_time(instant: datetime, berlin: tzinfo) -> None:
+    expected = instant.astimezone(berlin)
+    actual = instant.astimezone(GERMAN_TIME_ZONE)
+    assert actual.replace(tzinfo=None) == expected.replace(tzinfo=None)
+    assert actual.fold == expected.fold
+    assert actual.utcoffset() == expected.utcoffset()
+    assert actual.tzname() == expected.tzname()
+    for fold in (0, 1):
+        wall_time = expected.replace(tzinfo=None, fold=fold)
+        assert (
+            wall_time.replace(tzinfo=GERMAN_TIME_ZONE).utcoffset()
+            == wall_time.replace(tzinfo=berlin).utcoffset()
+        )
+
+
+def test_matches_the_tz_database() -> None:
+    zoneinfo = pytest.importorskip("zoneinfo")
+    try:
+        berlin = zoneinfo.ZoneInfo("Europe/Berlin")
+    except zoneinfo.ZoneInfoNotFoundError:
+        pytest.skip("Europe/Berlin isn't available on this system")
+    # compare daily and every 30 minutes on the days with a transition
+    day = datetime(1890, 1, 1, tzinfo=timezone.utc)
+    while day.year < 2040:
+        next_day = day + timedelta(days=1)
+        if (
+            next_day.astimezone(berlin).utcoffset()
+            == day.astimezone(berlin).utcoffset()
+        ):
+            instants = [day]
+        else:
+            instants = [day + timedelta(minutes=30 * i) for i in range(48)]
+        for instant in instants:
+            _assert_same_local_time(instant, berlin)
+        day = next_day
@@ -0,0 +1,113 @@
+import threading
+from datetime import date
+from itertools import islice
+from pathlib import Path
+
+import pytest
+from holidays.countries.germany import Germany
+
+from bdew_datetimes.index_cache import load_index_cache
+from bdew_datetimes.ordinals import WorkingDayIndex, create_working_day_index
+
+
+def _sample_ordinals() -> list[int]:
+    return [
+        date(2022, 12, 23).toordinal(),
+        date(2023, 1, 1).toordinal(),
+        date(2024, 3, 29).toordinal(),
+        date(2025, 6, 6).toordinal(),
+    ]
+
+
+def test_first_index_builds_the_cache_and_others_map_it(
+    tmp_path: Path,
+) -> None:
+    cache_file = tmp_path / "index.bin"
+    assert load_index_cache(cache_file, 2022, 2025, create_working_day_index())
+    assert cache_file.exists()
+
+    index = create_working_day_index()
+    assert not load_index_cache(cache_file, 2023, 2024, index)
+    assert index.years == [2022, 2023, 2024, 2025]
+    reference = create_working_day_index()
+    for ordinal in _sample_ordinals():
+        assert index.is_working(ordinal) == reference.is_working(ordinal)
+        for number_of_days in (-300, -1, 1, 300):
+            assert index.add_working_days(
+                ordinal, number_of_days
+            ) == reference.add_working_days(ordinal, number_of_days)
+    start = _sample_ordinals()[0]
+    assert list(islice(index.iter_working_days(start), 5)) == list(
+        islice(reference.iter_working_days(start), 5)
+    )
+
+
+def test_cache_is_rebuilt_for_other_holiday_data(tmp_path: Path) -> None:
+    cache_file = tmp_path / "index.bin"
+    load_index_cache(cache_file, 2023, 2023, create_working_day_index())
+
+    index = create_working_day_index()
+    index.register_special_day(date(2023, 3, 15), "Sonderfeiertag")
+    assert load_index_cache(cache_file, 2023, 2023, index)
+    assert not index.is_working(date(2023, 3, 15).toordinal())
+    assert not load_index_cache(cache_file, 2023, 2023, index)
+
+
+def test_cache_is_rebuilt_if_it_does_not_cover_the_years(
+    tmp_path: Path,
+) -> None:
+    cache_file = tmp_path / "index.bin"
+    load_index_cache(cache_file, 2023, 2023, create_working_day_index())
+    assert load_index_cache(cache_file, 2023, 2024, create_working_day_index())
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b"", id="empty"),
+        pytest.param(b"foo" * 100, id="garbage"),
+    ],
+)
+def test_invalid_cache_is_rebuilt(tmp_path: Path, content: bytes) -> None:
+    cache_file = tmp_path / "index.bin"
+    cache_file.write_bytes(content)
+    index = create_working_day_index()
+    assert load_index_cache(cache_file, 2023, 2023, index)
+    assert not index.is_working(date(2023, 1, 1).toordinal())
+
+
+@pytest.mark.parametrize("size", [87, 90, 92, 500, -4, -1])
+def test_truncated_cache_is_rebuilt(tmp_path: Path, size: int) -> None:
+    content = create_working_day_index().to_bytes(2023, 2024)
+    with pytest.raises(ValueError):
+        create_working_day_index().load_buffer(content[:size])
+    cache_file = tmp_path / "index.bin"
+    cache_file.write_bytes(content[:size])
+    assert load_index_cache(cache_file, 2023, 2024, create_working_day_index())
+
+
+def test_concurrent_processes_build_the_cache_once(tmp_path: Path) -> None:
+    cache_file = tmp_path / "index.bin"
+    results: list[bool] = []
+
+    def load() -> None:
+        results.append(
+            load_index_cache(
+                cache_file, 2020, 2030, create_working_day_index()
+            )
+        )
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(results) == [False, False, False, True]
+
+
+def test_cache_of_another_calendar_is_rebuilt(tmp_path: Path) -> None:
+    cache_file = tmp_path / "index.bin"
+    load_index_cache(cache_file, 2023, 2023, create_working_day_index())
+    index = WorkingDayIndex(Germany())
+    assert load_index_cache(cache_file, 2023, 2023, index)
+    assert index.is_working(date(2023, 1, 6).toordinal())
@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import bdew_datetimes
+
+_HEAVY_MODULES = [
+    "holidays",
+    "bdew_datetimes.calendar",
+    "bdew_datetimes.ordinals",
+]
+
+
+def _imported_heavy_modules(statement: str) -> list[str]:
+    """
+    Runs the import statement in a fresh interpreter and returns the heavy
+    modules that it has imported.
+    """
+    script = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {_HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        env=environment,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    return output.split(",") if output else []
+
+
+@pytest.mark.parametrize(
+    "statement, expected_modules",
+    [
+        pytest.param("import bdew_datetimes", [], id="package"),
+        pytest.param(
+            "from bdew_datetimes import GERMAN_TIME_ZONE, Period",
+            [],
+            id="time zone and period",
+        ),
+        pytest.param(
+            "from bdew_datetimes.german_strom_and_gas_tag import"
+            " is_xtag_limit",
+            [],
+            id="Strom-/Gastag",
+        ),
+        pytest.param(
+            "from bdew_datetimes.timestamps import check_timestamps",
+            [],
+            id="timestamps",
+        ),
+        pytest.param(
+            "from bdew_datetimes import is_bdew_working_day",
+            _HEAVY_MODULES,
+            id="working days",
+        ),
+        pytest.param(
+            "from bdew_datetimes import *", _HEAVY_MODULES, id="star import"
+        ),
+    ],
+)
+def test_heavy_modules_are_imported_lazily(
+    statement: str, expected_modules: list[str]
+) -> None:
+    assert _imported_heavy_modules(statement) == expected_modules
+
+
+@pytest.mark.parametrize("name", bdew_datetimes.__all__)
+def test_all_public_names_resolve(name: str) -> None:
+    assert getattr(bdew_datetimes, name) is not None
+    assert name in dir(bdew_datetimes)
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="no_such_function"):
+        _ = bdew_datetimes.no_such_function
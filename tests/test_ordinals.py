@@ -0,0 +1,261 @@
+import pickle
+from datetime import date
+from importlib.machinery import EXTENSION_SUFFIXES
+
+import pytest
+from holidays.countries.germany import Germany
+
+from bdew_datetimes import ordinals
+from bdew_datetimes.ordinals import (
+    WorkingDayIndex,
+    add_working_days_ordinal,
+    count_working_days_ordinal,
+    create_working_day_index,
+    is_compiled,
+    is_working_ordinal,
+    next_working_ordinal,
+    previous_working_ordinal,
+    update_working_day_index,
+)
+
+
+@pytest.mark.parametrize(
+    "candidate, expected",
+    [
+        pytest.param(date(2023, 1, 1), False, id="Neujahr"),
+        pytest.param(date(2023, 1, 2), True, id="regular monday"),
+        pytest.param(date(2023, 1, 6), False, id="Hl. drei Könige"),
+        pytest.param(date(2023, 1, 7), False, id="saturday"),
+        pytest.param(date(2025, 6, 6), False, id="Sonderfeiertag 2025"),
+    ],
+)
+def test_is_working_ordinal(candidate: date, expected: bool) -> None:
+    assert is_working_ordinal(candidate.toordinal()) is expected
+
+
+def test_next_and_previous_working_ordinal() -> None:
+    ordinal = date(2022, 12, 30).toordinal()
+    assert next_working_ordinal(ordinal) == date(2023, 1, 2).toordinal()
+    assert (
+        previous_working_ordinal(date(2023, 1, 2).toordinal())
+        == date(2022, 12, 30).toordinal()
+    )
+
+
+@pytest.mark.parametrize(
+    "start, number_of_days, expected",
+    [
+        pytest.param(date(2016, 7, 4), 7, date(2016, 7, 13)),
+        pytest.param(date(2016, 7, 13), -7, date(2016, 7, 4)),
+        pytest.param(date(2023, 1, 1), 0, date(2023, 1, 1)),
+        pytest.param(
+            date(2022, 12, 23),
+            2,
+            date(2022, 12, 28),
+            id="skips Heiligabend and Weihnachten",
+        ),
+        pytest.param(
+            date(2023, 1, 2), 2500, date(2033, 3, 14), id="spans years"
+        ),
+    ],
+)
+def test_add_working_days_ordinal(
+    start: date, number_of_days: int, expected: date
+) -> None:
+    actual = add_working_days_ordinal(start.toordinal(), number_of_days)
+    assert actual == expected.toordinal()
+
+
+def test_index_builds_only_the_years_it_needs() -> None:
+    index = create_working_day_index()
+    assert index.years == []
+    assert index.is_working(date(2023, 1, 2).toordinal())
+    assert index.years == [2023]
+    assert not index.is_working(date(2200, 1, 4).toordinal())
+    assert index.years == [2023, 2200]
+    index.add_working_days(date(2023, 1, 2).toordinal(), -300)
+    assert index.years == [2021, 2022, 2023, 2200]
+
+
+@pytest.mark.parametrize(
+    "start, number_of_days",
+    [
+        pytest.param(date.max, 1, id="after date.max"),
+        pytest.param(date.min, -1, id="before date.min"),
+    ],
+)
+def test_out_of_range(start: date, number_of_days: int) -> None:
+    index = create_working_day_index()
+    with pytest.raises(OverflowError):
+        index.add_working_days(start.toordinal(), number_of_days)
+    assert index.years == [start.year]
+
+
+def test_register_special_day_updates_index_and_version() -> None:
+    index = create_working_day_index()
+    special_day = date(2023, 3, 15)
+    assert index.is_working(special_day.toordinal())
+    version_before = index.version
+    fingerprint_before = index.fingerprint(2023, 2023)
+
+    index.register_special_day(special_day, "Sonderfeiertag")
+
+    assert not index.is_working(special_day.toordinal())
+    assert (
+        index.add_working_days(date(2023, 3, 14).toordinal(), 1)
+        == date(2023, 3, 16).toordinal()
+    )
+    assert index.version != version_before
+    assert index.fingerprint(2023, 2023) != fingerprint_before
+    assert index.fingerprint(
+        2022, 2022
+    ) == create_working_day_index().fingerprint(2022, 2022)
+
+
+def test_refresh_detects_direct_calendar_changes() -> None:
+    index = create_working_day_index()
+    index.ensure_years(2023, 2024)
+    version_before = index.version
+    assert index.refresh() == []
+    assert index.version == version_before
+
+    index.calendar[date(2024, 3, 15)] = "modified directly"
+
+    assert index.refresh() == [2024]
+    assert not index.is_working(date(2024, 3, 15).toordinal())
+    assert index.version != version_before
+
+
+def test_version_is_stable_across_instances() -> None:
+    assert (
+        create_working_day_index().version
+        == create_working_day_index().version
+    )
+
+
+def test_version_depends_on_the_refreshed_content() -> None:
+    versions = []
+    for modified_day in (date(2024, 3, 15), date(2024, 3, 18)):
+        index = create_working_day_index()
+        index.ensure_years(2024, 2024)
+        index.calendar[modified_day] = "modified directly"
+        assert index.refresh() == [2024]
+        versions.append(index.version)
+    assert versions[0] != versions[1]
+
+
+def test_version_depends_on_the_calendar() -> None:
+    index = WorkingDayIndex(Germany())
+    assert index.version != create_working_day_index().version
+    assert index.is_working(date(2023, 1, 6).toordinal())
+
+
+def test_is_compiled() -> None:
+    assert is_compiled() == ordinals.__file__.endswith(
+        tuple(EXTENSION_SUFFIXES)
+    )
+
+
+def _assert_same_blocks(
+    index: WorkingDayIndex, other: WorkingDayIndex, years: range
+) -> None:
+    for ordinal in range(
+        date(years.start, 1, 1).toordinal(),
+        date(years.stop, 1, 1).toordinal(),
+    ):
+        assert index.is_working(ordinal) == other.is_working(ordinal)
+        assert index.add_working_days(ordinal, 3) == other.add_working_days(
+            ordinal, 3
+        )
+
+
+def test_pickle_contains_the_flags_only() -> None:
+    index = create_working_day_index()
+    index.ensure_years(2000, 2049)
+    pickled = pickle.dumps(index)
+    assert len(pickled) < 4096
+    unpickled = pickle.loads(pickled)
+    assert unpickled.years == index.years
+    assert unpickled.version == index.version
+    _assert_same_blocks(unpickled, index, range(2000, 2050))
+
+
+def test_pickle_keeps_special_days_and_refreshed_years() -> None:
+    index = create_working_day_index()
+    index.ensure_years(2024, 2024)
+    index.register_special_day(date(2024, 3, 15), "Sonderfeiertag")
+    index.calendar[date(2024, 3, 18)] = "modified directly"
+    index.refresh()
+
+    unpickled = pickle.loads(pickle.dumps(index))
+
+    assert unpickled.version == index.version
+    assert not unpickled.is_working(date(2024, 3, 15).toordinal())
+    assert not unpickled.is_working(date(2024, 3, 18).toordinal())
+    assert unpickled.calendar.get(date(2024, 3, 18)) == "modified directly"
+
+
+def test_unpickle_with_other_holiday_data(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pickled = pickle.dumps(create_working_day_index())
+    monkeypatch.setattr(
+        ordinals, "get_holiday_data_version", lambda _=(): "other"
+    )
+    with pytest.raises(ValueError, match="other holiday data"):
+        pickle.loads(pickled)
+
+
+def test_update() -> None:
+    warm_index = create_working_day_index()
+    warm_index.ensure_years(2023, 2025)
+    index = create_working_day_index()
+    assert index.update(pickle.loads(pickle.dumps(warm_index))) == [
+        2023,
+        2024,
+        2025,
+    ]
+    assert index.years == [2023, 2024, 2025]
+    with pytest.raises(ValueError, match="other holiday data"):
+        index.update(WorkingDayIndex(Germany()))
+
+
+def test_update_working_day_index() -> None:
+    warm_index = create_working_day_index()
+    warm_index.ensure_years(2061, 2061)
+    assert update_working_day_index(
+        pickle.loads(pickle.dumps(warm_index))
+    ) == [2061]
+    assert 2061 in ordinals.get_working_day_index().years
+
+
+def test_from_bytes() -> None:
+    index = create_working_day_index()
+    loaded = WorkingDayIndex.from_bytes(index.to_bytes(2023, 2024))
+    assert loaded.years == [2023, 2024]
+    _assert_same_blocks(loaded, index, range(2023, 2025))
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        pytest.param(date(2023, 1, 2), date(2023, 1, 2), 0, id="empty"),
+        pytest.param(date(2023, 1, 2), date(2023, 1, 9), 4, id="a week"),
+        pytest.param(date(2023, 1, 9), date(2023, 1, 2), -4, id="reversed"),
+    ],
+)
+def test_count_working_days_ordinal(
+    start: date, end: date, expected: int
+) -> None:
+    assert (
+        count_working_days_ordinal(start.toordinal(), end.toordinal())
+        == expected
+    )
+
+
+def test_count_working_days_ordinal_across_years() -> None:
+    start = date(2022, 12, 30).toordinal()
+    end = date(2025, 1, 3).toordinal()
+    expected = sum(is_working_ordinal(o) for o in range(start, end))
+    assert count_working_days_ordinal(start, end) == expected
+    assert count_working_days_ordinal(end, start) == -expected
@@ -1,14 +1,41 @@
-from datetime import date
+from datetime import date, datetime, timedelta
+from typing import Iterator
 
+import numpy as np
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
 
-from bdew_datetimes.enums import DayType, EndDateType, MonthType
-from bdew_datetimes.models import Period, _DayTyp
+from bdew_datetimes.enums import (
+    DayType,
+    EndDateType,
+    MonthType,
+    RollConvention,
+)
+from bdew_datetimes.models import (
+    Period,
+    _DayTyp,
+    parse_period,
+    parse_periods,
+)
 from bdew_datetimes.periods import (
+    DEFAULT_CACHE_SIZE,
+    WorkingDayDeltaHistogram,
     add_frist,
+    clear_caches,
+    get_cache_info,
     get_next_working_day,
     get_nth_working_day_of_month,
     get_previous_working_day,
+    is_bdew_working_day,
+    roll_to_working_day,
+    roll_to_working_days,
+    set_cache_size,
+    solve_frist_start,
+    solve_frist_starts,
+    working_day_deltas,
+    working_day_number_in_month,
+    working_day_numbers_in_month,
 )
 
 
@@ -350,3 +377,445 @@ def test_get_nth_working_day_of_month(
 ) -> None:
     actual = get_nth_working_day_of_month(number, month_type, start)
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "deadline, frist, expected",
+    [
+        pytest.param(
+            date(2016, 7, 19),
+            Period(10, DayType.WORKING_DAY),
+            date(2016, 7, 4),
+            id="README example",
+        ),
+        pytest.param(
+            date(2023, 1, 2),
+            Period(0, DayType.CALENDAR_DAY),
+            date(2023, 1, 1),
+            id="+0 KT ends at the next working day",
+        ),
+        pytest.param(
+            date(2023, 1, 1),
+            Period(-1, DayType.CALENDAR_DAY),
+            date(2023, 1, 2),
+            id="negative KT",
+        ),
+        pytest.param(
+            date(2022, 12, 30),
+            Period(-1, DayType.WORKING_DAY),
+            date(2023, 1, 3),
+            id="negative WT",
+        ),
+        pytest.param(
+            date(2016, 7, 18),
+            Period(10, DayType.WORKING_DAY, EndDateType.INCLUSIVE),
+            date(2016, 7, 4),
+            id="inclusive end",
+        ),
+    ],
+)
+def test_solve_frist_start(
+    deadline: date, frist: Period, expected: date
+) -> None:
+    assert solve_frist_start(deadline, frist) == expected
+    assert add_frist(expected, frist) <= deadline
+
+
+def test_solve_frist_start_keeps_the_time_of_datetimes() -> None:
+    deadline = datetime(2016, 7, 19, 12, 30)
+    assert solve_frist_start(
+        deadline, Period(10, DayType.WORKING_DAY)
+    ) == datetime(2016, 7, 4, 12, 30)
+
+
+_periods = st.builds(
+    Period,
+    st.integers(min_value=-60, max_value=60),
+    st.sampled_from(DayType),
+    st.sampled_from(EndDateType),
+)
+_deadlines = st.dates(min_value=date(1990, 1, 1), max_value=date(2100, 12, 31))
+
+
+@given(deadline=_deadlines, frist=_periods)
+def test_solve_frist_start_is_the_inverse_of_add_frist(
+    deadline: date, frist: Period
+) -> None:
+    start = solve_frist_start(deadline, frist)
+    assert add_frist(start, frist) <= deadline
+    assert add_frist(start + timedelta(days=1), frist) > deadline
+
+
+@given(start=_deadlines, frist=_periods)
+def test_add_frist_result_is_solved_to_a_start_not_before_start(
+    start: date, frist: Period
+) -> None:
+    # all starts between start and the solution share the same deadline
+    deadline = add_frist(start, frist)
+    solution = solve_frist_start(deadline, frist)
+    assert solution >= start
+    assert add_frist(solution, frist) == deadline
+
+
+@given(deadlines=st.lists(_deadlines, max_size=50), frist=_periods)
+def test_solve_frist_starts_matches_solve_frist_start(
+    deadlines: list[date], frist: Period
+) -> None:
+    assert solve_frist_starts(deadlines, frist) == [
+        solve_frist_start(deadline, frist) for deadline in deadlines
+    ]
+
+
+@pytest.mark.parametrize(
+    "day, convention, expected",
+    [
+        pytest.param(
+            date(2023, 4, 28),
+            RollConvention.PRECEDING,
+            date(2023, 4, 28),
+            id="a working day is never moved",
+        ),
+        pytest.param(
+            date(2023, 4, 30),
+            RollConvention.FOLLOWING,
+            date(2023, 5, 2),
+            id="following skips the 1st of May",
+        ),
+        pytest.param(
+            date(2023, 4, 30),
+            RollConvention.MODIFIED_FOLLOWING,
+            date(2023, 4, 28),
+            id="modified following stays in April",
+        ),
+        pytest.param(
+            date(2023, 4, 1),
+            RollConvention.PRECEDING,
+            date(2023, 3, 31),
+            id="preceding",
+        ),
+        pytest.param(
+            date(2023, 4, 1),
+            RollConvention.MODIFIED_PRECEDING,
+            date(2023, 4, 3),
+            id="modified preceding stays in April",
+        ),
+        pytest.param(
+            date(2023, 12, 24),
+            RollConvention.MODIFIED_FOLLOWING,
+            date(2023, 12, 27),
+            id="Heiligabend and Christmas",
+        ),
+        pytest.param(
+            date(2023, 12, 31),
+            RollConvention.MODIFIED_FOLLOWING,
+            date(2023, 12, 29),
+            id="Silvester at the end of the year",
+        ),
+    ],
+)
+def test_roll_to_working_day(
+    day: date, convention: RollConvention, expected: date
+) -> None:
+    assert roll_to_working_day(day, convention) == expected
+    assert roll_to_working_days([day, day], convention) == [expected] * 2
+
+
+def test_roll_to_working_day_keeps_the_time_of_datetimes() -> None:
+    assert roll_to_working_day(datetime(2023, 4, 30, 8, 15)) == datetime(
+        2023, 5, 2, 8, 15
+    )
+
+
+@given(day=_deadlines, convention=st.sampled_from(RollConvention))
+def test_roll_to_working_day_properties(
+    day: date, convention: RollConvention
+) -> None:
+    result = roll_to_working_day(day, convention)
+    assert is_bdew_working_day(result)
+    # all days strictly between day and the result are non-working days
+    between = [
+        day + timedelta(days=offset)
+        for offset in range(
+            min(0, (result - day).days), max(0, (result - day).days)
+        )
+    ]
+    assert not any(is_bdew_working_day(other) for other in between[1:])
+    if convention in (
+        RollConvention.MODIFIED_FOLLOWING,
+        RollConvention.MODIFIED_PRECEDING,
+    ):
+        assert (result.year, result.month) == (day.year, day.month)
+
+
+def test_roll_to_working_day_with_an_unknown_convention() -> None:
+    with pytest.raises(ValueError):
+        roll_to_working_day(
+            date(2023, 4, 30), "following"  # type: ignore[arg-type]
+        )
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        pytest.param("10WT", Period(10, "WT"), id="compact"),
+        pytest.param("-3 KT", Period(-3, "KT"), id="negative"),
+        pytest.param(
+            "1WT inkl.",
+            Period(1, "WT", EndDateType.INCLUSIVE),
+            id="inclusive",
+        ),
+        pytest.param(
+            " +5 Werktage exklusive ", Period(5, "WT"), id="long form"
+        ),
+        pytest.param("2 kalendertag", Period(2, "KT"), id="lower case"),
+    ],
+)
+def test_parse_period(expression: str, expected: Period) -> None:
+    assert parse_period(expression) == expected
+
+
+@pytest.mark.parametrize(
+    "expression", ["WT", "10", "1.5 WT", "10 WT inkl. x", "10 AT", ""]
+)
+def test_parse_invalid_period(expression: str) -> None:
+    with pytest.raises(ValueError, match="Invalid period expression"):
+        parse_period(expression)
+
+
+def test_parsed_periods_are_interned() -> None:
+    assert parse_period("3WT inkl.") is parse_period("2 WT")
+    assert parse_period("2 WT") is not parse_period("2 KT")
+
+
+def test_parse_periods() -> None:
+    assert parse_periods(["10WT", "-3 KT", "10WT"]) == [
+        Period(10, "WT"),
+        Period(-3, "KT"),
+        Period(10, "WT"),
+    ]
+    with pytest.raises(ValueError, match="Row 1: Invalid period expression"):
+        parse_periods(["10WT", "ten WT"])
+
+
+@pytest.mark.parametrize(
+    "day, month_type, expected",
+    [
+        pytest.param(
+            date(2023, 11, 28), MonthType.LIEFERMONAT, 18, id="18th WT"
+        ),
+        pytest.param(
+            date(2023, 11, 26),
+            MonthType.LIEFERMONAT,
+            16,
+            id="sunday after the 16th WT",
+        ),
+        pytest.param(
+            date(2023, 11, 1),
+            MonthType.LIEFERMONAT,
+            0,
+            id="Allerheiligen before the 1st WT",
+        ),
+        pytest.param(
+            date(2023, 9, 29),
+            MonthType.LIEFERMONAT,
+            20,
+            id="last WT of September",
+        ),
+        pytest.param(
+            date(2023, 9, 29),
+            MonthType.FRISTENMONAT,
+            0,
+            id="last WT of Fristenmonat September",
+        ),
+        pytest.param(
+            date(2023, 12, 28),
+            MonthType.FRISTENMONAT,
+            -1,
+            id="Fristenmonat December with a Liefermonat in 2024",
+        ),
+    ],
+)
+def test_working_day_number_in_month(
+    day: date, month_type: MonthType, expected: int
+) -> None:
+    assert working_day_number_in_month(day, month_type) == expected
+
+
+@given(start=_deadlines, month_type=st.sampled_from(MonthType))
+def test_working_day_number_in_month_is_the_inverse_of_nth(
+    start: date, month_type: MonthType
+) -> None:
+    day = get_next_working_day(start)
+    number = working_day_number_in_month(day, month_type)
+    if number >= 1:
+        assert get_nth_working_day_of_month(number, month_type, day) == day
+    else:
+        # the day is before the Liefermonat
+        assert get_nth_working_day_of_month(1, month_type, day) > day
+
+
+@pytest.mark.parametrize("month_type", list(MonthType))
+def test_working_day_numbers_in_month(month_type: MonthType) -> None:
+    days = [date(2023, 12, 1) + timedelta(days=i) for i in range(800)]
+    expected = [working_day_number_in_month(day, month_type) for day in days]
+    assert working_day_numbers_in_month(days, month_type) == expected
+    array = np.array(days, dtype="datetime64[D]")
+    numbers = working_day_numbers_in_month(array, month_type)
+    assert numbers.dtype == np.int64
+    assert numbers.tolist() == expected
+    shuffled = np.array(days[::-7], dtype="datetime64[s]")
+    assert working_day_numbers_in_month(shuffled, month_type).tolist() == (
+        expected[::-7]
+    )
+    assert working_day_numbers_in_month(array[:0], month_type).size == 0
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        pytest.param(date(2016, 7, 4), date(2016, 7, 19), 10, id="10 WT"),
+        pytest.param(date(2016, 7, 19), date(2016, 7, 4), -10, id="-10 WT"),
+        pytest.param(date(2016, 7, 4), date(2016, 7, 4), 0, id="same day"),
+        pytest.param(date(2016, 7, 4), date(2016, 7, 5), 0, id="next WT"),
+        pytest.param(
+            date(2023, 12, 22), date(2023, 12, 27), 0, id="over Christmas"
+        ),
+        pytest.param(
+            date(2023, 12, 27), date(2023, 12, 22), 0, id="back over Christmas"
+        ),
+    ],
+)
+def test_working_day_deltas(start: date, end: date, expected: int) -> None:
+    assert working_day_deltas([start], [end]) == [expected]
+    deltas = working_day_deltas(
+        np.array([start], dtype="datetime64[D]"),
+        np.array([end], dtype="datetime64[D]"),
+    )
+    assert deltas.dtype == np.int64
+    assert deltas.tolist() == [expected]
+
+
+@given(
+    start=_deadlines,
+    number_of_days=st.integers(min_value=-40, max_value=40),
+)
+def test_working_day_deltas_count_like_add_frist(
+    start: date, number_of_days: int
+) -> None:
+    end = add_frist(start, Period(number_of_days, DayType.WORKING_DAY))
+    assert working_day_deltas([start, end], [end, start]) == [
+        number_of_days,
+        -number_of_days,
+    ]
+
+
+def _random_pairs(number: int) -> tuple[list[date], list[date]]:
+    rng = np.random.default_rng(50)
+    first = date(2022, 12, 1).toordinal()
+    starts = rng.integers(first, first + 800, number).tolist()
+    ends = (np.array(starts) + rng.integers(-5, 60, number)).tolist()
+    return [date.fromordinal(start) for start in starts], [
+        date.fromordinal(end) for end in ends
+    ]
+
+
+def test_working_day_deltas_vectorized() -> None:
+    starts, ends = _random_pairs(5000)
+    expected = working_day_deltas(starts, ends)
+    deltas = working_day_deltas(
+        np.array(starts, dtype="datetime64[D]"),
+        np.array(ends, dtype="datetime64[s]"),
+    )
+    assert deltas.tolist() == expected
+    empty = np.zeros(0, dtype="datetime64[D]")
+    assert working_day_deltas(empty, empty).size == 0
+    with pytest.raises(ValueError):
+        working_day_deltas(starts, ends[1:])
+
+
+def test_working_day_delta_histogram() -> None:
+    starts, ends = _random_pairs(5000)
+    edges = [0, 1, 3, 10, 20]
+    expected = [0] * 6
+    for delta in working_day_deltas(starts, ends):
+        expected[sum(delta >= edge for edge in edges)] += 1
+    for as_array in (False, True):
+        histogram = WorkingDayDeltaHistogram(edges)
+        for position in range(0, 5000, 1024):
+            chunk = slice(position, position + 1024)
+            if as_array:
+                histogram.feed(
+                    np.array(starts[chunk], dtype="datetime64[D]"),
+                    np.array(ends[chunk], dtype="datetime64[D]"),
+                )
+            else:
+                histogram.feed(starts[chunk], ends[chunk])
+        assert histogram.counts == expected
+        assert histogram.total == 5000
+
+
+@pytest.mark.parametrize("edges", [[], [1, 1], [3, 2]])
+def test_working_day_delta_histogram_invalid_edges(edges: list[int]) -> None:
+    with pytest.raises(ValueError):
+        WorkingDayDeltaHistogram(edges)
+
+
+def test_period_key() -> None:
+    assert (
+        Period(3, DayType.WORKING_DAY, EndDateType.INCLUSIVE).key
+        == Period(2, "WT").key
+    )
+    assert Period(2, "WT").key != Period(2, "KT").key
+    assert {Period(2, "WT").key: 1}[(2, DayType.WORKING_DAY)] == 1
+
+
+@pytest.fixture
+def small_cache() -> Iterator[None]:
+    set_cache_size(2)
+    yield
+    set_cache_size()
+
+
+@pytest.mark.usefixtures("small_cache")
+def test_add_frist_cache() -> None:
+    period = Period(10, "WT")
+    assert add_frist(date(2016, 7, 4), period) == date(2016, 7, 19)
+    assert add_frist(date(2016, 7, 4), Period(10, "WT")) == date(2016, 7, 19)
+    # the result keeps the type (and time) of the start
+    assert add_frist(datetime(2016, 7, 4, 6), period) == datetime(
+        2016, 7, 19, 6
+    )
+    info = get_cache_info()["add_frist"]
+    assert (info.hits, info.misses, info.maxsize) == (2, 1, 2)
+    add_frist(date(2016, 7, 5), period)
+    add_frist(date(2016, 7, 6), period)
+    assert get_cache_info()["add_frist"].currsize == 2
+    clear_caches()
+    assert get_cache_info()["add_frist"].currsize == 0
+
+
+@pytest.mark.usefixtures("small_cache")
+def test_get_nth_working_day_of_month_cache() -> None:
+    for day in (1, 15, 30):
+        assert get_nth_working_day_of_month(
+            18, start=date(2023, 11, day)
+        ) == date(2023, 11, 28)
+    info = get_cache_info()["get_nth_working_day_of_month"]
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_disabled_cache() -> None:
+    set_cache_size(0)
+    try:
+        assert add_frist(date(2016, 7, 4), Period(10, "WT")) == date(
+            2016, 7, 19
+        )
+        assert get_cache_info()["add_frist"].currsize == 0
+    finally:
+        set_cache_size()
+    assert get_cache_info()["add_frist"].maxsize == DEFAULT_CACHE_SIZE
+
+
+def test_invalid_cache_size() -> None:
+    with pytest.raises(ValueError):
+        set_cache_size(-1)
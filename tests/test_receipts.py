@@ -0,0 +1,148 @@
+import random
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from bdew_datetimes import add_frist, get_next_working_day, is_bdew_working_day
+from bdew_datetimes.german_time_zone import GERMAN_TIME_ZONE
+from bdew_datetimes.models import Period
+from bdew_datetimes.receipts import (
+    get_effective_receipt_day,
+    get_receipt_deadlines,
+)
+
+
+def _expected_receipt_day(received: datetime, cut_off: Optional[time]) -> date:
+    """
+    the conversion per message
+    """
+    local = received.astimezone(GERMAN_TIME_ZONE)
+    day = local.date()
+    if (cut_off is not None and local.time() >= cut_off) or (
+        not is_bdew_working_day(day)
+    ):
+        return get_next_working_day(day)
+    return day
+
+
+def _local(*args: int) -> datetime:
+    return GERMAN_TIME_ZONE.localize(datetime(*args))  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "received, cut_off, expected",
+    [
+        pytest.param(
+            _local(2023, 11, 28, 11, 59, 59),
+            time(12),
+            date(2023, 11, 28),
+            id="before the cut-off",
+        ),
+        pytest.param(
+            _local(2023, 11, 28, 12),
+            time(12),
+            date(2023, 11, 29),
+            id="at the cut-off",
+        ),
+        pytest.param(
+            _local(2023, 11, 28, 23, 30),
+            None,
+            date(2023, 11, 28),
+            id="no cut-off",
+        ),
+        pytest.param(
+            _local(2023, 12, 1, 18),
+            time(16),
+            date(2023, 12, 4),
+            id="Friday after the cut-off",
+        ),
+        pytest.param(
+            _local(2023, 12, 2, 9),
+            time(16),
+            date(2023, 12, 4),
+            id="Saturday",
+        ),
+        pytest.param(
+            datetime(2023, 11, 27, 23, 30, tzinfo=timezone.utc),
+            time(12),
+            date(2023, 11, 28),
+            id="UTC before the German midnight",
+        ),
+        pytest.param(
+            _local(2023, 12, 23, 8),
+            time(12),
+            date(2023, 12, 27),
+            id="Christmas",
+        ),
+        pytest.param(
+            datetime(2024, 3, 31, 0, 59, tzinfo=timezone.utc),
+            time(2, 30),
+            date(2024, 4, 2),
+            id="Easter Sunday with a cut-off in the DST gap",
+        ),
+    ],
+)
+def test_get_effective_receipt_day(
+    received: datetime, cut_off: Optional[time], expected: date
+) -> None:
+    assert get_effective_receipt_day(received, cut_off) == expected
+    assert _expected_receipt_day(received, cut_off) == expected
+
+
+def test_get_effective_receipt_day_naive() -> None:
+    with pytest.raises(ValueError):
+        get_effective_receipt_day(datetime(2023, 11, 28, 12), time(12))
+
+
+def _random_timestamps(number: int) -> list[datetime]:
+    rng = random.Random(49)
+    first = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    # minutes around the cut-offs and DST switches of two years
+    return sorted(
+        first + timedelta(minutes=rng.randrange(2 * 366 * 24 * 60))
+        for _ in range(number)
+    )
+
+
+@pytest.mark.parametrize("cut_off", [None, time(0), time(2, 30), time(16)])
+@pytest.mark.parametrize(
+    "period",
+    [Period(10, "WT"), Period(-3, "WT"), Period(3, "KT"), Period(0, "WT")],
+)
+def test_get_receipt_deadlines(
+    cut_off: Optional[time], period: Period
+) -> None:
+    received = _random_timestamps(2000)
+    expected_days = [_expected_receipt_day(r, cut_off) for r in received]
+    expected_deadlines = [add_frist(day, period) for day in expected_days]
+    assert get_receipt_deadlines(received, period, cut_off) == (
+        expected_days,
+        expected_deadlines,
+    )
+    epochs = [int(r.timestamp()) for r in received]
+    assert get_receipt_deadlines(epochs, period, cut_off) == (
+        expected_days,
+        expected_deadlines,
+    )
+    array = np.array([r.replace(tzinfo=None) for r in received]).astype(
+        "datetime64[s]"
+    )
+    receipt_days, deadlines = get_receipt_deadlines(array, period, cut_off)
+    assert receipt_days.dtype == np.dtype("datetime64[D]")
+    assert receipt_days.tolist() == expected_days
+    assert deadlines.tolist() == expected_deadlines
+    receipt_days, deadlines = get_receipt_deadlines(
+        np.array(epochs, dtype=np.int64), period, cut_off
+    )
+    assert receipt_days.tolist() == expected_days
+    assert deadlines.tolist() == expected_deadlines
+
+
+def test_get_receipt_deadlines_empty() -> None:
+    assert get_receipt_deadlines([], Period(1, "WT")) == ([], [])
+    receipt_days, deadlines = get_receipt_deadlines(
+        np.zeros(0, dtype=np.int64), Period(1, "WT")
+    )
+    assert receipt_days.size == deadlines.size == 0
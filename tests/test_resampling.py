@@ -0,0 +1,130 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from bdew_datetimes.enums import AggregationPeriod, Division
+from bdew_datetimes.german_strom_and_gas_tag import get_xtag_limits
+from bdew_datetimes.resampling import XtagAggregate, XtagResampler
+
+_QUARTER_HOUR = 900
+
+
+def _quarter_hours(first: datetime, last: datetime) -> list[float]:
+    return list(
+        range(int(first.timestamp()), int(last.timestamp()), _QUARTER_HOUR)
+    )
+
+
+def _resample(
+    resampler: XtagResampler, timestamps: list[float], chunk_size: int
+) -> list[XtagAggregate]:
+    result = []
+    for offset in range(0, len(timestamps), chunk_size):
+        chunk = timestamps[offset : offset + chunk_size]
+        result.extend(resampler.feed(chunk, [1.0] * len(chunk)))
+    result.extend(resampler.flush())
+    return result
+
+
+@pytest.mark.parametrize(
+    "division, first_xtag, expected_slots",
+    [
+        pytest.param(Division.STROM, date(2024, 3, 31), 92, id="Strom, DST"),
+        pytest.param(Division.STROM, date(2024, 10, 27), 100, id="Strom"),
+        pytest.param(Division.GAS, date(2024, 3, 30), 92, id="Gas, DST"),
+        pytest.param(Division.GAS, date(2024, 10, 26), 100, id="Gas"),
+        pytest.param(Division.GAS, date(2024, 10, 28), 96, id="regular"),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, 96, 10_000])
+def test_slots_per_xtag(
+    division: Division, first_xtag: date, expected_slots: int, chunk_size: int
+) -> None:
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    timestamps = _quarter_hours(start, start + timedelta(days=250))
+    aggregates = _resample(
+        XtagResampler(division), timestamps, chunk_size=chunk_size
+    )
+    by_xtag = {aggregate.first_xtag: aggregate for aggregate in aggregates}
+    aggregate = by_xtag[first_xtag]
+    assert aggregate.slots == aggregate.expected_slots == expected_slots
+    assert aggregate.total == expected_slots
+    assert (aggregate.start, aggregate.end) == get_xtag_limits(
+        aggregate.start, division
+    )
+    # only the first and the last day of the series are incomplete
+    assert [a.is_complete for a in aggregates].count(False) == 2
+    assert sum(a.slots for a in aggregates) == len(timestamps)
+
+
+@pytest.mark.parametrize(
+    "period, first_xtag, expected_slots",
+    [
+        pytest.param(
+            AggregationPeriod.MONTH, date(2024, 10, 1), 31 * 96 + 4, id="month"
+        ),
+        pytest.param(
+            AggregationPeriod.GASWIRTSCHAFTSJAHR,
+            date(2023, 10, 1),
+            366 * 96,
+            id="Gaswirtschaftsjahr",
+        ),
+    ],
+)
+def test_longer_periods(
+    period: AggregationPeriod, first_xtag: date, expected_slots: int
+) -> None:
+    start = datetime(2023, 9, 1, tzinfo=timezone.utc)
+    timestamps = _quarter_hours(start, start + timedelta(days=800))
+    aggregates = _resample(
+        XtagResampler(Division.GAS, period=period), timestamps, 5000
+    )
+    aggregate = {a.first_xtag: a for a in aggregates}[first_xtag]
+    assert aggregate.slots == aggregate.expected_slots == expected_slots
+    assert aggregate.start == datetime(
+        first_xtag.year, first_xtag.month, 1, 4, tzinfo=timezone.utc
+    )
+
+
+def test_hourly_resolution() -> None:
+    start = datetime(2024, 3, 30, 23, tzinfo=timezone.utc)
+    end = datetime(2024, 3, 31, 22, tzinfo=timezone.utc)
+    timestamps = list(
+        range(int(start.timestamp()), int(end.timestamp()), 3600)
+    )
+    resampler = XtagResampler(Division.STROM, resolution=timedelta(hours=1))
+    assert not resampler.feed(timestamps, [2.0] * len(timestamps))
+    (aggregate,) = resampler.flush()
+    assert (aggregate.slots, aggregate.expected_slots) == (23, 23)
+    assert aggregate.total == 46.0
+    assert aggregate.end == end
+
+
+def test_strict_mode_rejects_missing_slots() -> None:
+    start = datetime(2024, 1, 1, 23, tzinfo=timezone.utc)
+    timestamps = _quarter_hours(start, start + timedelta(days=2))
+    del timestamps[10]
+    resampler = XtagResampler(Division.STROM, strict=True)
+    with pytest.raises(ValueError, match="95 instead of 96"):
+        resampler.feed(timestamps, [1.0] * len(timestamps))
+
+
+def test_timestamps_have_to_be_ascending() -> None:
+    resampler = XtagResampler(Division.STROM)
+    resampler.feed([1704150000, 1704150900], [1.0, 1.0])
+    with pytest.raises(ValueError):
+        resampler.feed([1704150900], [1.0])
+
+
+@pytest.mark.parametrize(
+    "resolution", [timedelta(minutes=7), timedelta(0), timedelta(hours=-1)]
+)
+def test_invalid_resolution(resolution: timedelta) -> None:
+    with pytest.raises(ValueError):
+        XtagResampler(Division.GAS, resolution=resolution)
+
+
+def test_chunks_of_different_length() -> None:
+    with pytest.raises(ValueError):
+        XtagResampler(Division.GAS).feed([1.0, 2.0], [1.0])
+    assert not XtagResampler(Division.GAS).flush()
@@ -0,0 +1,211 @@
+import http.client
+import json
+import threading
+from typing import Any, Iterator
+from urllib.error import HTTPError
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+
+import pytest
+
+from bdew_datetimes.server import (
+    MAX_BATCH_SIZE,
+    BdewHTTPServer,
+    handle_batch,
+    handle_single,
+    main,
+)
+
+
+@pytest.fixture(scope="module")
+def server_url() -> Iterator[str]:
+    server = BdewHTTPServer(
+        ("127.0.0.1", 0), warm_up_years=range(2022, 2024), quiet=True
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _post(url: str, body: Any) -> Any:
+    request = Request(
+        url,
+        data=json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urlopen(request) as response:
+        return json.loads(response.read())
+
+
+@pytest.mark.parametrize(
+    "operation, payload, expected",
+    [
+        pytest.param(
+            "add_frist",
+            {"start": "2016-07-04", "number_of_days": 10, "day_type": "WT"},
+            "2016-07-19",
+        ),
+        pytest.param(
+            "add_frist",
+            {
+                "start": "2016-07-04",
+                "number_of_days": 6,
+                "end_date_type": "INCLUSIVE",
+            },
+            "2016-07-12",
+        ),
+        pytest.param("is_bdew_working_day", {"date": "2023-01-01"}, False),
+        pytest.param("is_bdew_working_day", {"date": "2023-01-02"}, True),
+        pytest.param(
+            "get_nth_working_day_of_month",
+            {
+                "number": 42,
+                "month_type": "FRISTENMONAT",
+                "start": "2023-07-01",
+            },
+            "2023-09-29",
+        ),
+        pytest.param(
+            "is_xtag_limit",
+            {"date_time": "2022-03-26T23:00:00+00:00", "division": "STROM"},
+            True,
+        ),
+        pytest.param(
+            "is_xtag_limit",
+            {"date_time": "2022-03-27T04:00:00+00:00", "division": "GAS"},
+            True,
+        ),
+    ],
+)
+def test_handle_single(operation: str, payload: Any, expected: Any) -> None:
+    assert handle_single(operation, payload) == {"result": expected}
+
+
+def test_handle_single_xtag_limits() -> None:
+    actual = handle_single(
+        "get_xtag_limits",
+        {"date_time": "2022-03-27T12:00:00+00:00", "division": "STROM"},
+    )
+    assert actual == {
+        "result": {
+            "start": "2022-03-26T23:00:00+00:00",
+            "end": "2022-03-27T22:00:00+00:00",
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param(
+            {"start": "9999-12-30", "number_of_days": 5, "day_type": "KT"},
+            id="out of date range",
+        ),
+        pytest.param(
+            {"start": "2023-01-01", "number_of_days": 10**9},
+            id="number of days too large",
+        ),
+        pytest.param(
+            {"start": "2023-01-01", "number_of_days": 2.9},
+            id="float number of days",
+        ),
+        pytest.param(
+            {"start": "2023-01-01", "number_of_days": True},
+            id="boolean number of days",
+        ),
+    ],
+)
+def test_handle_batch_reports_out_of_range_items(payload: Any) -> None:
+    actual = handle_batch(
+        "add_frist", [payload, {"start": "2023-01-01", "number_of_days": 1}]
+    )
+    assert actual["results"] == [None, "2023-01-03"]
+    assert actual["errors"][0] is not None
+
+
+def test_handle_batch_rejects_too_many_items() -> None:
+    with pytest.raises(ValueError):
+        handle_batch("is_bdew_working_day", [{}] * (MAX_BATCH_SIZE + 1))
+
+
+def test_handle_batch_reports_invalid_items() -> None:
+    actual = handle_batch(
+        "is_bdew_working_day",
+        [{"date": "2023-01-02"}, {"date": "foo"}, {}, {"date": "2023-01-01"}],
+    )
+    assert actual["results"] == [True, None, None, False]
+    assert actual["errors"][0] is None
+    assert actual["errors"][1].startswith("ValueError")
+    assert actual["errors"][2].startswith("KeyError")
+
+
+def test_server_single_and_batch(server_url: str) -> None:
+    single = _post(
+        f"{server_url}/add_frist", {"start": "2023-01-01", "number_of_days": 1}
+    )
+    assert single == {"result": "2023-01-03"}
+    batch = _post(
+        f"{server_url}/is_bdew_working_day/batch",
+        [{"date": "2023-12-24"}, {"date": "2023-12-27"}],
+    )
+    assert batch == {"results": [False, True], "errors": [None, None]}
+
+
+@pytest.mark.parametrize(
+    "path, body, expected_status",
+    [
+        pytest.param("/foo", {}, 404, id="unknown operation"),
+        pytest.param("/add_frist/foo", {}, 404, id="unknown suffix"),
+        pytest.param(
+            "/add_frist", {"start": "2023-01-01"}, 400, id="missing key"
+        ),
+        pytest.param("/add_frist/batch", {}, 400, id="batch without array"),
+        pytest.param(
+            "/add_frist",
+            {"start": "9999-12-30", "number_of_days": 5, "day_type": "KT"},
+            400,
+            id="out of date range",
+        ),
+    ],
+)
+def test_server_errors(
+    server_url: str, path: str, body: Any, expected_status: int
+) -> None:
+    with pytest.raises(HTTPError) as error_info:
+        _post(f"{server_url}{path}", body)
+    assert error_info.value.code == expected_status
+    assert "error" in json.loads(error_info.value.read())
+
+
+@pytest.mark.parametrize(
+    "content_length, expected_status",
+    [
+        pytest.param("-1", 400, id="negative"),
+        pytest.param("foo", 400, id="not a number"),
+        pytest.param(str(10**9), 413, id="too large"),
+    ],
+)
+def test_server_rejects_invalid_content_length(
+    server_url: str, content_length: str, expected_status: int
+) -> None:
+    connection = http.client.HTTPConnection(urlparse(server_url).netloc)
+    connection.putrequest("POST", "/is_bdew_working_day")
+    connection.putheader("Content-Length", content_length)
+    connection.endheaders()
+    response = connection.getresponse()
+    assert response.status == expected_status
+    connection.close()
+
+
+def test_server_rejects_deeply_nested_json(server_url: str) -> None:
+    request = Request(f"{server_url}/is_bdew_working_day", data=b"[" * 100_000)
+    with pytest.raises(HTTPError) as error_info:
+        urlopen(request)  # pylint:disable=consider-using-with
+    assert error_info.value.code == 400
+
+
+def test_main_rejects_inverted_year_range() -> None:
+    with pytest.raises(SystemExit):
+        main(["--warm-up-years", "2030-2020"])
@@ -0,0 +1,328 @@
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Union
+
+import numpy as np
+import pytest
+
+from bdew_datetimes import timestamps
+from bdew_datetimes.enums import Division, IntervalViolation, TimestampCheck
+from bdew_datetimes.german_strom_and_gas_tag import (
+    get_xtag_limits,
+    has_no_utc_offset,
+    is_gastag_limit,
+    is_stromtag_limit,
+    is_xtag_limit,
+)
+from bdew_datetimes.german_time_zone import GERMAN_TIME_ZONE
+from bdew_datetimes.timestamps import (
+    check_intervals,
+    check_timestamp,
+    check_timestamps,
+    check_timestamps_buffer,
+    is_xtag_limit_iso,
+)
+
+
+def _expected(date_time: datetime) -> TimestampCheck:
+    result = TimestampCheck(0)
+    if has_no_utc_offset(date_time):
+        result |= TimestampCheck.NO_UTC_OFFSET
+    if is_stromtag_limit(date_time):
+        result |= TimestampCheck.STROMTAG_LIMIT
+    if is_gastag_limit(date_time):
+        result |= TimestampCheck.GASTAG_LIMIT
+    return result
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        pytest.param(
+            "2022-03-26T23:00:00+00:00",
+            TimestampCheck.STROMTAG_LIMIT,
+            id="Stromtag before DST",
+        ),
+        pytest.param(
+            "2022-03-27T22:00:00Z",
+            TimestampCheck.STROMTAG_LIMIT,
+            id="Stromtag after DST",
+        ),
+        pytest.param(
+            "2022-03-27T04:00:00+00:00",
+            TimestampCheck.GASTAG_LIMIT,
+            id="Gastag after DST",
+        ),
+        pytest.param(
+            "2022-03-27T06:00:00+02:00",
+            TimestampCheck.GASTAG_LIMIT,
+            id="Gastag in local time",
+        ),
+        pytest.param(
+            "2023-01-01T00:00:00+00:00",
+            TimestampCheck.NO_UTC_OFFSET,
+            id="midnight UTC",
+        ),
+        pytest.param(
+            "2023-01-01T00:00:00.500+00:00",
+            TimestampCheck.NO_UTC_OFFSET,
+            id="fractions of a second are ignored",
+        ),
+        pytest.param("2023-01-01T01:00:00+01:00", TimestampCheck(0)),
+        pytest.param(
+            datetime(2022, 10, 30, 0, tzinfo=timezone.utc),
+            TimestampCheck.NO_UTC_OFFSET,
+            id="datetime",
+        ),
+    ],
+)
+def test_check_timestamp(
+    value: Union[datetime, str], expected: TimestampCheck
+) -> None:
+    assert check_timestamp(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param("2023-01-01T00:00:00", id="no offset"),
+        pytest.param("2023-02-29T00:00:00+00:00", id="no leap year"),
+        pytest.param("2023-01-01T24:00:00+00:00", id="invalid hour"),
+        pytest.param("2023-01-01T00:00:00+24:00", id="invalid offset"),
+        pytest.param("foo", id="no datetime"),
+        pytest.param(datetime(2023, 1, 1), id="naive datetime"),
+    ],
+)
+def test_check_timestamp_rejects_invalid_values(
+    value: Union[datetime, str],
+) -> None:
+    with pytest.raises(ValueError):
+        check_timestamp(value)
+
+
+@pytest.mark.parametrize("time_zone", [timezone.utc, GERMAN_TIME_ZONE])
+def test_check_timestamps_matches_the_single_value_functions(
+    time_zone: tzinfo,
+) -> None:
+    start = datetime(2021, 12, 31, 12, tzinfo=timezone.utc)
+    values = [
+        (start + timedelta(minutes=30 * i)).astimezone(time_zone)
+        for i in range(2 * 24 * 800)
+    ]
+    expected = bytearray(_expected(value) for value in values)
+    assert check_timestamps(values) == expected
+    assert check_timestamps(value.isoformat() for value in values) == expected
+
+
+@pytest.mark.parametrize(
+    "value, division, expected",
+    [
+        pytest.param("2024-03-30T23:00:00+00:00", Division.STROM, True),
+        pytest.param("2024-03-30T23:00:00+00:00", Division.GAS, False),
+        pytest.param("2024-03-31T22:00:00Z", Division.STROM, True),
+        pytest.param("2024-03-31T04:00:00Z", Division.GAS, True),
+        pytest.param("2024-03-31T06:00:00+02:00", Division.GAS, True),
+        pytest.param("2024-03-31T06:00+02:00", Division.GAS, True),
+        pytest.param(b"2024-10-27T05:00:00+00:00", Division.GAS, True),
+        pytest.param(b"2024-10-27T04:00:00+00:00", Division.GAS, False),
+    ],
+)
+def test_is_xtag_limit_iso(
+    value: Union[str, bytes], division: Division, expected: bool
+) -> None:
+    assert is_xtag_limit_iso(value, division) is expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param("2024-03-30T23:00:00", id="no offset"),
+        pytest.param("2023-02-29T23:00:00+00:00", id="no leap year"),
+        pytest.param("2024-03-30T23:60:00+00:00", id="invalid minute"),
+        pytest.param("2024-03-30T23:00:00+00:60", id="invalid offset"),
+        pytest.param("٢٠٢٤-03-30T23:00:00+00:00", id="non ascii digits"),
+    ],
+)
+def test_is_xtag_limit_iso_rejects_invalid_strings(value: str) -> None:
+    with pytest.raises(ValueError):
+        is_xtag_limit_iso(value, Division.STROM)
+
+
+@pytest.mark.parametrize(
+    "time_zone, timespec, suffix",
+    [
+        pytest.param(timezone.utc, "seconds", "", id="UTC"),
+        pytest.param(timezone.utc, "seconds", "Z", id="Zulu"),
+        pytest.param(GERMAN_TIME_ZONE, "seconds", "", id="local"),
+        pytest.param(GERMAN_TIME_ZONE, "minutes", "", id="no seconds"),
+    ],
+)
+def test_check_timestamps_buffer(
+    time_zone: tzinfo, timespec: str, suffix: str
+) -> None:
+    start = datetime(2021, 12, 31, 12, tzinfo=timezone.utc)
+    values = [
+        (start + timedelta(hours=i)).astimezone(time_zone)
+        for i in range(24 * 800)
+    ]
+    expected = check_timestamps(values)
+    lines = [value.isoformat(timespec=timespec) for value in values]
+    if suffix:
+        lines = [line.replace("+00:00", suffix) for line in lines]
+    buffer = "\n".join(lines).encode()
+    assert check_timestamps_buffer(buffer) == expected
+    assert check_timestamps_buffer(buffer + b"\n") == expected
+
+
+def test_check_timestamps_buffer_with_mixed_formats() -> None:
+    buffer = b"2024-03-30T23:00:00+00:00\r\n2024-03-31T04:00:00Z\n"
+    assert check_timestamps_buffer(buffer) == bytearray(
+        [TimestampCheck.STROMTAG_LIMIT, TimestampCheck.GASTAG_LIMIT]
+    )
+    assert check_timestamps_buffer(b"") == bytearray()
+
+
+def test_check_timestamps_buffer_reports_the_invalid_line() -> None:
+    buffer = b"2024-03-30T23:00:00+00:00\n2024-13-30T23:00:00+00:00\n"
+    with pytest.raises(ValueError, match="Line 2"):
+        check_timestamps_buffer(buffer)
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure Python"])
+def with_numpy(request: pytest.FixtureRequest) -> bool:
+    """
+    runs the test once vectorized and once without numpy
+    """
+    use_numpy: bool = request.param
+    patch = pytest.MonkeyPatch()
+    patch.setattr(timestamps, "_HAS_NUMPY", use_numpy)
+    request.addfinalizer(patch.undo)
+    return use_numpy
+
+
+def _xtage(division: Division, first: datetime, days: int) -> list[datetime]:
+    """
+    Returns the limits of consecutive Xtage, starting with the one of first.
+    """
+    limits = [get_xtag_limits(first, division)[0]]
+    for _ in range(days):
+        limits.append(get_xtag_limits(limits[-1], division)[1])
+    return limits
+
+
+def _reference_violations(
+    starts: list[datetime], ends: list[datetime], division: Division
+) -> list[IntervalViolation]:
+    result = []
+    for position, (start, end) in enumerate(zip(starts, ends)):
+        violations = IntervalViolation(0)
+        if not is_xtag_limit(start, division):
+            violations |= IntervalViolation.START_NOT_ALIGNED
+        if not is_xtag_limit(end, division):
+            violations |= IntervalViolation.END_NOT_ALIGNED
+            if (
+                is_xtag_limit(start, division)
+                and end > start
+                and (end - start) % timedelta(days=1) == timedelta(0)
+            ):
+                violations |= IntervalViolation.WRONG_DAY_LENGTH
+        if position and start > ends[position - 1]:
+            violations |= IntervalViolation.GAP
+        if position and start < ends[position - 1]:
+            violations |= IntervalViolation.OVERLAP
+        if end <= start:
+            violations |= IntervalViolation.EMPTY
+        result.append(violations)
+    return result
+
+
+@pytest.mark.parametrize("division", [Division.STROM, Division.GAS])
+def test_check_intervals_of_consecutive_xtage(
+    with_numpy: bool, division: Division
+) -> None:
+    limits = _xtage(
+        division, datetime(2023, 12, 31, 12, tzinfo=timezone.utc), 800
+    )
+    assert check_intervals(limits[:-1], limits[1:], division) == bytearray(800)
+
+
+def test_check_intervals_with_violations(with_numpy: bool) -> None:
+    # 2024-03-31 (the switch to daylight saving time) has 23 hours
+    limits = _xtage(
+        Division.STROM, datetime(2024, 3, 29, 12, tzinfo=timezone.utc), 4
+    )
+    starts = [
+        limits[0],
+        limits[2],  # gap
+        limits[2],  # overlap
+        limits[3],
+        limits[3],
+        limits[3] + timedelta(hours=1),
+    ]
+    ends = [
+        limits[1],
+        limits[3],
+        limits[3],
+        limits[3],  # empty
+        limits[3] + timedelta(hours=1),
+        limits[4],
+    ]
+    naive_start = limits[2]
+    starts.append(naive_start)
+    ends.append(naive_start + timedelta(days=1))
+    violations = check_intervals(starts, ends, Division.STROM)
+    assert list(violations) == [
+        0,
+        IntervalViolation.GAP,
+        IntervalViolation.OVERLAP,
+        IntervalViolation.EMPTY,
+        IntervalViolation.END_NOT_ALIGNED,
+        IntervalViolation.START_NOT_ALIGNED,
+        IntervalViolation.OVERLAP
+        | IntervalViolation.END_NOT_ALIGNED
+        | IntervalViolation.WRONG_DAY_LENGTH,
+    ]
+    assert list(violations) == _reference_violations(
+        starts, ends, Division.STROM
+    )
+
+
+def test_check_intervals_matches_the_boundary_predicates(
+    with_numpy: bool,
+) -> None:
+    start = datetime(2022, 10, 1, 12, tzinfo=timezone.utc)
+    boundaries = [start + timedelta(hours=i * 7) for i in range(400)]
+    for division in (Division.STROM, Division.GAS):
+        starts, ends = boundaries[:-1], boundaries[1:]
+        assert list(
+            check_intervals(starts, ends, division)
+        ) == _reference_violations(starts, ends, division)
+
+
+def test_check_intervals_of_epochs_and_numpy_arrays(with_numpy: bool) -> None:
+    limits = _xtage(
+        Division.GAS, datetime(2024, 10, 25, 12, tzinfo=timezone.utc), 5
+    )
+    limits[3] += timedelta(hours=1)
+    expected = check_intervals(limits[:-1], limits[1:], Division.GAS)
+    assert expected != bytearray(5)
+    epochs = [int(limit.timestamp()) for limit in limits]
+    assert check_intervals(epochs[:-1], epochs[1:], Division.GAS) == expected
+    if with_numpy:
+        array = np.array(epochs, dtype=np.int64)
+        assert check_intervals(array[:-1], array[1:], Division.GAS) == expected
+        datetimes = array.astype("datetime64[s]").astype("datetime64[ms]")
+        assert (
+            check_intervals(datetimes[:-1], datetimes[1:], Division.GAS)
+            == expected
+        )
+
+
+def test_check_intervals_rejects_invalid_input(with_numpy: bool) -> None:
+    start = datetime(2024, 1, 1, tzinfo=GERMAN_TIME_ZONE)
+    assert check_intervals([], [], Division.STROM) == bytearray()
+    with pytest.raises(ValueError, match="same length"):
+        check_intervals([start], [], Division.STROM)
+    with pytest.raises(TypeError):
+        check_intervals(["2024-01-01"], [start], Division.STROM)  # type: ignore[arg-type]
+    with pytest.raises(NotImplementedError):
+        check_intervals([start], [start], "Wasser")  # type: ignore[arg-type]
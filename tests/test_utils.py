@@ -1,9 +1,13 @@
+from datetime import date
+from itertools import islice
+
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
 from bdew_datetimes import (
     get_all_bdew_non_working_days,
     get_all_bdew_working_days,
+    iter_bdew_working_days,
 )
 
 
@@ -31,3 +35,64 @@ def test_get_non_working_days_2026_including_weekends(
 def test_get_working_days(snapshot: SnapshotAssertion) -> None:
     non_working_days = get_all_bdew_working_days(2026)
     snapshot.assert_match(non_working_days)
+
+
+@pytest.mark.parametrize(
+    "start, end, reverse, expected",
+    [
+        pytest.param(
+            date(2022, 12, 22),
+            date(2023, 1, 4),
+            False,
+            [
+                date(2022, 12, 22),
+                date(2022, 12, 23),
+                date(2022, 12, 27),
+                date(2022, 12, 28),
+                date(2022, 12, 29),
+                date(2022, 12, 30),
+                date(2023, 1, 2),
+                date(2023, 1, 3),
+            ],
+            id="end is exclusive",
+        ),
+        pytest.param(
+            date(2023, 1, 3),
+            date(2022, 12, 27),
+            True,
+            [
+                date(2023, 1, 3),
+                date(2023, 1, 2),
+                date(2022, 12, 30),
+                date(2022, 12, 29),
+                date(2022, 12, 28),
+            ],
+            id="reverse",
+        ),
+        pytest.param(
+            date(2023, 1, 1), date(2023, 1, 1), False, [], id="empty span"
+        ),
+    ],
+)
+def test_iter_bdew_working_days(
+    start: date, end: date, reverse: bool, expected: list[date]
+) -> None:
+    assert (
+        list(iter_bdew_working_days(start, end, reverse=reverse)) == expected
+    )
+
+
+def test_iter_bdew_working_days_without_end() -> None:
+    first_three = list(islice(iter_bdew_working_days(date(2023, 1, 1)), 3))
+    assert first_three == [
+        date(2023, 1, 2),
+        date(2023, 1, 3),
+        date(2023, 1, 4),
+    ]
+    days = iter_bdew_working_days(date(2024, 1, 1), reverse=True)
+    assert next(days) == date(2023, 12, 29)
+
+
+def test_iter_bdew_working_days_matches_yearly_list() -> None:
+    actual = list(iter_bdew_working_days(date(2026, 1, 1), date(2027, 1, 1)))
+    assert actual == get_all_bdew_working_days(2026)
@@ -0,0 +1,55 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from bdew_datetimes.enums import Division
+from bdew_datetimes.german_strom_and_gas_tag import is_xtag_limit
+from bdew_datetimes.models import Period
+from bdew_datetimes.ordinals import get_working_day_index
+from bdew_datetimes.periods import (
+    add_frist,
+    clear_caches,
+    get_nth_working_day_of_month,
+    is_bdew_working_day,
+)
+from bdew_datetimes.timestamps import check_timestamp
+from bdew_datetimes.warm_up import warm_up, warm_up_in_background
+
+
+def test_warm_up_reports_the_stages() -> None:
+    report = warm_up(range(2041, 2043))
+    assert report.years == range(2041, 2043)
+    assert list(report.seconds) == [
+        "calendar",
+        "working_day_index",
+        "xtag_limits",
+    ]
+    assert report.total_seconds == sum(report.seconds.values())
+    assert {2041, 2042} <= set(get_working_day_index().years)
+
+
+def test_no_population_after_warm_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    warm_up(range(2043, 2045))
+    clear_caches()
+
+    def _fail(*_: object) -> None:
+        raise AssertionError("The calendar has been populated")
+
+    monkeypatch.setattr(get_working_day_index().calendar, "_populate", _fail)
+    assert not is_bdew_working_day(date(2043, 12, 24))
+    assert add_frist(date(2043, 6, 1), Period(10, "WT")) == date(2043, 6, 16)
+    assert get_nth_working_day_of_month(5, start=date(2044, 3, 1))
+    assert check_timestamp("2044-10-29T22:00:00Z")
+    assert is_xtag_limit(
+        datetime(2044, 10, 30, 5, tzinfo=timezone.utc), Division.GAS
+    )
+
+
+def test_warm_up_of_no_years() -> None:
+    assert warm_up(range(0)).years == range(0)
+
+
+def test_warm_up_in_background() -> None:
+    report = warm_up_in_background(range(2045, 2046)).result(timeout=60)
+    assert report.years == range(2045, 2046)
+    assert 2045 in get_working_day_index().years